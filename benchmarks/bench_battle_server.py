@@ -0,0 +1,199 @@
+"""Battle server load test -- thousands of concurrent headless battles.
+
+Opens --connections client connections to a BattleServer and plays
+--sessions battles at once, spread over them. Each session creates a
+battle, then attacks with a random move (switching in the first available
+Pokemon after a faint) until the battle is over. Requests of the sessions
+sharing a connection are pipelined and matched to their responses by id.
+
+By default the server runs in this process, on the same event loop as the
+clients: everything shares one core, so the figures are a lower bound for
+the server alone. Use --connect to load an external server instead.
+
+Reports battles and actions per second, request latency percentiles and
+the number of streamed events.
+
+Usage (from the project root):
+    python3 -m benchmarks.bench_battle_server
+    python3 -m benchmarks.bench_battle_server --sessions 5000 --connections 250
+    python3 -m benchmarks.bench_battle_server --no-events --team-size 6
+    python3 -m benchmarks.bench_battle_server --connect 127.0.0.1:8765
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+from models.species_registry import SpeciesRegistry
+from utils.battle_server import BattleServer
+
+SPECIES_PATH = "data/pokemon.json"
+
+
+async def open_client(host, port, path, counters):
+    """Open a connection and start routing its responses to futures.
+
+    Args:
+        host: Server host.
+        port: Server port.
+        path: Unix socket path (overrides host/port).
+        counters: Dict updated with the "events" received.
+
+    Returns:
+        tuple: (request coroutine function, close coroutine function).
+    """
+    if path is not None:
+        reader, writer = await asyncio.open_unix_connection(
+            path, limit=BattleServer.MAX_LINE
+        )
+    else:
+        reader, writer = await asyncio.open_connection(
+            host, port, limit=BattleServer.MAX_LINE
+        )
+    pending = {}
+    next_id = [0]
+
+    async def route():
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            message = json.loads(line)
+            if "event" in message:
+                counters["events"] += 1
+                continue
+            future = pending.pop(message.get("id"), None)
+            if future is not None:
+                future.set_result(message)
+        for future in pending.values():
+            future.set_exception(ConnectionError("Server closed the connection"))
+
+    router = asyncio.get_running_loop().create_task(route())
+
+    async def request(message):
+        next_id[0] += 1
+        message["id"] = next_id[0]
+        future = asyncio.get_running_loop().create_future()
+        pending[next_id[0]] = future
+        writer.write(json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n")
+        await writer.drain()
+        return await future
+
+    async def close():
+        writer.close()
+        await writer.wait_closed()
+        await router
+
+    return request, close
+
+
+async def play_session(request, args, names, rng, latencies):
+    """Play one battle to the end.
+
+    Returns:
+        int: Number of actions sent.
+    """
+    start = time.perf_counter()
+    response = await request({
+        "op": "create",
+        "player": rng.sample(names, args.team_size),
+        "level": args.level,
+        "events": args.events,
+    })
+    latencies.append(time.perf_counter() - start)
+    if not response["ok"]:
+        raise RuntimeError(response["error"])
+    battle = response["battle"]
+    state = response["state"]
+    actions = 0
+    while state["phase"] != "finished":
+        if state["phase"] == "forced_switch":
+            index = next(
+                i for i, p in enumerate(state["player_team"])
+                if p["hp"] > 0 and i != state["player_index"]
+            )
+            message = {"op": "switch", "battle": battle, "index": index}
+        else:
+            move = rng.randrange(len(state["moves"]))
+            message = {"op": "attack", "battle": battle, "move": move}
+        start = time.perf_counter()
+        response = await request(message)
+        latencies.append(time.perf_counter() - start)
+        if not response["ok"]:
+            raise RuntimeError(response["error"])
+        state = response["state"]
+        actions += 1
+    await request({"op": "close", "battle": battle})
+    return actions
+
+
+async def run(args):
+    """Run the load test and print the report."""
+    server = None
+    host, port, path = None, None, args.unix
+    if args.connect:
+        host, _, port = args.connect.rpartition(":")
+        port = int(port)
+    else:
+        server = BattleServer(seed=args.seed)
+        await server.start("127.0.0.1", 0, path)
+        if path is None:
+            host, port = server.address()[:2]
+
+    registry = SpeciesRegistry()
+    registry.load_from_file(SPECIES_PATH)
+    names = [s["name"] for s in registry.get_all()]
+    rng = random.Random(args.seed)
+    counters = {"events": 0}
+    clients = []
+    for _ in range(args.connections):
+        clients.append(await open_client(host, port, path, counters))
+
+    latencies = []
+    start = time.perf_counter()
+    results = await asyncio.gather(*[
+        play_session(clients[k % len(clients)][0], args, names,
+                     random.Random(rng.getrandbits(32)), latencies)
+        for k in range(args.sessions)
+    ])
+    elapsed = time.perf_counter() - start
+
+    for _, close in clients:
+        await close()
+    if server is not None:
+        await server.close()
+
+    actions = sum(results)
+    latencies.sort()
+    where = "in-process server, one core" if server is not None else args.connect
+    print(f"{args.sessions} concurrent battles over {args.connections} "
+          f"connections ({where})")
+    print(f"  elapsed        {elapsed:10.2f} s")
+    print(f"  battles/s      {args.sessions / elapsed:10.1f}")
+    print(f"  actions/s      {actions / elapsed:10.1f}  ({actions} actions)")
+    print(f"  requests/s     {len(latencies) / elapsed:10.1f}")
+    print(f"  latency p50    {statistics.median(latencies) * 1000:10.2f} ms")
+    print(f"  latency p99    {latencies[int(len(latencies) * 0.99)] * 1000:10.2f} ms")
+    print(f"  events         {counters['events']:10d}")
+
+
+def main():
+    """Parse the arguments and run the load test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--team-size", type=int, default=3)
+    parser.add_argument("--level", type=int, default=20)
+    parser.add_argument("--no-events", dest="events", action="store_false")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--unix", help="Serve / connect on this Unix socket path")
+    parser.add_argument("--connect", help="HOST:PORT of an external server")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,403 @@
+"""Model benchmark -- microbenchmarks of the hot model paths.
+
+Times the model-layer operations the game runs every turn or every save:
+
+- Combat.attack, TypeChart.get_combined_multiplier
+- Pokemon(data=...) construction, Pokemon.gain_xp with large awards
+- Pokedex.add_entry (filling an empty Pokedex)
+- Game.sync_from_combat, Game.save_game (full snapshot and journal) and
+  Game.load_game at several roster sizes
+- OpponentGenerator.generate, plus a calibration check: generated teams
+  are played out with TeamBattle.resolve() and the measured player win
+  rate is compared with the target and with the model's estimate
+
+Each case is run `--repeat` times; the best and median time per operation
+are kept. Results can be written to JSON (--save) and compared with an
+earlier run (--compare): a case is a regression when its best time grew by
+more than --threshold (10% by default), and the exit status is then 1.
+It is also 1 when a calibration error exceeds --calibration-tolerance.
+
+Only the standard library is used (no pygame): saves go to a temporary
+directory, and the Pokedex file is redirected there too.
+
+Usage (from the project root):
+    python3 -m benchmarks.bench_models --save baseline.json
+    python3 -m benchmarks.bench_models --compare baseline.json --threshold 0.15
+    python3 -m benchmarks.bench_models --sizes 151 10000 --cases save_game sync
+    python3 -m benchmarks.bench_models --cases calibration
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from models.combat import Combat
+from models.game import Game
+from models.pokedex import Pokedex
+from models.opponent_generator import OpponentGenerator
+from models.pokemon import Pokemon
+from models.team_battle import TeamBattle
+from models.type_chart import TypeChart
+from utils.file_handler import FileHandler
+
+SPECIES_PATH = "data/pokemon.json"
+TYPE_CHART_PATH = "data/type_chart.json"
+
+# Calibration check: targets the default roster can reach, generated
+# teams per target, battles played per team
+CALIBRATION_TARGETS = (0.35, 0.55, 0.8)
+CALIBRATION_TEAMS = 400
+CALIBRATION_BATTLES = 5
+
+
+def measure(func, number, repeat):
+    """Time `func` called `number` times, `repeat` times over.
+
+    Args:
+        func: Callable run once per operation.
+        number: Operations per repeat.
+        repeat: Number of repeats.
+
+    Returns:
+        dict: best_us and median_us per operation, ops per repeat.
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return {
+        "best_us": round(min(samples) * 1e6, 3),
+        "median_us": round(statistics.median(samples) * 1e6, 3),
+        "number": number,
+    }
+
+
+def make_game(save_dir, species, size):
+    """Create a Game on a temporary directory with `size` Pokemon.
+
+    Args:
+        save_dir: Temporary directory (saves and Pokedex file).
+        species: Species dicts from data/pokemon.json.
+        size: Roster size.
+
+    Returns:
+        Game: A game whose files all live in save_dir.
+    """
+    game = Game(save_dir=save_dir)
+    game.POKEDEX_PATH = os.path.join(save_dir, "pokedex.json")
+    for i in range(len(game.pokemon_list), size):
+        data = dict(species[i % len(species)])
+        data["name"] = f"{data['name']}{i}"
+        game.add_pokemon(data, journal=False)
+    for p in game.pokemon_list[:len(species)]:
+        game.pokedex.add_entry(p)
+    return game
+
+
+def bench_attack(ctx, args):
+    """Combat.attack between two species with four moves each."""
+    attacker = Pokemon(data=ctx["species"][5])
+    defender = Pokemon(data=ctx["species"][8])
+    defender.max_hp = 10 ** 9
+    combat = Combat(attacker, defender, ctx["type_chart"])
+    moves = attacker.moves
+    state = {"i": 0}
+
+    def op():
+        state["i"] += 1
+        defender.hp = defender.max_hp
+        combat.attack(attacker, defender, moves[state["i"] % len(moves)])
+
+    yield "combat_attack", measure(op, 20000, args.repeat)
+
+
+def bench_multiplier(ctx, args):
+    """TypeChart.get_combined_multiplier over every (type, dual type) pair."""
+    chart = ctx["type_chart"]
+    pairs = []
+    for attack_type in TypeChart.TYPES:
+        for defend in TypeChart.TYPES:
+            pairs.append((attack_type, [defend, "flying"]))
+    state = {"i": 0}
+
+    def op():
+        state["i"] = (state["i"] + 1) % len(pairs)
+        attack_type, defend_types = pairs[state["i"]]
+        chart.get_combined_multiplier(attack_type, defend_types)
+
+    yield "type_multiplier", measure(op, 50000, args.repeat)
+
+
+def bench_construct(ctx, args):
+    """Pokemon(data=...) from a species dict (with moves)."""
+    species = ctx["species"]
+    state = {"i": 0}
+
+    def op():
+        state["i"] = (state["i"] + 1) % len(species)
+        Pokemon(data=species[state["i"]])
+
+    yield "pokemon_construct", measure(op, 5000, args.repeat)
+
+
+def bench_gain_xp(ctx, args):
+    """Pokemon.gain_xp with awards from one level to hundreds of levels."""
+    template = ctx["species"][0]
+    for amount in (100, 10000, 1000000):
+        def op(amount=amount):
+            Pokemon(data=template).gain_xp(amount)
+        number = 2000 if amount < 1000000 else 20
+        yield f"gain_xp[{amount}]", measure(op, number, args.repeat)
+
+
+def bench_pokedex(ctx, args):
+    """Pokedex.add_entry while filling an empty Pokedex (per entry)."""
+    roster = [Pokemon(data=s) for s in ctx["species"]]
+    for size in args.sizes:
+        pokemon = []
+        for i in range(size):
+            p = Pokemon(data=ctx["species"][i % len(roster)])
+            p.name = f"{p.name}{i}"
+            pokemon.append(p)
+
+        def op(pokemon=pokemon):
+            dex = Pokedex()
+            for p in pokemon:
+                dex.add_entry(p)
+
+        result = measure(op, 1, args.repeat)
+        result["best_us"] = round(result["best_us"] / size, 3)
+        result["median_us"] = round(result["median_us"] / size, 3)
+        result["number"] = size
+        yield f"pokedex_add_entry[{size}]", result
+
+
+def bench_sync(ctx, args):
+    """Game.sync_from_combat of a six-Pokemon team after a won battle."""
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as save_dir:
+            game = make_game(save_dir, ctx["species"], size)
+            indices = list(range(0, size, max(1, size // 6)))[:6]
+            team = [Pokemon(data=game.pokemon_list[i].to_dict()) for i in indices]
+
+            def op():
+                # A won battle: every member gained XP since the baseline
+                for p in team:
+                    p.mark_clean()
+                    p.gain_xp(30)
+                game.sync_from_combat(team, indices)
+
+            yield f"sync_from_combat[{size}]", measure(op, 500, args.repeat)
+            game.close()
+
+
+def bench_save_load(ctx, args):
+    """Game.save_game (full snapshot / journal append) and load_game."""
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as save_dir:
+            game = make_game(save_dir, ctx["species"], size)
+
+            def full_save():
+                game.save_game(full=True)
+                game.save_worker.flush()
+
+            def journal_save():
+                game.record_evolution()
+                game.save_game()
+                game.save_worker.flush()
+
+            number = 1 if size >= 10000 else 5
+            yield f"save_game_full[{size}]", measure(full_save, number, args.repeat)
+            yield f"save_game_journal[{size}]", measure(journal_save, 20, args.repeat)
+            full_save()
+            yield f"load_game[{size}]", measure(game.load_game, number, args.repeat)
+            game.close()
+
+
+def bench_calibration(ctx, args):
+    """OpponentGenerator.generate timing and win-rate calibration.
+
+    Random player teams (1-6 Pokemon, levels 5-40) get generated opponents
+    for each target; every pair is played CALIBRATION_BATTLES times with
+    TeamBattle.resolve() (best-move player). The rows (target, mean
+    estimate, measured win rate) are left in ctx["calibration"].
+    """
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as save_dir:
+        game = make_game(save_dir, ctx["species"], len(ctx["species"]))
+        generator = OpponentGenerator(game.type_chart, seed=args.seed)
+        roster = game.get_all_pokemon()
+        pairs = {}
+        for target in CALIBRATION_TARGETS:
+            pairs[target] = []
+            for _ in range(CALIBRATION_TEAMS):
+                level = rng.randint(5, 40)
+                team = []
+                for i in rng.sample(range(len(roster)), rng.randint(1, 6)):
+                    p = Pokemon(data=roster[i].to_dict())
+                    p.scale_to_level(level)
+                    team.append(p)
+                pairs[target].append((team, generator.generate(game, team, target)))
+
+        team = pairs[0.55][0][0]
+        yield "opponent_generate", measure(
+            lambda: generator.generate(game, team, 0.55), 20, args.repeat
+        )
+
+        battle_rng = random.Random(args.seed)
+        rows = []
+        for target, target_pairs in pairs.items():
+            estimate = 0.0
+            wins = 0
+            for team, opponents in target_pairs:
+                estimate += generator.win_probability(team, opponents)
+                for _ in range(CALIBRATION_BATTLES):
+                    battle = TeamBattle(
+                        [Pokemon(data=p.to_dict(move_ids=True)) for p in team],
+                        [Pokemon(data=p.to_dict(move_ids=True)) for p in opponents],
+                        game.type_chart, rng=battle_rng,
+                    )
+                    battle.resolve()
+                    wins += battle.winner == "player"
+            rows.append((
+                target, estimate / len(target_pairs),
+                wins / (len(target_pairs) * CALIBRATION_BATTLES),
+            ))
+        ctx["calibration"] = rows
+        game.close()
+
+
+def check_calibration(rows, tolerance):
+    """Print the calibration table and return the targets that are off.
+
+    Args:
+        rows: (target, mean estimate, measured win rate) tuples.
+        tolerance: Largest accepted gap between the measured win rate and
+            the target, and between the measured rate and the estimate.
+
+    Returns:
+        list[float]: Targets whose calibration error exceeds the tolerance.
+    """
+    failures = []
+    print()
+    print(f"{'target':>8} {'estimate':>9} {'measured':>9}")
+    for target, estimate, measured in rows:
+        flag = ""
+        if abs(measured - target) > tolerance or abs(measured - estimate) > tolerance:
+            flag = "  MISCALIBRATED"
+            failures.append(target)
+        print(f"{target:>8.2f} {estimate:>9.3f} {measured:>9.3f}{flag}")
+    return failures
+
+
+CASES = {
+    "attack": bench_attack,
+    "multiplier": bench_multiplier,
+    "construct": bench_construct,
+    "gain_xp": bench_gain_xp,
+    "pokedex": bench_pokedex,
+    "sync": bench_sync,
+    "save_game": bench_save_load,
+    "calibration": bench_calibration,
+}
+
+
+def compare(results, baseline, threshold):
+    """Print a regression report against a baseline run.
+
+    Args:
+        results: Dict {case: result} of this run.
+        baseline: Loaded baseline JSON (same shape as --save output).
+        threshold: Allowed relative slowdown of best_us (0.10 = 10%).
+
+    Returns:
+        list[str]: Names of the regressed cases.
+    """
+    regressions = []
+    old_results = baseline.get("results", {})
+    print()
+    print(f"{'case':<32} {'baseline us':>12} {'now us':>12} {'change':>8}")
+    for name, result in results.items():
+        old = old_results.get(name)
+        if old is None:
+            print(f"{name:<32} {'-':>12} {result['best_us']:>12.3f} {'new':>8}")
+            continue
+        change = result["best_us"] / old["best_us"] - 1 if old["best_us"] else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<32} {old['best_us']:>12.3f} {result['best_us']:>12.3f} "
+              f"{change:>+7.1%}{flag}")
+    return regressions
+
+
+def main():
+    """Run the selected cases, print them, optionally save and compare."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--sizes", type=int, nargs="+", default=[151, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    parser.add_argument("--calibration-tolerance", type=float, default=0.08)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    type_chart = TypeChart()
+    type_chart.load_from_file(TYPE_CHART_PATH)
+    ctx = {
+        "species": FileHandler().load_json(SPECIES_PATH),
+        "type_chart": type_chart,
+    }
+
+    results = {}
+    print(f"{'case':<32} {'best us':>12} {'median us':>12} {'ops':>7}")
+    for case in args.cases:
+        for name, result in CASES[case](ctx, args):
+            results[name] = result
+            print(f"{name:<32} {result['best_us']:>12.3f} "
+                  f"{result['median_us']:>12.3f} {result['number']:>7}")
+
+    failed = False
+    if "calibration" in ctx:
+        failures = check_calibration(ctx["calibration"], args.calibration_tolerance)
+        if failures:
+            print(f"{len(failures)} target(s) off by more than {args.calibration_tolerance}")
+            failed = True
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump({
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "timestamp": time.time(),
+                "sizes": args.sizes,
+                "results": results,
+            }, file, indent=2)
+        print(f"Results written to {args.save}")
+
+    if args.compare:
+        baseline = FileHandler().load_json(args.compare)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+            failed = True
+        else:
+            print(f"No regression above {args.threshold:.0%}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""Render benchmark -- headless per-screen draw times and allocations.
+
+Runs every screen under the SDL dummy video driver for a fixed number of
+frames with scripted input (mouse wheel scrolling, a combat kept in the
+middle of its shake/flash/HP animations) and reports, per screen:
+
+- the distribution of draw() times (mean, p50, p95, p99, max);
+- the peak Python memory allocated during one draw (tracemalloc), and the
+  net number of blocks still allocated after all frames (a leak check).
+
+Timings and allocations are measured in two separate passes because
+tracemalloc slows every allocation down. Memory allocated by SDL itself
+(surfaces created by font.render, transform.scale, ...) is not seen by
+tracemalloc; the draw times include it.
+
+The game runs on a temporary save directory, so no save file or
+data/pokedex.json is touched. Roster and Pokedex sizes are parameters:
+extra Pokemon are synthetic copies of data/pokemon.json entries.
+
+Usage (from the project root):
+    python3 -m benchmarks.bench_render
+    python3 -m benchmarks.bench_render --frames 600 --roster 1000 --dex 1000
+    python3 -m benchmarks.bench_render --screens CombatScreen --json render.json
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import array
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pygame
+
+from gui.add_pokemon_screen import AddPokemonScreen
+from gui.combat_screen import CombatScreen
+from gui.constants import Constants
+from gui.menu_screen import MenuScreen
+from gui.pokedex_screen import PokedexScreen
+from gui.result_screen import ResultScreen
+from gui.selection_screen import SelectionScreen
+from gui.team_select_screen import TeamSelectScreen
+from models.game import Game
+from models.pokemon import Pokemon
+
+SCREEN_NAMES = (
+    "MenuScreen", "SelectionScreen", "TeamSelectScreen", "CombatScreen",
+    "PokedexScreen", "ResultScreen", "AddPokemonScreen",
+)
+
+
+def build_game(save_dir, roster_size, dex_size):
+    """Create a Game with a roster and Pokedex of the requested sizes.
+
+    Args:
+        save_dir: Temporary save directory.
+        roster_size: Number of Pokemon in the roster (at least the 151
+            species from the source file are kept).
+        dex_size: Number of Pokedex entries.
+
+    Returns:
+        Game: The prepared game (nothing is saved).
+    """
+    game = Game(save_dir=save_dir)
+    species = game.get_all_pokemon()
+    base = len(species)
+    for i in range(base, roster_size):
+        data = species[i % base].to_dict()
+        data["name"] = f"{data['name']}{i}"
+        game.add_pokemon(data, journal=False)
+
+    roster = game.get_all_pokemon()
+    for i in range(dex_size):
+        p = roster[i % len(roster)]
+        game.pokedex.add_raw_entry({
+            "name": p.name if i < len(roster) else f"{p.name}#{i}",
+            "types": list(p.types),
+            "hp": p.max_hp,
+            "attack": p.attack,
+            "defense": p.defense,
+        })
+    return game
+
+
+def make_screen(name, game):
+    """Create a screen in the state the benchmark measures.
+
+    Args:
+        name: Screen class name (one of SCREEN_NAMES).
+        game: The Game instance.
+
+    Returns:
+        BaseScreen: The screen.
+    """
+    if name == "MenuScreen":
+        return MenuScreen(game)
+    if name == "SelectionScreen":
+        return SelectionScreen(game)
+    if name == "TeamSelectScreen":
+        return TeamSelectScreen(game)
+    if name == "PokedexScreen":
+        return PokedexScreen(game)
+    if name == "AddPokemonScreen":
+        return AddPokemonScreen(game)
+    if name == "ResultScreen":
+        return ResultScreen(game, "Pikachu", "Onix", "Pikachu gained 42 XP!")
+    available = game.get_available_pokemon()
+    player = [Pokemon(data=p.to_dict()) for p in available[:6]]
+    opponent = [Pokemon(data=p.to_dict()) for p in available[6:12]]
+    return CombatScreen(game, player, opponent, list(range(len(player))))
+
+
+def scripted_events(frame, frames):
+    """Return the input events injected at a given frame.
+
+    The wheel scrolls down for the first half of the run and back up for
+    the second half, so list screens draw every part of their content.
+
+    Args:
+        frame: Frame number.
+        frames: Total frames.
+
+    Returns:
+        list[pygame.event.Event]: Events for this frame.
+    """
+    direction = -1 if frame < frames // 2 else 1
+    return [pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=direction, flipped=False)]
+
+
+def keep_animating(screen):
+    """Restart the combat animations whenever they finish.
+
+    Keeps CombatScreen mid-animation (shake, flash and HP bar) for the
+    whole run instead of measuring an idle battle.
+
+    Args:
+        screen: A CombatScreen.
+    """
+    for anim in (screen.player_anim, screen.opponent_anim):
+        if not anim.is_animating():
+            anim.start_shake()
+            anim.start_flash(Constants.RED)
+            anim.start_hp_animation(1.0, 0.25)
+
+
+def run_frames(screen, surface, frames, measure, results=None):
+    """Drive a screen for `frames` frames, measuring each draw().
+
+    Args:
+        screen: Screen under test.
+        surface: Display surface.
+        frames: Number of frames.
+        measure: Callable(draw_callable) returning one measurement.
+        results: Optional container to append the measurements to.
+
+    Returns:
+        list: The results container, one measurement per frame.
+    """
+    is_combat = isinstance(screen, CombatScreen)
+    if results is None:
+        results = []
+    for frame in range(frames):
+        screen.handle_events(scripted_events(frame, frames))
+        if is_combat:
+            keep_animating(screen)
+        screen.update(1.0 / Constants.FPS)
+        results.append(measure(lambda: screen.draw(surface)))
+        pygame.display.flip()
+    return results
+
+
+def time_draw(draw):
+    """Return the duration of one draw in milliseconds."""
+    start = time.perf_counter()
+    draw()
+    return (time.perf_counter() - start) * 1000.0
+
+
+def peak_draw(draw):
+    """Return the peak traced memory (bytes) during one draw."""
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    draw()
+    return tracemalloc.get_traced_memory()[1] - before
+
+
+def percentile(ordered, fraction):
+    """Return a percentile from a sorted list (nearest rank)."""
+    return ordered[int((len(ordered) - 1) * fraction)]
+
+
+def bench_screen(name, game, surface, frames, warmup):
+    """Benchmark one screen.
+
+    Args:
+        name: Screen class name.
+        game: The Game instance.
+        surface: Display surface.
+        frames: Measured frames per pass.
+        warmup: Unmeasured frames before the timing pass.
+
+    Returns:
+        dict: Draw time statistics (ms) and allocation figures.
+    """
+    random.seed(0)
+    screen = make_screen(name, game)
+    run_frames(screen, surface, warmup, lambda draw: draw())
+    times = sorted(run_frames(screen, surface, frames, time_draw))
+
+    random.seed(0)
+    screen = make_screen(name, game)
+    run_frames(screen, surface, warmup, lambda draw: draw())
+    # An int array keeps the measurements out of the block count
+    peaks = array.array("q")
+    tracemalloc.start()
+    blocks_before = sys.getallocatedblocks()
+    run_frames(screen, surface, frames, peak_draw, peaks)
+    blocks_after = sys.getallocatedblocks()
+    tracemalloc.stop()
+    peaks = sorted(peaks)
+
+    return {
+        "screen": name,
+        "frames": frames,
+        "mean_ms": round(sum(times) / len(times), 3),
+        "p50_ms": round(percentile(times, 0.50), 3),
+        "p95_ms": round(percentile(times, 0.95), 3),
+        "p99_ms": round(percentile(times, 0.99), 3),
+        "max_ms": round(times[-1], 3),
+        "peak_kb_p50": round(percentile(peaks, 0.50) / 1024, 1),
+        "peak_kb_max": round(peaks[-1] / 1024, 1),
+        "net_blocks": blocks_after - blocks_before,
+    }
+
+
+def main():
+    """Run the benchmark and print a table (optionally write JSON)."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--warmup", type=int, default=30)
+    parser.add_argument("--roster", type=int, default=151)
+    parser.add_argument("--dex", type=int, default=151)
+    parser.add_argument("--screens", nargs="+", choices=SCREEN_NAMES,
+                        default=list(SCREEN_NAMES))
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    pygame.init()
+    surface = pygame.display.set_mode(
+        (Constants.SCREEN_WIDTH, Constants.SCREEN_HEIGHT)
+    )
+    with tempfile.TemporaryDirectory() as save_dir:
+        game = build_game(save_dir, args.roster, args.dex)
+        print(f"roster={len(game.get_all_pokemon())} dex={game.pokedex.get_count()} "
+              f"frames={args.frames} driver={os.environ['SDL_VIDEODRIVER']}")
+        header = (f"{'screen':<18} | {'mean':>7} {'p50':>7} {'p95':>7} {'p99':>7} "
+                  f"{'max':>7} ms | {'peak KB':>8} {'max KB':>8} {'net blk':>8}")
+        print(header)
+        print("-" * len(header))
+        results = []
+        for name in args.screens:
+            r = bench_screen(name, game, surface, args.frames, args.warmup)
+            results.append(r)
+            print(f"{name:<18} | {r['mean_ms']:>7.3f} {r['p50_ms']:>7.3f} "
+                  f"{r['p95_ms']:>7.3f} {r['p99_ms']:>7.3f} {r['max_ms']:>7.3f}    | "
+                  f"{r['peak_kb_p50']:>8.1f} {r['peak_kb_max']:>8.1f} "
+                  f"{r['net_blocks']:>8}")
+        game.save_worker.close()
+    pygame.quit()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump({"roster": args.roster, "dex": args.dex,
+                       "frames": args.frames, "results": results}, file, indent=2)
+        print(f"Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Save format benchmark -- JSON save vs compact SaveCodec encoding.
+
+Builds synthetic rosters from data/pokemon.json (levelled-up copies plus
+~10% custom Pokemon that cannot use species references) and compares file
+size, encode time and load (decode) time of both formats.
+
+Usage (from the project root):
+    python3 -m benchmarks.bench_save_formats
+    python3 -m benchmarks.bench_save_formats --sizes 151 10000 100000
+"""
+
+import argparse
+import json
+import random
+import time
+
+from utils.file_handler import FileHandler
+from utils.save_codec import SaveCodec
+
+SPECIES_PATH = "data/pokemon.json"
+
+
+def build_save(species, size, seed=0):
+    """Build a save dictionary with `size` Pokemon.
+
+    Args:
+        species: List of species dicts.
+        size: Roster size.
+        seed: Random seed.
+
+    Returns:
+        dict: Save data in the JSON save shape.
+    """
+    rng = random.Random(seed)
+    roster = []
+    for i in range(size):
+        p = dict(species[i % len(species)])
+        p["moves"] = [dict(m) for m in p.get("moves", [])]
+        p["types"] = list(p.get("types", ["normal"]))
+        if i >= len(species):
+            levels = rng.randint(0, 40)
+            p["level"] += levels
+            p["hp"] += levels * 5
+            p["attack"] += levels * 3
+            p["defense"] += levels * 2
+            p["xp"] = rng.randint(0, 30)
+            p["xp_to_next_level"] = 10 + p["level"] * 5
+        if i >= len(species) and rng.random() < 0.1:
+            p["name"] = f"Custom{i}"
+            p["sprite_path"] = ""
+        roster.append(p)
+    pokedex = []
+    for s in species:
+        pokedex.append({
+            "name": s["name"], "types": list(s["types"]),
+            "hp": s["hp"], "attack": s["attack"], "defense": s["defense"],
+        })
+    return {"pokemon_list": roster, "evolution_count": 3, "pokedex": pokedex}
+
+
+def best_of(func, repeat):
+    """Return (best wall time in seconds, last result) over `repeat` runs."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, result
+
+
+def main():
+    """Run the comparison and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[151, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    species = FileHandler().load_json(SPECIES_PATH)
+    codec = SaveCodec(species)
+
+    header = (f"{'roster':>8} | {'json KB':>9} {'compact KB':>10} {'ratio':>6} | "
+              f"{'json enc ms':>11} {'cmp enc ms':>10} | "
+              f"{'json load ms':>12} {'cmp load ms':>11}")
+    print(header)
+    print("-" * len(header))
+    for size in args.sizes:
+        save = build_save(species, size)
+        json_enc, json_blob = best_of(
+            lambda: json.dumps(save, indent=2, ensure_ascii=False).encode("utf-8"),
+            args.repeat,
+        )
+        cmp_enc, cmp_blob = best_of(lambda: codec.encode(save), args.repeat)
+        json_load, json_data = best_of(lambda: json.loads(json_blob), args.repeat)
+        cmp_load, cmp_data = best_of(lambda: codec.decode(cmp_blob), args.repeat)
+        if cmp_data["pokemon_list"] != json_data["pokemon_list"]:
+            raise SystemExit(f"Round-trip mismatch at roster size {size}")
+        print(f"{size:>8} | {len(json_blob) / 1024:>9.1f} {len(cmp_blob) / 1024:>10.1f} "
+              f"{len(json_blob) / len(cmp_blob):>5.0f}x | "
+              f"{json_enc * 1000:>11.1f} {cmp_enc * 1000:>10.1f} | "
+              f"{json_load * 1000:>12.1f} {cmp_load * 1000:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,11 @@ import os
 import pygame
 
 from models.game_state import GameState
+from gui.asset_cache import AssetCache
 from gui.base_screen import BaseScreen
 from gui.constants import Constants
+from gui.hit_grid import HitGrid
+from models.pokemon import Pokemon
 from models.type_chart import TypeChart
 
 
@@ -25,7 +28,7 @@ class AddPokemonScreen(BaseScreen):
 
         # Load background image
         bg_path = os.path.join("assets", "backgrounds", "pokedex_lab.png")
-        self.background = pygame.image.load(bg_path).convert()
+        self.background = AssetCache.get_image(bg_path, convert=True)
 
         self.font_title = self.constants.get_font(32, bold=True)
         self.font_label = self.constants.get_font(18)
@@ -64,6 +67,15 @@ class AddPokemonScreen(BaseScreen):
 
         self.error_message = ""
 
+        # Click lookup: ("field", name), ("type", name), "save", "back"
+        self.hit_grid = HitGrid()
+        for field_name, field in self.fields.items():
+            self.hit_grid.add(("field", field_name), field["rect"])
+        for btn in self.type_buttons:
+            self.hit_grid.add(("type", btn["name"]), btn["rect"])
+        self.hit_grid.add("save", self.save_button)
+        self.hit_grid.add("back", self.back_button)
+
     def _build_type_buttons(self):
         """Pre-compute the position of each type toggle button."""
         self.type_buttons = []
@@ -95,25 +107,24 @@ class AddPokemonScreen(BaseScreen):
                 for field in self.fields.values():
                     field["active"] = False
 
-                # Check field clicks
-                for field in self.fields.values():
-                    if field["rect"].collidepoint(event.pos):
-                        field["active"] = True
-
-                # Type toggles
-                for btn in self.type_buttons:
-                    if btn["rect"].collidepoint(event.pos):
-                        if btn["name"] in self.selected_types:
-                            self.selected_types.remove(btn["name"])
-                        elif len(self.selected_types) < 2:
-                            self.selected_types.append(btn["name"])
+                key = self.hit_grid.hit(event.pos)
+                if isinstance(key, tuple):
+                    kind, name = key
+                    # Field click
+                    if kind == "field":
+                        self.fields[name]["active"] = True
+                    # Type toggle
+                    elif name in self.selected_types:
+                        self.selected_types.remove(name)
+                    elif len(self.selected_types) < 2:
+                        self.selected_types.append(name)
 
                 # Save button
-                if self.save_button.collidepoint(event.pos):
+                if key == "save":
                     return self._try_save()
 
                 # Back button
-                if self.back_button.collidepoint(event.pos):
+                if key == "back":
                     return GameState.MENU
 
             if event.type == pygame.KEYDOWN:
@@ -137,36 +148,18 @@ class AddPokemonScreen(BaseScreen):
         """Validate and save the new Pokemon. Returns MENU on success, None on error."""
         self.error_message = ""
 
-        name = self.fields["name"]["value"].strip()
-        if not name:
-            self.error_message = "Name is required"
-            return None
-
         try:
-            hp = int(self.fields["hp"]["value"])
-            attack = int(self.fields["attack"]["value"])
-            defense = int(self.fields["defense"]["value"])
-        except ValueError:
-            self.error_message = "HP, Attack, Defense must be numbers"
-            return None
-
-        if hp < 1 or attack < 1 or defense < 1:
-            self.error_message = "Stats must be at least 1"
-            return None
-
-        if not self.selected_types:
-            self.error_message = "Select at least one type"
+            pokemon_data = Pokemon.validate_data({
+                "name": self.fields["name"]["value"],
+                "hp": self.fields["hp"]["value"],
+                "attack": self.fields["attack"]["value"],
+                "defense": self.fields["defense"]["value"],
+                "types": list(self.selected_types),
+            })
+        except ValueError as e:
+            self.error_message = str(e)
             return None
 
-        pokemon_data = {
-            "name": name.capitalize(),
-            "hp": hp,
-            "level": 5,
-            "attack": attack,
-            "defense": defense,
-            "types": list(self.selected_types),
-            "sprite_path": "",
-        }
         if not self.game.add_pokemon(pokemon_data):
             self.error_message = "A Pokemon with this name already exists"
             return None
@@ -0,0 +1,89 @@
+"""Asset cache module -- shared image cache across screen instances."""
+
+import os
+
+import pygame
+
+
+class AssetCache:
+    """Process-wide cache of loaded (and scaled) images.
+
+    Screens are recreated on every state transition; without a cache each
+    one reloads its background and every roster sprite from disk. Images
+    are keyed by (path, size, convert) and shared between screens, so
+    callers must not draw onto the returned surfaces.
+
+    Usage::
+
+        bg = AssetCache.get_image("assets/backgrounds/main_menu.png", convert=True)
+        sprite = AssetCache.get_image(pokemon.sprite_path, size=(80, 80))
+        hits, misses = AssetCache.stats()
+        count, size = AssetCache.memory()
+    """
+
+    _images = {}
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def get_image(cls, path, size=None, convert=False):
+        """Return a cached image, loading it on first use.
+
+        Args:
+            path: Image file path.
+            size: Optional (width, height) to scale to.
+            convert: Convert to the display pixel format (for opaque
+                backgrounds; requires the display to be initialized).
+
+        Returns:
+            pygame.Surface or None: The image, or None if the file is
+                missing or unreadable (failures are cached too).
+        """
+        key = (path, size, convert)
+        if key in cls._images:
+            cls.hits += 1
+            return cls._images[key]
+        cls.misses += 1
+        image = None
+        if path and os.path.isfile(path):
+            try:
+                image = pygame.image.load(path)
+                if size is not None:
+                    image = pygame.transform.scale(image, size)
+                if convert:
+                    image = image.convert()
+            except pygame.error:
+                image = None
+        cls._images[key] = image
+        return image
+
+    @classmethod
+    def stats(cls):
+        """Return cache counters.
+
+        Returns:
+            tuple: (hits, misses).
+        """
+        return cls.hits, cls.misses
+
+    @classmethod
+    def memory(cls):
+        """Return how many surfaces the cache holds and their pixel bytes.
+
+        Returns:
+            tuple: (surface count, bytes).
+        """
+        count = 0
+        size = 0
+        for image in cls._images.values():
+            if image is not None:
+                count += 1
+                size += image.get_pitch() * image.get_height()
+        return count, size
+
+    @classmethod
+    def clear(cls):
+        """Drop every cached image and reset the counters."""
+        cls._images = {}
+        cls.hits = 0
+        cls.misses = 0
@@ -1,9 +1,8 @@
 """Base screen module -- parent class for all game screens."""
 
-import os
-
 import pygame
 
+from gui.asset_cache import AssetCache
 from gui.constants import Constants
 
 
@@ -35,10 +34,14 @@ class BaseScreen:
         """
         pass
 
-    def update(self):
+    def update(self, dt):
         """Update screen logic (animations, timers, etc.).
 
         Called once per frame before draw().
+
+        Args:
+            dt: Seconds since the previous frame, measured by clock.tick()
+                (animations and timers use it, not frame counts).
         """
         pass
 
@@ -50,21 +53,22 @@ class BaseScreen:
         """
         pass
 
-    def _load_sprites(self, size=(80, 80)):
-        """Load all Pokemon sprites into self.sprites dict.
+    def _get_sprite(self, pokemon, size=(80, 80)):
+        """Return a Pokemon's sprite, loaded on first use (via AssetCache).
+
+        Card grids call it for the cards they draw only, so a large roster
+        does not load (or scale) one image per Pokemon up front.
 
         Args:
+            pokemon: The Pokemon to draw.
             size: Tuple (width, height) for sprite scaling.
+
+        Returns:
+            pygame.Surface or None: The sprite, or None if missing.
         """
-        self.sprites = {}
-        for pokemon in self.game.get_all_pokemon():
-            path = pokemon.sprite_path
-            if path and os.path.isfile(path):
-                try:
-                    img = pygame.image.load(path)
-                    self.sprites[pokemon.name] = pygame.transform.scale(img, size)
-                except pygame.error:
-                    pass
+        if pokemon.name not in self.sprites:
+            self.sprites[pokemon.name] = AssetCache.get_image(pokemon.sprite_path, size=size)
+        return self.sprites[pokemon.name]
 
     def draw_type_badges(self, surface, font, types, x, y, padding=4, pad_inner=12, radius=4):
         """Draw colored type badges starting at (x, y).
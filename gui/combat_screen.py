@@ -6,10 +6,15 @@ import random
 import pygame
 
 from models.animation_manager import AnimationManager
+from models.timeline import Timeline
+from models.battle_event_bus import BattleEventBus
 from models.combat import Combat
 from models.game_state import GameState
+from models.team_battle import TeamBattle
+from gui.asset_cache import AssetCache
 from gui.base_screen import BaseScreen
 from gui.constants import Constants
+from gui.hit_grid import HitGrid
 
 
 class CombatScreen(BaseScreen):
@@ -20,6 +25,17 @@ class CombatScreen(BaseScreen):
     PHASE_FORCED_SWITCH = "forced_switch"
     PHASE_FINISHED = "finished"
 
+    # Info plate layout (HP bar offsets inside the plate)
+    PANEL_PADDING_X = 12
+    HP_BAR_Y = 36
+    HP_BAR_WIDTH = 160
+    HP_BAR_HEIGHT = 16
+    PANEL_OVERFLOW = 20
+
+    # Battle speed multiplier while turbo is on (timers and animations)
+    TURBO_SPEED = 4.0
+    TURBO_KEY = pygame.K_t
+
     def __init__(self, game, player_team, opponent_team, player_original_indices=None):
         """Initialize combat with two teams of Pokemon.
 
@@ -32,12 +48,16 @@ class CombatScreen(BaseScreen):
         """
         super().__init__(game)
         self.player_team = player_team
+        # Baseline for the post-battle sync: only changed fields go back
+        for p in player_team:
+            p.mark_clean()
         self.opponent_team = opponent_team
         self.player_index = 0
         self.opponent_index = 0
         self.player = self.player_team[0]
         self.opponent = self.opponent_team[0]
-        self.combat = Combat(self.player, self.opponent, game.type_chart)
+        self.events = game.battle_events
+        self.combat = Combat(self.player, self.opponent, game.type_chart, self.events)
 
         self.font_name = self.constants.get_font(22, bold=True)
         self.font_stat = self.constants.get_font(16)
@@ -52,14 +72,17 @@ class CombatScreen(BaseScreen):
         self.show_switch = False
         self.show_moves = False
 
-        # Animation managers for visual effects
-        self.player_anim = AnimationManager()
-        self.opponent_anim = AnimationManager()
+        # One timeline runs every effect and the opponent's delayed attack
+        self.timeline = Timeline()
+        self.player_anim = AnimationManager(self.timeline)
+        self.opponent_anim = AnimationManager(self.timeline)
 
-        # Opponent attack delay
-        self.opponent_attack_delay = 1500
-        self.opponent_attack_timer = 0
+        # Opponent attack delay (seconds)
+        self.opponent_attack_delay = 1.5
         self.waiting_for_opponent = False
+        # Turbo scales the time fed to the timeline: every delay and
+        # effect runs faster, the battle itself is unchanged
+        self.speed = game.battle_speed
 
         self.font_move = self.constants.get_font(14, bold=True)
 
@@ -69,43 +92,73 @@ class CombatScreen(BaseScreen):
         self.switch_button = pygame.Rect(325, btn_y, 150, 45)
         self.forfeit_button = pygame.Rect(495, btn_y, 150, 45)
         self.continue_button = pygame.Rect(300, btn_y, 200, 45)
-
-        # Move buttons (built dynamically)
+        self.auto_button = pygame.Rect(20, btn_y, 115, 45)
+        self.turbo_button = pygame.Rect(665, btn_y, 115, 45)
+
+        # Click lookup for the action buttons
+        self.hit_grid = HitGrid()
+        for key, rect in (("attack", self.attack_button),
+                          ("switch", self.switch_button),
+                          ("forfeit", self.forfeit_button),
+                          ("auto", self.auto_button),
+                          ("turbo", self.turbo_button)):
+            self.hit_grid.add(key, rect)
+
+        # Move buttons (rebuilt when the active Pokemon changes)
         self.move_buttons = []
+        self.move_grid = HitGrid()
+        self._move_buttons_key = None
 
-        # Switch menu buttons (built when needed)
+        # Switch menu buttons (rebuilt when the choice changes)
         self.switch_buttons = []
+        self.switch_grid = HitGrid()
+        self._switch_buttons_key = None
 
         # Load battle background
         bg_path = os.path.join("assets", "backgrounds", "battle_arena.png")
-        if os.path.exists(bg_path):
-            self.background = pygame.image.load(bg_path).convert()
-        else:
-            self.background = None
+        self.background = AssetCache.get_image(bg_path, convert=True)
 
         # Load sprites
         self.player_sprite = self._load_sprite(self.player.sprite_path)
         self.opponent_sprite = self._load_sprite(self.opponent.sprite_path)
 
+        # Render caches: info plates per side (rebuilt when the shown
+        # Pokemon or its stats change), pre-tinted flash surfaces per
+        # color (only their alpha varies), log lines, static labels
+        self._panel_cache = {}
+        self._flash_surfaces = {}
+        self._log_surfaces = None
+        self._dim_overlay = pygame.Surface(
+            (Constants.SCREEN_WIDTH, Constants.SCREEN_HEIGHT), pygame.SRCALPHA
+        )
+        self._dim_overlay.fill((0, 0, 0, 120))
+        self._labels = {
+            "vs": self.font_name.render("VS", True, Constants.RED),
+            "continue": self.font_button.render("Continue", True, Constants.WHITE),
+            "attack": self.font_button.render("Attack!", True, Constants.WHITE),
+            "switch": self.font_button.render("Switch", True, Constants.WHITE),
+            "forfeit": self.font_button.render("Forfeit", True, Constants.WHITE),
+            "auto": self.font_button.render("Auto", True, Constants.WHITE),
+            "turbo_off": self.font_button.render("Turbo", True, Constants.WHITE),
+            "turbo_on": self.font_button.render(
+                f"Turbo x{self.TURBO_SPEED:g}", True, Constants.WHITE
+            ),
+        }
+
         # Initialize HP animation ratios
         self.player_anim.current_hp_ratio = self.player.hp / self.player.max_hp if self.player.max_hp > 0 else 1.0
         self.opponent_anim.current_hp_ratio = self.opponent.hp / self.opponent.max_hp if self.opponent.max_hp > 0 else 1.0
 
     def _load_sprite(self, path):
         """Load and scale a sprite, returning None if unavailable."""
-        if path and os.path.isfile(path):
-            try:
-                img = pygame.image.load(path)
-                return pygame.transform.scale(img, (128, 128))
-            except pygame.error:
-                pass
-        return None
+        return AssetCache.get_image(path, size=(128, 128))
 
     def _add_log(self, message):
         """Add a message to the combat log (keep last 5)."""
         self.log_messages.append(message)
         if len(self.log_messages) > 5:
             self.log_messages.pop(0)
+        self._log_surfaces = None
 
     def _get_flash_color(self, effective):
         """Return flash color based on move effectiveness."""
@@ -121,11 +174,18 @@ class CombatScreen(BaseScreen):
         """Switch opponent to next alive Pokemon. Returns False if none left."""
         for i, p in enumerate(self.opponent_team):
             if p.is_alive() and i != self.opponent_index:
+                if self.events:
+                    self.events.emit(
+                        BattleEventBus.SWITCH, side="opponent", forced=True,
+                        old=self.opponent.name, new=p.name,
+                    )
                 self.opponent_index = i
                 self.opponent = self.opponent_team[i]
-                self.combat = Combat(self.player, self.opponent, self.game.type_chart)
+                self.combat = Combat(
+                    self.player, self.opponent, self.game.type_chart, self.events
+                )
                 self.opponent_sprite = self._load_sprite(self.opponent.sprite_path)
-                self.opponent_anim = AnimationManager()
+                self.opponent_anim = AnimationManager(self.timeline)
                 self.opponent_anim.current_hp_ratio = self.opponent.hp / self.opponent.max_hp if self.opponent.max_hp > 0 else 1.0
                 self._add_log(f"Opponent sends {self.opponent.name}!")
                 return True
@@ -139,9 +199,20 @@ class CombatScreen(BaseScreen):
         return True
 
     def handle_events(self, events):
-        """Handle button clicks for attack, switch, forfeit."""
+        """Handle button clicks for attack, switch, forfeit, turbo and auto."""
         for event in events:
+            if event.type == pygame.KEYDOWN and event.key == self.TURBO_KEY:
+                self._toggle_turbo()
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                key = self.hit_grid.hit(event.pos)
+
+                # Turbo and auto-resolve work at any time, even mid-animation
+                if self.phase != self.PHASE_FINISHED:
+                    if key == "turbo":
+                        self._toggle_turbo()
+                        return None
+                    if key == "auto":
+                        return self._auto_resolve()
 
                 # Block input during animations or opponent delay
                 if self.waiting_for_opponent or self.player_anim.is_animating() or self.opponent_anim.is_animating():
@@ -149,43 +220,47 @@ class CombatScreen(BaseScreen):
 
                 # Finished state - click continue
                 if self.phase == self.PHASE_FINISHED:
-                    for p in self.player_team:
-                        self.combat.register_to_pokedex(p, self.game.pokedex)
-                    for p in self.opponent_team:
-                        self.combat.register_to_pokedex(p, self.game.pokedex)
+                    self._register_pokedex()
                     return GameState.RESULT
 
                 # Move menu is open
                 if self.show_moves:
-                    for move, btn in self.move_buttons:
-                        if btn.collidepoint(event.pos):
-                            self.show_moves = False
-                            self._do_player_attack(move)
-                            return None
+                    idx = self.move_grid.hit(event.pos)
+                    if idx is not None:
+                        self.show_moves = False
+                        self._do_player_attack(self.move_buttons[idx][0])
+                        return None
                     # Click anywhere else closes move menu
                     self.show_moves = False
                     return None
 
                 # Switch menu is open
                 if self.show_switch:
-                    for i, btn in self.switch_buttons:
-                        if btn.collidepoint(event.pos):
-                            if self.phase == self.PHASE_FORCED_SWITCH:
-                                # Forced switch: just switch, no opponent counter
-                                self.player_index = i
-                                self.player = self.player_team[i]
-                                self.combat = Combat(
-                                    self.player, self.opponent, self.game.type_chart
+                    i = self.switch_grid.hit(event.pos)
+                    if i is not None:
+                        if self.phase == self.PHASE_FORCED_SWITCH:
+                            # Forced switch: just switch, no opponent counter
+                            if self.events:
+                                self.events.emit(
+                                    BattleEventBus.SWITCH, side="player",
+                                    forced=True, old=self.player.name,
+                                    new=self.player_team[i].name,
                                 )
-                                self.player_sprite = self._load_sprite(
-                                    self.player.sprite_path
-                                )
-                                self._add_log(f"Go, {self.player.name}!")
-                                self.phase = self.PHASE_PLAYER_TURN
-                            else:
-                                self._do_switch(i)
-                            self.show_switch = False
-                            return None
+                            self.player_index = i
+                            self.player = self.player_team[i]
+                            self.combat = Combat(
+                                self.player, self.opponent,
+                                self.game.type_chart, self.events,
+                            )
+                            self.player_sprite = self._load_sprite(
+                                self.player.sprite_path
+                            )
+                            self._add_log(f"Go, {self.player.name}!")
+                            self.phase = self.PHASE_PLAYER_TURN
+                        else:
+                            self._do_switch(i)
+                        self.show_switch = False
+                        return None
                     # Forced switch: cannot close without choosing
                     if self.phase != self.PHASE_FORCED_SWITCH:
                         self.show_switch = False
@@ -193,10 +268,10 @@ class CombatScreen(BaseScreen):
 
                 # Player turn actions
                 if self.phase == self.PHASE_PLAYER_TURN:
-                    if self.attack_button.collidepoint(event.pos):
+                    if key == "attack":
                         self.show_moves = True
                         self._build_move_buttons()
-                    elif self.switch_button.collidepoint(event.pos):
+                    elif key == "switch":
                         alive = []
                         for i, p in enumerate(self.player_team):
                             if p.is_alive() and i != self.player_index:
@@ -204,17 +279,84 @@ class CombatScreen(BaseScreen):
                         if alive:
                             self.show_switch = True
                             self._build_switch_buttons(alive)
-                    elif self.forfeit_button.collidepoint(event.pos):
+                    elif key == "forfeit":
                         self._add_log("You forfeited the battle!")
                         self.winner = self.opponent.name
                         self._finish_battle()
 
         return None
 
+    def _register_pokedex(self):
+        """Record both teams in the Pokedex (at the end of the battle)."""
+        for p in self.player_team:
+            self.combat.register_to_pokedex(p, self.game.pokedex)
+        for p in self.opponent_team:
+            self.combat.register_to_pokedex(p, self.game.pokedex)
+
+    def _toggle_turbo(self):
+        """Switch between normal speed and TURBO_SPEED (kept for later battles)."""
+        self.speed = 1.0 if self.speed != 1.0 else self.TURBO_SPEED
+        self.game.battle_speed = self.speed
+
+    def _auto_resolve(self):
+        """Finish the battle at once with the headless TeamBattle rules.
+
+        A pending opponent attack is played first. TeamBattle then picks up
+        the battle where it stands and plays it out with the same random
+        generator, damage and XP rules as the screen: the player uses the
+        move with the best expected damage and sends in the next Pokemon
+        after a faint.
+
+        Returns:
+            str: GameState.RESULT.
+        """
+        if self.waiting_for_opponent:
+            self.timeline.clear()
+            self._do_opponent_attack()
+        if self.phase != self.PHASE_FINISHED:
+            for p in self.player_team + self.opponent_team:
+                if not p.moves:
+                    p.moves = p.get_default_moves()
+            before = [(p.name, p.level) for p in self.player_team]
+            battle = TeamBattle(
+                self.player_team, self.opponent_team, self.game.type_chart,
+                self.events, random, self.player_index, self.opponent_index,
+            )
+            for message in battle.resolve():
+                self._add_log(message)
+            self.player_index = battle.player_index
+            self.opponent_index = battle.opponent_index
+            self.player = battle.player
+            self.opponent = battle.opponent
+            self.combat = battle.combat
+            self.phase = self.PHASE_FINISHED
+            if battle.winner == "player":
+                self.winner = self.player.name
+                old_name, old_level = before[self.player_index]
+                self._report_xp(old_name, old_level, battle.xp_gained)
+            elif battle.winner == "opponent":
+                self.winner = self.opponent.name
+                self.xp_message = ""
+            else:
+                # Turn limit reached: resolve() forfeited
+                self.winner = self.opponent.name
+                self.xp_message = "You forfeited - no XP gained."
+        self._register_pokedex()
+        return GameState.RESULT
+
     def _build_move_buttons(self):
-        """Create button rectangles for the player's current Pokemon's moves."""
-        self.move_buttons = []
+        """Create button rectangles for the player's current Pokemon's moves.
+
+        The buttons (and their hit grid, keyed by move index) are kept
+        until the active Pokemon or its moves change.
+        """
         moves = self.player.moves
+        key = (id(self.player), tuple(id(move) for move in moves[:4]))
+        if key == self._move_buttons_key:
+            return
+        self._move_buttons_key = key
+        self.move_buttons = []
+        self.move_grid.clear()
         if not moves:
             return
         btn_w = 235
@@ -229,6 +371,7 @@ class CombatScreen(BaseScreen):
             x = start_x + col * (btn_w + gap_x)
             y = start_y + row * (btn_h + gap_y)
             self.move_buttons.append((move, pygame.Rect(x, y, btn_w, btn_h)))
+            self.move_grid.add(idx, self.move_buttons[-1][1])
 
     def _pick_random_move(self, pokemon):
         """Pick a random move for the AI."""
@@ -237,32 +380,46 @@ class CombatScreen(BaseScreen):
         return random.choice(pokemon.moves)
 
     def _build_switch_buttons(self, alive_list):
-        """Create button rectangles for the switch menu."""
+        """Create button rectangles for the switch menu.
+
+        The buttons (and their hit grid, keyed by team index) are kept
+        while the same Pokemon can come in.
+        """
+        key = tuple(i for i, _p in alive_list)
+        if key == self._switch_buttons_key:
+            return
+        self._switch_buttons_key = key
         self.switch_buttons = []
+        self.switch_grid.clear()
         start_x = 260
         start_y = 164
         gap = 8
         for idx, (i, p) in enumerate(alive_list):
             btn = pygame.Rect(start_x, start_y + idx * (42 + gap), 280, 42)
             self.switch_buttons.append((i, btn))
+            self.switch_grid.add(i, btn)
 
     def _do_switch(self, new_index):
         """Switch player's active Pokemon and schedule opponent attack."""
         old_name = self.player.name
         self.player_index = new_index
         self.player = self.player_team[new_index]
-        self.combat = Combat(self.player, self.opponent, self.game.type_chart)
+        if self.events:
+            self.events.emit(
+                BattleEventBus.SWITCH, side="player", forced=False,
+                old=old_name, new=self.player.name,
+            )
+        self.combat = Combat(
+            self.player, self.opponent, self.game.type_chart, self.events
+        )
         self.player_sprite = self._load_sprite(self.player.sprite_path)
         self._add_log(f"You switched {old_name} for {self.player.name}!")
 
         # Reset player HP animation for new Pokemon
-        self.player_anim = AnimationManager()
+        self.player_anim = AnimationManager(self.timeline)
         self.player_anim.current_hp_ratio = self.player.hp / self.player.max_hp if self.player.max_hp > 0 else 1.0
 
-        # Schedule opponent attack after delay
-        self.phase = self.PHASE_OPPONENT_TURN
-        self.waiting_for_opponent = True
-        self.opponent_attack_timer = pygame.time.get_ticks()
+        self._schedule_opponent_attack()
 
     def _do_player_attack(self, move):
         """Execute player attack, trigger animations, schedule opponent."""
@@ -292,10 +449,13 @@ class CombatScreen(BaseScreen):
                 self.phase = self.PHASE_PLAYER_TURN
                 return
 
-        # Schedule opponent attack after delay
+        self._schedule_opponent_attack()
+
+    def _schedule_opponent_attack(self):
+        """Start the opponent's turn: it attacks after opponent_attack_delay."""
         self.phase = self.PHASE_OPPONENT_TURN
         self.waiting_for_opponent = True
-        self.opponent_attack_timer = pygame.time.get_ticks()
+        self.timeline.wait(self.opponent_attack_delay, self._do_opponent_attack)
 
     def _do_opponent_attack(self):
         """Execute the opponent's attack (called after delay)."""
@@ -339,7 +499,16 @@ class CombatScreen(BaseScreen):
         old_name = self.player.name
         old_level = self.player.level
         total_xp = self.combat.award_xp(self.player, self.opponent_team)
+        self._report_xp(old_name, old_level, total_xp)
 
+    def _report_xp(self, old_name, old_level, total_xp):
+        """Log the XP won, a level up, and record an evolution.
+
+        Args:
+            old_name: Name of the active Pokemon before the XP.
+            old_level: Its level before the XP.
+            total_xp: XP awarded by Combat.award_xp().
+        """
         if total_xp > 0:
 
             self.xp_message = f"{self.player.name} gained {total_xp} XP!"
@@ -349,8 +518,13 @@ class CombatScreen(BaseScreen):
 
             # Track evolution and unlock evolved form
             if self.player.name != old_name:
+                if self.events:
+                    self.events.emit(
+                        BattleEventBus.EVOLUTION, old=old_name,
+                        new=self.player.name, level=self.player.level,
+                    )
                 unlock_msg = self.game.record_evolution()
-                self.game.unlock_pokemon(self.player.name)
+                self.game.unlock_evolution(old_name, self.player.name)
                 if unlock_msg:
                     self._add_log(unlock_msg)
         else:
@@ -373,16 +547,13 @@ class CombatScreen(BaseScreen):
             self.show_switch = True
             self._build_switch_buttons(alive)
 
-    def update(self):
-        """Update animations and opponent attack timer."""
-        self.player_anim.update()
-        self.opponent_anim.update()
+    def update(self, dt):
+        """Advance the animations and the opponent's delayed attack.
 
-        # Handle delayed opponent attack
-        if self.waiting_for_opponent:
-            elapsed = pygame.time.get_ticks() - self.opponent_attack_timer
-            if elapsed >= self.opponent_attack_delay:
-                self._do_opponent_attack()
+        Args:
+            dt: Seconds since the previous frame (scaled by the battle speed).
+        """
+        self.timeline.update(dt * self.speed)
 
     def draw(self, surface):
         """Draw the combat interface."""
@@ -405,7 +576,7 @@ class CombatScreen(BaseScreen):
         self._draw_team_balls(surface, self.opponent_team, 652, 15)
 
         # VS label
-        vs_surf = self.font_name.render("VS", True, Constants.RED)
+        vs_surf = self._labels["vs"]
         surface.blit(
             vs_surf,
             (Constants.SCREEN_WIDTH // 2 - vs_surf.get_width() // 2, 170),
@@ -428,8 +599,12 @@ class CombatScreen(BaseScreen):
             pygame.Rect(20, log_y, 760, 110),
             border_radius=6,
         )
-        for i, msg in enumerate(self.log_messages):
-            msg_surf = self.font_log.render(msg, True, Constants.BLACK)
+        if self._log_surfaces is None:
+            self._log_surfaces = [
+                self.font_log.render(msg, True, Constants.BLACK)
+                for msg in self.log_messages
+            ]
+        for i, msg_surf in enumerate(self._log_surfaces):
             surface.blit(msg_surf, (32, log_y + 8 + i * 20))
 
         # Buttons
@@ -438,13 +613,13 @@ class CombatScreen(BaseScreen):
                 surface, Constants.BLUE, self.continue_button,
                 border_radius=Constants.BUTTON_RADIUS,
             )
-            btn_label = self.font_button.render("Continue", True, Constants.WHITE)
+            btn_label = self._labels["continue"]
             surface.blit(btn_label, btn_label.get_rect(center=self.continue_button.center))
         else:
             color = Constants.RED if self.phase == self.PHASE_PLAYER_TURN else Constants.GRAY
             pygame.draw.rect(surface, color, self.attack_button,
                              border_radius=Constants.BUTTON_RADIUS)
-            atk_label = self.font_button.render("Attack!", True, Constants.WHITE)
+            atk_label = self._labels["attack"]
             surface.blit(atk_label, atk_label.get_rect(center=self.attack_button.center))
 
             has_alive = False
@@ -455,21 +630,28 @@ class CombatScreen(BaseScreen):
             sw_color = Constants.BLUE if has_alive else Constants.GRAY
             pygame.draw.rect(surface, sw_color, self.switch_button,
                              border_radius=Constants.BUTTON_RADIUS)
-            sw_label = self.font_button.render("Switch", True, Constants.WHITE)
+            sw_label = self._labels["switch"]
             surface.blit(sw_label, sw_label.get_rect(center=self.switch_button.center))
 
             pygame.draw.rect(surface, Constants.DARK_GRAY, self.forfeit_button,
                              border_radius=Constants.BUTTON_RADIUS)
-            ff_label = self.font_button.render("Forfeit", True, Constants.WHITE)
+            ff_label = self._labels["forfeit"]
             surface.blit(ff_label, ff_label.get_rect(center=self.forfeit_button.center))
 
+            pygame.draw.rect(surface, Constants.DARK_GRAY, self.auto_button,
+                             border_radius=Constants.BUTTON_RADIUS)
+            auto_label = self._labels["auto"]
+            surface.blit(auto_label, auto_label.get_rect(center=self.auto_button.center))
+
+            turbo = self.speed != 1.0
+            pygame.draw.rect(surface, Constants.RED if turbo else Constants.DARK_GRAY,
+                             self.turbo_button, border_radius=Constants.BUTTON_RADIUS)
+            turbo_label = self._labels["turbo_on" if turbo else "turbo_off"]
+            surface.blit(turbo_label, turbo_label.get_rect(center=self.turbo_button.center))
+
         # Move selection overlay
         if self.show_moves:
-            overlay = pygame.Surface(
-                (Constants.SCREEN_WIDTH, Constants.SCREEN_HEIGHT), pygame.SRCALPHA
-            )
-            overlay.fill((0, 0, 0, 120))
-            surface.blit(overlay, (0, 0))
+            surface.blit(self._dim_overlay, (0, 0))
 
             title = self.font_name.render("Choose a move:", True, Constants.WHITE)
             surface.blit(title, (Constants.SCREEN_WIDTH // 2 - title.get_width() // 2, 220))
@@ -483,11 +665,7 @@ class CombatScreen(BaseScreen):
 
         # Switch menu overlay
         if self.show_switch:
-            overlay = pygame.Surface(
-                (Constants.SCREEN_WIDTH, Constants.SCREEN_HEIGHT), pygame.SRCALPHA
-            )
-            overlay.fill((0, 0, 0, 120))
-            surface.blit(overlay, (0, 0))
+            surface.blit(self._dim_overlay, (0, 0))
 
             title = self.font_name.render("Switch to:", True, Constants.WHITE)
             surface.blit(title, (Constants.SCREEN_WIDTH // 2 - title.get_width() // 2, 134))
@@ -506,9 +684,26 @@ class CombatScreen(BaseScreen):
         ]:
             flash_color = anim.get_flash_color()
             if flash_color:
-                flash_surf = pygame.Surface((128, 128), pygame.SRCALPHA)
-                flash_surf.fill(flash_color)
-                surface.blit(flash_surf, (base_x + dx, base_y + dy))
+                surface.blit(self._flash_surface(flash_color), (base_x + dx, base_y + dy))
+
+    def _flash_surface(self, flash_color):
+        """Return the pre-tinted flash surface for a color, at the given alpha.
+
+        Args:
+            flash_color: (R, G, B, alpha) from AnimationManager.get_flash_color().
+
+        Returns:
+            pygame.Surface: 128x128 surface filled once with the color;
+                only its surface alpha changes between frames.
+        """
+        r, g, b, alpha = flash_color
+        flash_surf = self._flash_surfaces.get((r, g, b))
+        if flash_surf is None:
+            flash_surf = pygame.Surface((128, 128))
+            flash_surf.fill((r, g, b))
+            self._flash_surfaces[(r, g, b)] = flash_surf
+        flash_surf.set_alpha(alpha)
+        return flash_surf
 
     def _draw_team_balls(self, surface, team, x, y):
         """Draw pokeball indicators for a team (filled = alive, empty = KO)."""
@@ -534,21 +729,8 @@ class CombatScreen(BaseScreen):
             placeholder = self.font_stat.render("?", True, Constants.DARK_GRAY)
             surface.blit(placeholder, (sx + 56, sy + 52))
 
-        # Info plate background
-        pygame.draw.rect(surface, Constants.LIGHT_GRAY, info_rect, border_radius=8)
-
-        ix = info_rect.x + 12
-        iy = info_rect.y + 8
-
-        # Name
-        label = " (YOU)" if is_player else " (FOE)"
-        name_surf = self.font_name.render(pokemon.name + label, True, Constants.BLACK)
-        surface.blit(name_surf, (ix, iy))
-
-        # HP bar
-        bar_y = iy + 28
-        bar_width = 160
-        bar_height = 16
+        # Info plate (cached), then the HP bar fill, which animates
+        surface.blit(self._panel_surface(pokemon, info_rect, is_player), info_rect.topleft)
         if anim and anim.animating_hp:
             hp_ratio = anim.current_hp_ratio
         else:
@@ -559,26 +741,71 @@ class CombatScreen(BaseScreen):
             bar_color = Constants.HP_YELLOW
         else:
             bar_color = Constants.HP_RED
-
-        pygame.draw.rect(
-            surface, Constants.GRAY,
-            pygame.Rect(ix, bar_y, bar_width, bar_height),
-            border_radius=4,
-        )
         if hp_ratio > 0:
             pygame.draw.rect(
                 surface, bar_color,
-                pygame.Rect(ix, bar_y, int(bar_width * hp_ratio), bar_height),
+                pygame.Rect(
+                    info_rect.x + self.PANEL_PADDING_X, info_rect.y + self.HP_BAR_Y,
+                    int(self.HP_BAR_WIDTH * hp_ratio), self.HP_BAR_HEIGHT,
+                ),
                 border_radius=4,
             )
+
+    def _panel_surface(self, pokemon, info_rect, is_player):
+        """Return the info plate of a side, rebuilt only when it changes.
+
+        The plate holds everything but the HP bar fill: background, name,
+        bar background, HP text, type badges, stats and XP. It is keyed on
+        the Pokemon shown and the values it displays.
+
+        Args:
+            pokemon: The active Pokemon of that side.
+            info_rect: Plate position and size.
+            is_player: True for the player's plate (adds the XP line).
+
+        Returns:
+            pygame.Surface: The plate (with alpha), to blit at info_rect.
+        """
+        key = (
+            id(pokemon), pokemon.name, pokemon.hp, pokemon.max_hp,
+            pokemon.attack, pokemon.defense, pokemon.level, pokemon.xp,
+            pokemon.xp_to_next_level, tuple(pokemon.types),
+        )
+        cached = self._panel_cache.get(is_player)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        # The XP line runs a few pixels past the plate: leave it room
+        panel = pygame.Surface(
+            (info_rect.width, info_rect.height + self.PANEL_OVERFLOW), pygame.SRCALPHA
+        )
+        pygame.draw.rect(
+            panel, Constants.LIGHT_GRAY, pygame.Rect((0, 0), info_rect.size),
+            border_radius=8,
+        )
+        ix = self.PANEL_PADDING_X
+        iy = 8
+
+        # Name
+        label = " (YOU)" if is_player else " (FOE)"
+        name_surf = self.font_name.render(pokemon.name + label, True, Constants.BLACK)
+        panel.blit(name_surf, (ix, iy))
+
+        # HP bar background and text
+        bar_y = self.HP_BAR_Y
+        pygame.draw.rect(
+            panel, Constants.GRAY,
+            pygame.Rect(ix, bar_y, self.HP_BAR_WIDTH, self.HP_BAR_HEIGHT),
+            border_radius=4,
+        )
         hp_text = f"{pokemon.hp}/{pokemon.max_hp}"
         hp_surf = self.font_stat.render(hp_text, True, Constants.BLACK)
-        surface.blit(hp_surf, (ix + bar_width + 8, bar_y - 1))
+        panel.blit(hp_surf, (ix + self.HP_BAR_WIDTH + 8, bar_y - 1))
 
         # Type badges
         type_y = bar_y + 22
         self.draw_type_badges(
-            surface, self.font_stat, pokemon.types,
+            panel, self.font_stat, pokemon.types,
             ix, type_y, padding=4, pad_inner=12, radius=4,
         )
 
@@ -586,11 +813,14 @@ class CombatScreen(BaseScreen):
         stat_y = type_y + 22
         stat_text = f"ATK:{pokemon.attack}  DEF:{pokemon.defense}  Lv.{pokemon.level}"
         stat_surf = self.font_stat.render(stat_text, True, Constants.DARK_GRAY)
-        surface.blit(stat_surf, (ix, stat_y))
+        panel.blit(stat_surf, (ix, stat_y))
 
         # XP (player only)
         if is_player:
             xp_y = stat_y + 18
             xp_text = f"XP:{pokemon.xp}/{pokemon.xp_to_next_level}"
             xp_surf = self.font_stat.render(xp_text, True, Constants.DARK_GRAY)
-            surface.blit(xp_surf, (ix, xp_y))
+            panel.blit(xp_surf, (ix, xp_y))
+
+        self._panel_cache[is_player] = (key, panel)
+        return panel
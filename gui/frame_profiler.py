@@ -0,0 +1,269 @@
+"""Frame profiler module -- opt-in per-phase frame timing and overlay."""
+
+import collections
+import csv
+import time
+
+import pygame
+
+from gui.constants import Constants
+
+
+class FrameProfiler:
+    """Times each phase of the main loop, per screen class.
+
+    The main loop calls begin_frame() at the top of every frame and lap()
+    after each phase (events, handle_events, update, draw, flip). Frame
+    times are kept twice:
+
+    - a rolling window (the last WINDOW frames) used by the overlay, so
+      p50/p95/p99 follow what is on screen right now;
+    - a bucketed histogram (BUCKET_MS wide buckets) per screen class for the
+      whole session, so the CSV percentiles cost O(buckets) memory no matter
+      how long the game ran.
+
+    Profiling is opt-in: main.py only creates a profiler with --profile (or
+    the POKEMON_PROFILE environment variable), and every call site is
+    guarded by ``if profiler is not None``, so a normal run pays nothing.
+
+    Example:
+        profiler = FrameProfiler()
+        profiler.register_cache("sprites", AssetCache.stats)
+        profiler.begin_frame(type(current_screen).__name__)
+        ...
+        profiler.lap("draw")
+        ...
+        profiler.end_frame()
+        profiler.write_csv("profile_frames.csv")
+    """
+
+    PHASES = ("events", "handle_events", "update", "draw", "overlay", "flip")
+    WINDOW = 120
+    BUCKET_MS = 0.25
+    OVERLAY_REFRESH = 15
+    TOGGLE_KEY = pygame.K_F3
+
+    def __init__(self):
+        """Create an empty profiler with the overlay hidden."""
+        self.overlay_visible = False
+        self._screen = None
+        self._frame_start = 0.0
+        self._mark = 0.0
+        self._phase_times = {}
+        self._window = collections.deque(maxlen=self.WINDOW)
+        self._window_phases = collections.deque(maxlen=self.WINDOW)
+        self._stats = {}
+        self._caches = []
+        self._font = None
+        self._overlay = None
+        self._frames_since_refresh = 0
+
+    def register_cache(self, name, stats_fn):
+        """Show a cache hit rate on the overlay.
+
+        Args:
+            name: Label shown on the overlay.
+            stats_fn: Callable returning (hits, misses).
+        """
+        self._caches.append((name, stats_fn))
+
+    def handle_event(self, event):
+        """Toggle the overlay on TOGGLE_KEY.
+
+        Args:
+            event: A pygame event.
+        """
+        if event.type == pygame.KEYDOWN and event.key == self.TOGGLE_KEY:
+            self.overlay_visible = not self.overlay_visible
+            self._frames_since_refresh = self.OVERLAY_REFRESH
+
+    def begin_frame(self, screen_name):
+        """Start timing a frame.
+
+        Args:
+            screen_name: Name of the active screen class.
+        """
+        self._screen = screen_name
+        self._phase_times = {}
+        self._frame_start = time.perf_counter()
+        self._mark = self._frame_start
+
+    def lap(self, phase):
+        """Close a phase: time elapsed since the previous lap.
+
+        Args:
+            phase: Phase name (one of PHASES).
+        """
+        now = time.perf_counter()
+        self._phase_times[phase] = (now - self._mark) * 1000.0
+        self._mark = now
+
+    def end_frame(self):
+        """Finish the frame and fold its timings into the statistics."""
+        frame_ms = (self._mark - self._frame_start) * 1000.0
+        self._window.append(frame_ms)
+        self._window_phases.append(self._phase_times)
+
+        stats = self._stats.get(self._screen)
+        if stats is None:
+            stats = {"frames": 0, "total": 0.0, "max": 0.0,
+                     "phases": {}, "buckets": {}}
+            self._stats[self._screen] = stats
+        stats["frames"] += 1
+        stats["total"] += frame_ms
+        if frame_ms > stats["max"]:
+            stats["max"] = frame_ms
+        bucket = int(frame_ms / self.BUCKET_MS)
+        stats["buckets"][bucket] = stats["buckets"].get(bucket, 0) + 1
+        phases = stats["phases"]
+        for phase, ms in self._phase_times.items():
+            phases[phase] = phases.get(phase, 0.0) + ms
+
+    def _window_percentiles(self):
+        """Return (p50, p95, p99) of the rolling window in ms."""
+        ordered = sorted(self._window)
+        if not ordered:
+            return 0.0, 0.0, 0.0
+        last = len(ordered) - 1
+        return (
+            ordered[int(last * 0.50)],
+            ordered[int(last * 0.95)],
+            ordered[int(last * 0.99)],
+        )
+
+    def _bucket_percentile(self, stats, fraction):
+        """Return a percentile (ms) from a session histogram.
+
+        Args:
+            stats: Per-screen statistics dict.
+            fraction: Percentile as a fraction (0.95 for p95).
+
+        Returns:
+            float: Upper edge of the bucket holding the percentile
+                (capped at the observed maximum).
+        """
+        target = fraction * stats["frames"]
+        seen = 0
+        for bucket in sorted(stats["buckets"]):
+            seen += stats["buckets"][bucket]
+            if seen >= target:
+                return round(min((bucket + 1) * self.BUCKET_MS, stats["max"]), 3)
+        return round(stats["max"], 3)
+
+    def _slowest_phase(self):
+        """Return (phase, mean ms) of the costliest phase in the window."""
+        totals = {}
+        for phases in self._window_phases:
+            for phase, ms in phases.items():
+                totals[phase] = totals.get(phase, 0.0) + ms
+        if not totals:
+            return None, 0.0
+        # flip includes the clock.tick sleep, so it is not a "cost"
+        totals.pop("flip", None)
+        if not totals:
+            return None, 0.0
+        phase = max(totals, key=totals.get)
+        return phase, totals[phase] / len(self._window_phases)
+
+    def draw_overlay(self, surface, fps):
+        """Draw the overlay if visible.
+
+        The panel is rebuilt every OVERLAY_REFRESH frames only; in between,
+        the same surface is blitted again.
+
+        Args:
+            surface: Target surface.
+            fps: Current FPS (clock.get_fps()).
+        """
+        if not self.overlay_visible:
+            return
+        self._frames_since_refresh += 1
+        if self._frames_since_refresh >= self.OVERLAY_REFRESH:
+            self._frames_since_refresh = 0
+            self._overlay = self._render_panel(fps)
+        surface.blit(self._overlay, (4, 4))
+
+    def _render_panel(self, fps):
+        """Render the overlay panel.
+
+        Args:
+            fps: Current FPS.
+
+        Returns:
+            pygame.Surface: Translucent panel with one text line per stat.
+        """
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+        p50, p95, p99 = self._window_percentiles()
+        phase, phase_ms = self._slowest_phase()
+        texts = [
+            f"{self._screen}  FPS {fps:.0f}",
+            f"frame p50 {p50:.1f}  p95 {p95:.1f}  p99 {p99:.1f} ms",
+            f"slowest: {phase} {phase_ms:.2f} ms" if phase else "slowest: -",
+        ]
+        for name, stats_fn in self._caches:
+            hits, misses = stats_fn()
+            total = hits + misses
+            rate = 100.0 * hits / total if total else 0.0
+            texts.append(f"{name}: {rate:.0f}% hit ({hits}/{total})")
+        lines = []
+        width = 0
+        for text in texts:
+            line = self._font.render(text, True, Constants.WHITE)
+            lines.append(line)
+            width = max(width, line.get_width())
+        panel = pygame.Surface((width + 12, 18 * len(lines) + 8), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        y = 4
+        for line in lines:
+            panel.blit(line, (6, y))
+            y += 18
+        return panel
+
+    def summary(self):
+        """Return per-screen session statistics.
+
+        Returns:
+            list[dict]: One row per screen class with frames, mean/p50/p95/
+                p99/max frame time and the mean time of each phase (ms).
+        """
+        rows = []
+        for screen in sorted(self._stats):
+            stats = self._stats[screen]
+            frames = stats["frames"]
+            row = {
+                "screen": screen,
+                "frames": frames,
+                "mean_ms": round(stats["total"] / frames, 3),
+                "p50_ms": self._bucket_percentile(stats, 0.50),
+                "p95_ms": self._bucket_percentile(stats, 0.95),
+                "p99_ms": self._bucket_percentile(stats, 0.99),
+                "max_ms": round(stats["max"], 3),
+            }
+            for phase in self.PHASES:
+                total = stats["phases"].get(phase, 0.0)
+                row[f"{phase}_ms"] = round(total / frames, 3)
+            rows.append(row)
+        return rows
+
+    def write_csv(self, path):
+        """Write summary() to a CSV file.
+
+        Args:
+            path: Output file path.
+
+        Returns:
+            bool: True if written, False on I/O error.
+        """
+        rows = self.summary()
+        if not rows:
+            return False
+        try:
+            with open(path, "w", encoding="utf-8", newline="") as file:
+                writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+                writer.writeheader()
+                writer.writerows(rows)
+        except OSError as e:
+            print(f"[WARN] Could not write frame profile: {e}")
+            return False
+        return True
@@ -0,0 +1,119 @@
+"""Hit grid module -- finds the clickable region under the mouse."""
+
+import pygame
+
+
+class HitGrid:
+    """Index of clickable rectangles, bucketed in a grid of square cells.
+
+    Screens register their buttons once (a key and a pygame.Rect), then ask
+    which key is under a click or the mouse with hit(pos). Each rectangle
+    is stored in every cell it overlaps, so a lookup only tests the few
+    rectangles of one cell instead of every button of the screen: O(1) per
+    event, whatever the number of buttons or cards.
+
+    Where rectangles overlap, the one added last wins (it is drawn on top).
+    Scrolled content (card grids) is registered in content coordinates
+    and queried with the scroll offset added to the position.
+
+    Example:
+        hits = HitGrid()
+        hits.add("attack", pygame.Rect(155, 540, 150, 45))
+        hits.add("forfeit", pygame.Rect(495, 540, 150, 45))
+        hits.hit((200, 560))     # "attack"
+        hits.hit((10, 10))       # None
+    """
+
+    CELL_SIZE = 64
+
+    def __init__(self, cell_size=CELL_SIZE):
+        """Create an empty index.
+
+        Args:
+            cell_size: Side of a grid cell in pixels.
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self._rects = {}
+        # (column, row) -> keys overlapping the cell, in the order added
+        self._cells = {}
+
+    def _cells_of(self, rect):
+        """Yield the (column, row) cells a rectangle overlaps."""
+        size = self.cell_size
+        for col in range(rect.left // size, (rect.right - 1) // size + 1):
+            for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield (col, row)
+
+    def add(self, key, rect):
+        """Register (or move) a clickable region.
+
+        Args:
+            key: Hashable name returned by hit() (button name, index...).
+            rect: pygame.Rect (or (x, y, w, h)) of the region.
+
+        Returns:
+            pygame.Rect: The stored rectangle.
+        """
+        if key in self._rects:
+            self.remove(key)
+        rect = pygame.Rect(rect)
+        self._rects[key] = rect
+        if rect.width > 0 and rect.height > 0:
+            for cell in self._cells_of(rect):
+                self._cells.setdefault(cell, []).append(key)
+        return rect
+
+    def remove(self, key):
+        """Unregister a region (no-op if unknown).
+
+        Args:
+            key: Key given to add().
+        """
+        rect = self._rects.pop(key, None)
+        if rect is None:
+            return
+        if rect.width > 0 and rect.height > 0:
+            for cell in self._cells_of(rect):
+                bucket = self._cells[cell]
+                bucket.remove(key)
+                if not bucket:
+                    del self._cells[cell]
+
+    def clear(self):
+        """Unregister every region."""
+        self._rects = {}
+        self._cells = {}
+
+    def rect(self, key):
+        """Return the rectangle of a key, or None if not registered."""
+        return self._rects.get(key)
+
+    def hit(self, pos, offset=(0, 0)):
+        """Return the key of the top-most region containing a point.
+
+        Args:
+            pos: (x, y) point, usually event.pos.
+            offset: (dx, dy) added to the point first (e.g. (0, scroll)).
+
+        Returns:
+            The key, or None if no region contains the point.
+        """
+        x = pos[0] + offset[0]
+        y = pos[1] + offset[1]
+        bucket = self._cells.get((x // self.cell_size, y // self.cell_size))
+        if not bucket:
+            return None
+        for key in reversed(bucket):
+            if self._rects[key].collidepoint(x, y):
+                return key
+        return None
+
+    def __contains__(self, key):
+        """Return True if a key is registered."""
+        return key in self._rects
+
+    def __len__(self):
+        """Return the number of registered regions."""
+        return len(self._rects)
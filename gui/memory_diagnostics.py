@@ -0,0 +1,277 @@
+"""Memory diagnostics module -- opt-in tracemalloc accounting per screen."""
+
+import collections
+import time
+import tracemalloc
+
+import pygame
+
+from gui.constants import Constants
+
+
+class MemoryDiagnostics:
+    """Tracks Python memory growth per screen class with tracemalloc.
+
+    The main loop calls transition() each time it has built a new screen.
+    Each call takes a tracemalloc snapshot and sums it per source line.
+    Snapshots of the same screen class are compared with each other, one
+    full round trip apart (e.g. the menu on each return to it), so the
+    screens' own allocations, freed and rebuilt on every visit, cancel
+    out. What remains is memory that kept growing between two visits: its
+    total is reported per screen class with the source lines that grew
+    the most since the first visit. A class whose growth per visit stays
+    above zero for a long session is the place to look for a leak.
+
+    Registered surface caches (AssetCache.memory) are sampled at every
+    transition, so a cache that keeps growing shows up next to the
+    tracemalloc numbers (pygame pixel buffers are not Python allocations
+    and are invisible to tracemalloc).
+
+    Diagnostics are opt-in: main.py only creates them with --memory (or
+    the POKEMON_MEMORY environment variable), since tracing slows every
+    allocation down.
+
+    Example:
+        memory = MemoryDiagnostics()
+        memory.register_surfaces("images", AssetCache.memory)
+        memory.transition("MenuScreen")       # after each new screen
+        ...
+        memory.write_summary("memory_report.txt")
+    """
+
+    TOGGLE_KEY = pygame.K_F4
+    # Frames of traceback stored per allocation
+    TRACE_FRAMES = 1
+    # Source lines listed per screen class (largest growth first)
+    TOP_LINES = 10
+    # Visits averaged for the "recent growth per visit" figure
+    RECENT_VISITS = 5
+    # Allocations from these files are tracemalloc's or the import system's
+    IGNORED_FILES = ("<frozen importlib._bootstrap>",
+                     "<frozen importlib._bootstrap_external>",
+                     tracemalloc.__file__, "<unknown>")
+
+    def __init__(self):
+        """Start tracing (if not already on)."""
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start(self.TRACE_FRAMES)
+        self.overlay_visible = False
+        self._filters = [tracemalloc.Filter(False, name) for name in self.IGNORED_FILES]
+        self._filters.append(tracemalloc.Filter(False, __file__))
+        self._start_time = time.time()
+        self._stats = {}
+        self._surface_sources = []
+        self._surface_samples = {}
+        self._transitions = 0
+        self._font = None
+        self._overlay = None
+
+    def _line_totals(self):
+        """Return {"file:line": (bytes, blocks)} of the live allocations.
+
+        Only these per-line totals are kept between transitions, not the
+        snapshots themselves (one entry per line, not per allocation).
+        """
+        snapshot = tracemalloc.take_snapshot().filter_traces(self._filters)
+        totals = {}
+        for stat in snapshot.statistics("lineno"):
+            frame = stat.traceback[0]
+            totals[f"{frame.filename}:{frame.lineno}"] = (stat.size, stat.count)
+        return totals
+
+    def register_surfaces(self, name, memory_fn):
+        """Track a surface cache.
+
+        Args:
+            name: Label used in the report and the overlay.
+            memory_fn: Callable returning (surface count, bytes).
+        """
+        self._surface_sources.append((name, memory_fn))
+        # First (count, bytes) sample and the largest byte count seen
+        self._surface_samples[name] = [None, 0]
+
+    def handle_event(self, event):
+        """Toggle the summary overlay on TOGGLE_KEY.
+
+        Args:
+            event: A pygame event.
+        """
+        if event.type == pygame.KEYDOWN and event.key == self.TOGGLE_KEY:
+            self.overlay_visible = not self.overlay_visible
+            self._overlay = None
+
+    def transition(self, screen):
+        """Record the memory in use on entering a screen.
+
+        Call it once the new screen is built (the previous one released).
+
+        Args:
+            screen: Class name of the new screen.
+        """
+        lines = self._line_totals()
+        total = sum(size for size, _count in lines.values())
+        self._transitions += 1
+
+        stats = self._stats.get(screen)
+        if stats is None:
+            stats = {"visits": 0, "first": total, "last": total,
+                     "first_lines": lines,
+                     "recent": collections.deque(maxlen=self.RECENT_VISITS)}
+            self._stats[screen] = stats
+        else:
+            stats["recent"].append(total - stats["last"])
+            stats["last"] = total
+        stats["visits"] += 1
+        stats["last_lines"] = lines
+
+        for name, memory_fn in self._surface_sources:
+            count, size = memory_fn()
+            sample = self._surface_samples[name]
+            if sample[0] is None:
+                sample[0] = (count, size)
+            sample[1] = max(sample[1], size)
+        self._overlay = None
+
+    def _top_lines(self, stats):
+        """Return the lines that grew the most since the first visit.
+
+        Returns:
+            list[tuple]: (where, bytes diff, blocks diff), largest first.
+        """
+        first = stats["first_lines"]
+        grown = []
+        for where, (size, count) in stats["last_lines"].items():
+            old_size, old_count = first.get(where, (0, 0))
+            if size > old_size:
+                grown.append((where, size - old_size, count - old_count))
+        grown.sort(key=lambda row: -row[1])
+        return grown[:self.TOP_LINES]
+
+    def summary(self):
+        """Return the session statistics.
+
+        Returns:
+            dict: traced (current, peak) bytes, transitions, per-screen rows
+                (screen, visits, growth since the first visit, mean growth
+                per visit over the last visits, top lines as (where, bytes
+                diff, blocks diff)) sorted by growth, and per cache the
+                first/last (count, bytes) and the largest byte count seen.
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        screens = []
+        for screen, stats in self._stats.items():
+            recent = stats["recent"]
+            screens.append({
+                "screen": screen,
+                "visits": stats["visits"],
+                "growth": stats["last"] - stats["first"],
+                "recent_mean": sum(recent) // len(recent) if recent else 0,
+                "top": self._top_lines(stats),
+            })
+        screens.sort(key=lambda row: -row["growth"])
+        caches = []
+        for name, memory_fn in self._surface_sources:
+            count, size = memory_fn()
+            first, largest = self._surface_samples[name]
+            if first is None:
+                first = (count, size)
+            largest = max(largest, size)
+            caches.append({"name": name, "first": first, "last": (count, size),
+                           "largest_bytes": largest})
+        return {"current": current, "peak": peak, "transitions": self._transitions,
+                "screens": screens, "caches": caches}
+
+    @staticmethod
+    def _kib(size):
+        """Format a byte count in KiB (signed)."""
+        return f"{size / 1024:+.1f} KiB"
+
+    def write_summary(self, path):
+        """Write summary() as a text report.
+
+        Args:
+            path: Output file path.
+
+        Returns:
+            bool: True if written, False on I/O error.
+        """
+        data = self.summary()
+        minutes = (time.time() - self._start_time) / 60
+        lines = [
+            f"Memory report ({minutes:.1f} min, {data['transitions']} transitions)",
+            f"traced now {data['current'] / 1024:.1f} KiB, peak {data['peak'] / 1024:.1f} KiB",
+            "",
+        ]
+        for cache in data["caches"]:
+            lines.append(
+                f"{cache['name']}: {cache['first'][0]} -> {cache['last'][0]} surfaces, "
+                f"{cache['first'][1] / 1024:.1f} -> {cache['last'][1] / 1024:.1f} KiB "
+                f"(largest {cache['largest_bytes'] / 1024:.1f} KiB)"
+            )
+        for row in data["screens"]:
+            lines.append("")
+            lines.append(
+                f"{row['screen']}: {row['visits']} visits, growth {self._kib(row['growth'])}, "
+                f"recent mean {self._kib(row['recent_mean'])} per visit"
+            )
+            for where, size, count in row["top"]:
+                lines.append(f"  {self._kib(size):>14} {count:+7d} blocks  {where}")
+        try:
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("\n".join(lines) + "\n")
+        except OSError as e:
+            print(f"[WARN] Could not write memory report: {e}")
+            return False
+        return True
+
+    def draw_overlay(self, surface):
+        """Draw the summary panel (bottom left) if visible.
+
+        The panel is rebuilt after a toggle or a transition only.
+
+        Args:
+            surface: Target surface.
+        """
+        if not self.overlay_visible:
+            return
+        if self._overlay is None:
+            self._overlay = self._render_panel()
+        surface.blit(
+            self._overlay, (4, Constants.SCREEN_HEIGHT - self._overlay.get_height() - 4)
+        )
+
+    def _render_panel(self):
+        """Render the overlay panel.
+
+        Returns:
+            pygame.Surface: Translucent panel with one text line per stat.
+        """
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+        data = self.summary()
+        texts = [
+            f"traced {data['current'] / 1024:.0f} KiB  peak {data['peak'] / 1024:.0f} KiB",
+        ]
+        for cache in data["caches"]:
+            count, size = cache["last"]
+            texts.append(f"{cache['name']}: {count} surfaces, {size / 1024:.0f} KiB")
+        for row in data["screens"][:4]:
+            texts.append(
+                f"{row['screen']}: {row['visits']}x {self._kib(row['growth'])}"
+            )
+        lines = [self._font.render(text, True, Constants.WHITE) for text in texts]
+        width = max(line.get_width() for line in lines)
+        panel = pygame.Surface((width + 12, 18 * len(lines) + 8), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        y = 4
+        for line in lines:
+            panel.blit(line, (6, y))
+            y += 18
+        return panel
+
+    def close(self):
+        """Stop tracing (if these diagnostics started it)."""
+        if self._started and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started = False
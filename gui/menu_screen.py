@@ -1,16 +1,23 @@
 """Menu screen module -- main menu with game options."""
 
 import os
+import time
+
 import pygame
 
 from models.game_state import GameState
+from gui.asset_cache import AssetCache
 from gui.base_screen import BaseScreen
 from gui.constants import Constants
+from gui.hit_grid import HitGrid
 
 
 class MenuScreen(BaseScreen):
     """Main menu screen, buttons for all game actions."""
 
+    # Seconds a save/load message stays on screen
+    MESSAGE_DURATION = 2.0
+
     def __init__(self, game):
         """Initialize the menu screen."""
         super().__init__(game)
@@ -20,13 +27,22 @@ class MenuScreen(BaseScreen):
 
         # Load background image
         bg_path = os.path.join("assets", "backgrounds", "main_menu.png")
-        self.background = pygame.image.load(bg_path).convert()
+        self.background = AssetCache.get_image(bg_path, convert=True)
 
         self.save_message = ""
         self.save_message_timer = 0
+        # Set from the save worker thread, consumed in update()
+        self._save_result = None
 
-        self._build_buttons()
+        # Save slot selector (top right), driven by the in-memory slot index
+        self.selected_slot = self.game.slot
+        self.slot_prev_button = pygame.Rect(560, 20, 28, 28)
+        self.slot_next_button = pygame.Rect(752, 20, 28, 28)
+
+        # Hover only changes on MOUSEMOTION; start from the current position
+        self._mouse_pos = pygame.mouse.get_pos()
         self.hover_button = None
+        self._build_buttons()
 
     def _build_buttons(self):
         """Build the button dict with dynamic Y positions based on visibility."""
@@ -37,8 +53,8 @@ class MenuScreen(BaseScreen):
         self.buttons = {}
         self.labels = {}
 
-        # Continuer -- only if a save exists
-        if self.game.has_save():
+        # Continuer -- only if the selected slot holds a save
+        if self.game.slots.has_slot(self.selected_slot):
             self.buttons["continue_game"] = pygame.Rect(
                 center_x, y, Constants.BUTTON_WIDTH, Constants.BUTTON_HEIGHT
             )
@@ -58,7 +74,7 @@ class MenuScreen(BaseScreen):
         y += spacing
 
         # Team Battle -- only if >= 3 available
-        if len(self.game.get_available_pokemon()) >= 3:
+        if self.game.count_available() >= 3:
             self.buttons["team_battle"] = pygame.Rect(
                 center_x, y, Constants.BUTTON_WIDTH, Constants.BUTTON_HEIGHT
             )
@@ -76,40 +92,132 @@ class MenuScreen(BaseScreen):
         )
         self.labels["add_pokemon"] = "Add Pokemon"
 
-    def handle_events(self, events):
-        """Handle mouse clicks on menu buttons."""
-        mouse_pos = pygame.mouse.get_pos()
-        self.hover_button = None
+        # Click and hover lookup: menu buttons plus the slot arrows
+        self.hit_grid = HitGrid()
         for key, rect in self.buttons.items():
-            if rect.collidepoint(mouse_pos):
-                self.hover_button = key
+            self.hit_grid.add(key, rect)
+        self.hit_grid.add("slot_prev", self.slot_prev_button)
+        self.hit_grid.add("slot_next", self.slot_next_button)
+        self._update_hover(self._mouse_pos)
+
+    def _update_hover(self, pos):
+        """Set hover_button to the menu button under a point.
+
+        Args:
+            pos: (x, y) mouse position.
+        """
+        self._mouse_pos = pos
+        key = self.hit_grid.hit(pos)
+        self.hover_button = key if key in self.buttons else None
 
+    def _slot_choices(self):
+        """Return the selectable slots: every saved slot plus one empty slot."""
+        names = []
+        for meta in self.game.list_slots():
+            names.append(meta["name"])
+        if self.game.slot not in names:
+            names.append(self.game.slot)
+        names.append(self.game.slots.next_free_slot())
+        if self.selected_slot not in names:
+            names.append(self.selected_slot)
+        return sorted(set(names))
+
+    def _cycle_slot(self, step):
+        """Select the previous (-1) or next (+1) slot.
+
+        Args:
+            step: Direction to move in the slot list.
+        """
+        choices = self._slot_choices()
+        index = choices.index(self.selected_slot)
+        self.selected_slot = choices[(index + step) % len(choices)]
+        self._build_buttons()
+
+    def _slot_summary(self):
+        """Return a one-line description of the selected slot."""
+        meta = self.game.slots.get(self.selected_slot)
+        if meta is None:
+            return "(empty)"
+        parts = []
+        if meta.get("team_levels"):
+            levels = "/".join(str(lvl) for lvl in meta["team_levels"])
+            parts.append(f"Team Lv {levels}")
+        count = meta.get("pokedex_count")
+        parts.append(f"Dex {count if count is not None else '?'}")
+        parts.append(time.strftime("%Y-%m-%d %H:%M", time.localtime(meta["timestamp"])))
+        return "  ".join(parts)
+
+    def handle_events(self, events):
+        """Handle mouse clicks on menu buttons and hover on mouse motion."""
         for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                self._update_hover(event.pos)
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if "continue_game" in self.buttons and self.buttons["continue_game"].collidepoint(event.pos):
+                key = self.hit_grid.hit(event.pos)
+                if key == "slot_prev":
+                    self._cycle_slot(-1)
+                    return None
+                if key == "slot_next":
+                    self._cycle_slot(1)
+                    return None
+                if key == "continue_game":
+                    if self.selected_slot != self.game.slot:
+                        try:
+                            self.game.load_slot(self.selected_slot)
+                        except (OSError, ValueError) as e:
+                            print(f"[WARN] Could not load slot: {e}")
+                            self.save_message = "Could not load this slot"
+                            self.save_message_timer = self.MESSAGE_DURATION
+                            return None
                     return GameState.SELECTION
-                if self.buttons["new_game"].collidepoint(event.pos):
-                    self.game.new_game()
+                if key == "new_game":
+                    self.game.new_game(slot=self.selected_slot)
                     return GameState.SELECTION
-                if self.buttons["save_game"].collidepoint(event.pos):
-                    self.game.save_game()
-                    self.save_message = "Game saved!"
-                    self.save_message_timer = 120  # ~2s at 60 FPS
-                    self._build_buttons()  # Rebuild to show "Continuer" if first save
+                if key == "save_game":
+                    self.save_message = "Saving..."
+                    self.save_message_timer = 0
+                    if self.selected_slot == self.game.slot:
+                        self.game.save_game(on_complete=self._on_save_complete)
+                    else:
+                        self.game.save_as(
+                            self.selected_slot, on_complete=self._on_save_complete
+                        )
                     return None
-                if "team_battle" in self.buttons and self.buttons["team_battle"].collidepoint(event.pos):
+                if key == "team_battle":
                     return GameState.TEAM_SELECT
-                if self.buttons["pokedex"].collidepoint(event.pos):
+                if key == "pokedex":
                     return GameState.POKEDEX
-                if self.buttons["add_pokemon"].collidepoint(event.pos):
+                if key == "add_pokemon":
                     return GameState.ADD_POKEMON
         return None
 
-    def update(self):
-        """Update save message timer."""
+    def _on_save_complete(self, success):
+        """Save worker callback (runs on the worker thread).
+
+        Args:
+            success: True if the save landed on disk.
+        """
+        self._save_result = success
+
+    def update(self, dt):
+        """Update save message timer and pick up finished saves.
+
+        Args:
+            dt: Seconds since the previous frame.
+        """
+        if self._save_result is not None:
+            if self._save_result:
+                self.save_message = "Game saved!"
+            else:
+                self.save_message = "Save failed!"
+            self._save_result = None
+            self.save_message_timer = self.MESSAGE_DURATION
+            self._build_buttons()  # Rebuild to show "Continue" if first save
+
         if self.save_message_timer > 0:
-            self.save_message_timer -= 1
-            if self.save_message_timer == 0:
+            self.save_message_timer -= dt
+            if self.save_message_timer <= 0:
+                self.save_message_timer = 0
                 self.save_message = ""
 
     def draw(self, surface):
@@ -133,13 +241,25 @@ class MenuScreen(BaseScreen):
             label_rect = label.get_rect(center=rect.center)
             surface.blit(label, label_rect)
 
+        # Save slot selector
+        for rect, arrow in ((self.slot_prev_button, "<"), (self.slot_next_button, ">")):
+            pygame.draw.rect(surface, Constants.DARK_GRAY, rect, border_radius=4)
+            arrow_surf = self.font_button.render(arrow, True, Constants.WHITE)
+            surface.blit(arrow_surf, arrow_surf.get_rect(center=rect.center))
+        slot_label = self.font_small.render(
+            f"Slot: {self.selected_slot}", True, Constants.BLACK
+        )
+        surface.blit(slot_label, slot_label.get_rect(center=(670, 34)))
+        slot_info = self.font_small.render(self._slot_summary(), True, Constants.DARK_GRAY)
+        surface.blit(slot_info, slot_info.get_rect(topright=(780, 54)))
+
         # Save confirmation message
         if self.save_message:
             msg = self.font_button.render(self.save_message, True, Constants.GREEN)
             msg_rect = msg.get_rect(center=(Constants.SCREEN_WIDTH // 2, 170))
             surface.blit(msg, msg_rect)
 
-        count = len(self.game.get_available_pokemon())
+        count = self.game.count_available()
         if count < 2:
             msg = f"Add more Pokemon first ({count}/2 minimum)"
             msg_color = Constants.RED
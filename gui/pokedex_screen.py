@@ -4,6 +4,7 @@ import os
 import pygame
 
 from models.game_state import GameState
+from gui.asset_cache import AssetCache
 from gui.base_screen import BaseScreen
 from gui.constants import Constants
 
@@ -25,7 +26,7 @@ class PokedexScreen(BaseScreen):
 
         # Load background image
         bg_path = os.path.join("assets", "backgrounds", "pokedex_lab.png")
-        self.background = pygame.image.load(bg_path).convert()
+        self.background = AssetCache.get_image(bg_path, convert=True)
 
         self.back_button = pygame.Rect(20, 20, 100, 36)
 
@@ -4,6 +4,7 @@ import os
 import pygame
 
 from models.game_state import GameState
+from gui.asset_cache import AssetCache
 from gui.base_screen import BaseScreen
 from gui.constants import Constants
 
@@ -30,7 +31,7 @@ class ResultScreen(BaseScreen):
 
         # Load background image
         bg_path = os.path.join("assets", "backgrounds", "pokedex_lab.png")
-        self.background = pygame.image.load(bg_path).convert()
+        self.background = AssetCache.get_image(bg_path, convert=True)
 
         self.menu_button = pygame.Rect(
             Constants.SCREEN_WIDTH // 2 - 100,
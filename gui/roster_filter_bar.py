@@ -0,0 +1,194 @@
+"""Roster filter bar module -- name search and filter chips for card grids."""
+
+import pygame
+
+from gui.constants import Constants
+from gui.hit_grid import HitGrid
+from models.type_chart import TypeChart
+
+
+class RosterFilterBar:
+    """Type-to-search box and filter chips above a roster card grid.
+
+    Typing (anywhere on the screen) edits the name search, Backspace
+    deletes a letter and Escape clears every filter. Clicking a chip cycles
+    its value, right click goes back: type, level range, locked state and
+    stat threshold. Each change runs one query on game.roster_index (a few
+    bitset operations, well under a millisecond even for 100k Pokemon) and
+    the screen then draws only the matches on screen, fetched with page().
+
+    Example:
+        bar = RosterFilterBar(game, 40, 62)
+        if bar.handle_event(event):       # filters changed
+            scroll_offset = 0
+        indices = bar.page(first, 20)     # roster indices to draw
+        bar.draw(surface)
+    """
+
+    HEIGHT = 26
+    GAP = 8
+    MAX_TEXT = 20
+    # Chips, left to right, with their width in pixels
+    CHIPS = (("search", 200), ("type", 130), ("level", 110), ("locked", 110), ("stat", 140))
+    TYPES = (None,) + tuple(TypeChart.TYPES)
+    LEVEL_RANGES = (None, (1, 10), (11, 25), (26, 50), (51, 100))
+    LOCK_STATES = (None, False, True)
+    STAT_FILTERS = (
+        None, ("attack", 50), ("attack", 80), ("defense", 50), ("defense", 80),
+        ("max_hp", 50), ("max_hp", 80),
+    )
+    STAT_LABELS = {"max_hp": "HP", "attack": "ATK", "defense": "DEF"}
+
+    def __init__(self, game, x, y):
+        """Create the bar with no filter set.
+
+        Args:
+            game: The Game instance (its roster_index is queried).
+            x: Left edge of the bar.
+            y: Top edge of the bar.
+        """
+        self.game = game
+        self.font = Constants().get_font(18)
+        self.text = ""
+        # Chip -> position in its option tuple
+        self.choices = {"type": 0, "level": 0, "locked": 0, "stat": 0}
+        self.hit_grid = HitGrid()
+        for name, width in self.CHIPS:
+            self.hit_grid.add(name, pygame.Rect(x, y, width, self.HEIGHT))
+            x += width + self.GAP
+        self.matches = 0
+        self.count = 0
+        self._version = None
+        self._labels = None
+        self.refresh()
+
+    def _options(self, chip):
+        """Return the option tuple of a chip."""
+        return {
+            "type": self.TYPES, "level": self.LEVEL_RANGES,
+            "locked": self.LOCK_STATES, "stat": self.STAT_FILTERS,
+        }[chip]
+
+    def value(self, chip):
+        """Return the current option of a chip (None = no filter)."""
+        return self._options(chip)[self.choices[chip]]
+
+    def is_filtered(self):
+        """Return True if the search text or any chip narrows the roster."""
+        return bool(self.text) or any(self.choices.values())
+
+    def handle_event(self, event):
+        """Apply a click on a chip or a key press to the filters.
+
+        Args:
+            event: A pygame event.
+
+        Returns:
+            bool: True if the filters (and matches) changed.
+        """
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button in (1, 3):
+            chip = self.hit_grid.hit(event.pos)
+            if chip is None or chip == "search":
+                return False
+            step = 1 if event.button == 1 else -1
+            self.choices[chip] = (self.choices[chip] + step) % len(self._options(chip))
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_BACKSPACE and self.text:
+                self.text = self.text[:-1]
+            elif event.key == pygame.K_ESCAPE and self.is_filtered():
+                self.text = ""
+                self.choices = dict.fromkeys(self.choices, 0)
+            elif (event.unicode and (event.unicode.isalnum() or event.unicode in " -.'")
+                    and len(self.text) < self.MAX_TEXT):
+                self.text += event.unicode
+            else:
+                return False
+        else:
+            return False
+        self.refresh()
+        return True
+
+    def refresh(self):
+        """Query the roster index with the current filters."""
+        stat = self.value("stat")
+        self.matches = self.game.roster_index.query(
+            self.text,
+            types=[self.value("type")] if self.value("type") else (),
+            level_range=self.value("level"),
+            locked=self.value("locked"),
+            min_stats=dict([stat]) if stat else None,
+        )
+        self.count = self.matches.bit_count()
+        self._version = self.game.roster_version
+        self._labels = None
+
+    def update(self):
+        """Re-run the query if the roster changed since the last one.
+
+        Returns:
+            bool: True if the matches were refreshed.
+        """
+        if self._version == self.game.roster_version:
+            return False
+        self.refresh()
+        return True
+
+    def page(self, start, count):
+        """Return roster indices of matches start..start+count-1.
+
+        Args:
+            start: Position of the first match wanted.
+            count: Number of matches wanted.
+
+        Returns:
+            list[int]: Roster indices, in roster order.
+        """
+        return self.game.roster_index.page(self.matches, start, count)
+
+    def _chip_text(self, chip):
+        """Return the label of a filter chip."""
+        value = self.value(chip)
+        if chip == "type":
+            return f"Type: {value or 'any'}"
+        if chip == "level":
+            return f"Lv {value[0]}-{value[1]}" if value else "Lv any"
+        if chip == "locked":
+            return {None: "All", False: "Unlocked", True: "Locked"}[value]
+        if value is None:
+            return "Stats: any"
+        return f"{self.STAT_LABELS[value[0]]} >= {value[1]}"
+
+    def _render_labels(self):
+        """Render the chip labels (after a change only)."""
+        labels = {}
+        if self.text:
+            labels["search"] = self.font.render(self.text + "|", True, Constants.BLACK)
+        else:
+            labels["search"] = self.font.render("Type to search", True, Constants.GRAY)
+        labels["count"] = self.font.render(str(self.count), True, Constants.DARK_GRAY)
+        for chip in self.choices:
+            color = Constants.WHITE if self.choices[chip] else Constants.BLACK
+            labels[chip] = self.font.render(self._chip_text(chip), True, color)
+        return labels
+
+    def draw(self, surface):
+        """Draw the search box and the chips.
+
+        Args:
+            surface: Target surface.
+        """
+        if self._labels is None:
+            self._labels = self._render_labels()
+        for chip, _width in self.CHIPS:
+            rect = self.hit_grid.rect(chip)
+            if chip == "search":
+                pygame.draw.rect(surface, Constants.WHITE, rect, border_radius=4)
+                pygame.draw.rect(surface, Constants.DARK_GRAY, rect, width=2, border_radius=4)
+                surface.blit(self._labels["search"], self._labels["search"].get_rect(
+                    midleft=(rect.x + 8, rect.centery)))
+                surface.blit(self._labels["count"], self._labels["count"].get_rect(
+                    midright=(rect.right - 8, rect.centery)))
+                continue
+            color = Constants.BLUE if self.choices[chip] else Constants.LIGHT_GRAY
+            pygame.draw.rect(surface, color, rect, border_radius=Constants.BUTTON_RADIUS)
+            surface.blit(self._labels[chip], self._labels[chip].get_rect(center=rect.center))
@@ -4,19 +4,27 @@ import os
 import pygame
 
 from models.game_state import GameState
+from gui.asset_cache import AssetCache
 from gui.base_screen import BaseScreen
 from gui.constants import Constants
+from gui.hit_grid import HitGrid
+from gui.roster_filter_bar import RosterFilterBar
 
 
 class SelectionScreen(BaseScreen):
     """Screen for choosing which Pokemon to battle with.
 
-    Displays available Pokemon in a scrollable grid with sprites and stats.
+    Displays the Pokemon matching the search and filters of the filter bar
+    in a scrollable grid with sprites and stats. Only the cards on screen
+    are laid out and drawn.
     """
 
     COLS = 4
     CARD_START_X = 40
-    CARD_START_Y = 80
+    CARD_START_Y = 100
+    FILTER_BAR_Y = 62
+    # Cards are clipped above this line (below the filter bar)
+    GRID_TOP = 92
 
     def __init__(self, game):
         """Initialize the selection screen.
@@ -28,7 +36,7 @@ class SelectionScreen(BaseScreen):
 
         # Load background image
         bg_path = os.path.join("assets", "backgrounds", "battle_arena.png")
-        self.background = pygame.image.load(bg_path).convert()
+        self.background = AssetCache.get_image(bg_path, convert=True)
 
         self.font_title = self.constants.get_font(32, bold=True)
         self.font_name = self.constants.get_font(18, bold=True)
@@ -37,7 +45,7 @@ class SelectionScreen(BaseScreen):
         self.selected_index = None
         self.scroll_offset = 0
         self.sprites = {}
-        self._load_sprites()
+        self.filter_bar = RosterFilterBar(game, self.CARD_START_X, self.FILTER_BAR_Y)
 
         # Back button
         self.back_button = pygame.Rect(20, 20, 100, 36)
@@ -45,6 +53,40 @@ class SelectionScreen(BaseScreen):
         self.confirm_button = pygame.Rect(
             Constants.SCREEN_WIDTH // 2 - 80, Constants.SCREEN_HEIGHT - 60, 160, 40
         )
+        self.hit_grid = HitGrid()
+        self.hit_grid.add("back", self.back_button)
+        self.hit_grid.add("confirm", self.confirm_button)
+        self._refresh_cards()
+
+    def _refresh_cards(self):
+        """Lay out the cards of the matches visible at the current scroll.
+
+        Cards are placed by their position among the matches. Only the rows
+        on screen are fetched from the filter bar and registered, in
+        unscrolled coordinates, for click lookup.
+        """
+        cols = self.COLS
+        row_h = Constants.CARD_HEIGHT + Constants.CARD_PADDING
+        first_row = self.scroll_offset // row_h
+        rows = (Constants.SCREEN_HEIGHT - self.GRID_TOP) // row_h + 2
+        self.card_grid = HitGrid()
+        self._cards = []
+        first = first_row * cols
+        for k, i in enumerate(self.filter_bar.page(first, rows * cols), first):
+            x = self.CARD_START_X + (k % cols) * (Constants.CARD_WIDTH + Constants.CARD_PADDING)
+            y = self.CARD_START_Y + (k // cols) * row_h
+            rect = self.card_grid.add(
+                i, pygame.Rect(x, y, Constants.CARD_WIDTH, Constants.CARD_HEIGHT)
+            )
+            self._cards.append((rect, i, self.game.get_pokemon(i)))
+
+    def _clamp_scroll(self):
+        """Keep the scroll offset within the rows of matches."""
+        cols = self.COLS
+        rows = (self.filter_bar.count + cols - 1) // cols
+        total_h = rows * (Constants.CARD_HEIGHT + Constants.CARD_PADDING)
+        max_scroll = max(0, total_h - Constants.SCREEN_HEIGHT + 140)
+        self.scroll_offset = max(0, min(self.scroll_offset, max_scroll))
 
     def handle_events(self, events):
         """Handle clicks on Pokemon cards, back, and confirm buttons.
@@ -53,42 +95,44 @@ class SelectionScreen(BaseScreen):
             GameState or None: COMBAT if confirmed, MENU if back, else None.
         """
         for event in events:
+            if self.filter_bar.handle_event(event):
+                self.scroll_offset = 0
+                self._refresh_cards()
+                continue
+
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                key = self.hit_grid.hit(event.pos)
                 # Back button
-                if self.back_button.collidepoint(event.pos):
+                if key == "back":
                     return GameState.MENU
 
                 # Confirm button
-                if self.selected_index is not None:
-                    if self.confirm_button.collidepoint(event.pos):
-                        return GameState.COMBAT
+                if key == "confirm" and self.selected_index is not None:
+                    return GameState.COMBAT
 
                 # Card click (only unlocked Pokemon can be selected)
-                pokemon_list = self.game.get_all_pokemon()
-                cols = self.COLS
-                start_x = self.CARD_START_X
-                start_y = self.CARD_START_Y - self.scroll_offset
-                for i, _pokemon in enumerate(pokemon_list):
-                    col = i % cols
-                    row = i // cols
-                    x = start_x + col * (Constants.CARD_WIDTH + Constants.CARD_PADDING)
-                    y = start_y + row * (Constants.CARD_HEIGHT + Constants.CARD_PADDING)
-                    card_rect = pygame.Rect(
-                        x, y, Constants.CARD_WIDTH, Constants.CARD_HEIGHT
-                    )
-                    if card_rect.collidepoint(event.pos) and not _pokemon.locked:
-                        self.selected_index = i
+                i = None
+                if event.pos[1] >= self.GRID_TOP:
+                    i = self.card_grid.hit(event.pos, (0, self.scroll_offset))
+                if i is not None and not self.game.get_pokemon(i).locked:
+                    self.selected_index = i
 
             if event.type == pygame.MOUSEWHEEL:
                 self.scroll_offset -= event.y * 30
-                pokemon_list = self.game.get_all_pokemon()
-                cols = self.COLS
-                rows = (len(pokemon_list) + cols - 1) // cols
-                total_h = rows * (Constants.CARD_HEIGHT + Constants.CARD_PADDING)
-                max_scroll = max(0, total_h - Constants.SCREEN_HEIGHT + 120)
-                self.scroll_offset = max(0, min(self.scroll_offset, max_scroll))
+                self._clamp_scroll()
+                self._refresh_cards()
         return None
 
+    def update(self, dt):
+        """Re-run the filters if the roster changed (unlock, import...).
+
+        Args:
+            dt: Seconds since the previous frame (unused).
+        """
+        if self.filter_bar.update():
+            self._clamp_scroll()
+            self._refresh_cards()
+
     def draw(self, surface):
         """Draw the Pokemon selection grid."""
         surface.blit(self.background, (0, 0))
@@ -105,21 +149,13 @@ class SelectionScreen(BaseScreen):
         back_label = self.font_stat.render("< Back", True, Constants.WHITE)
         surface.blit(back_label, back_label.get_rect(center=self.back_button.center))
 
-        # Pokemon cards (includes locked, shown greyed out)
-        pokemon_list = self.game.get_all_pokemon()
-        cols = self.COLS
-        start_x = self.CARD_START_X
-        start_y = self.CARD_START_Y - self.scroll_offset
-
-        for i, pokemon in enumerate(pokemon_list):
-            col = i % cols
-            row = i // cols
-            x = start_x + col * (Constants.CARD_WIDTH + Constants.CARD_PADDING)
-            y = start_y + row * (Constants.CARD_HEIGHT + Constants.CARD_PADDING)
-
-            # Skip cards above visible area
-            if y + Constants.CARD_HEIGHT < 70 or y > Constants.SCREEN_HEIGHT:
-                continue
+        # Matching Pokemon cards (includes locked, shown greyed out)
+        surface.set_clip(pygame.Rect(
+            0, self.GRID_TOP, Constants.SCREEN_WIDTH, Constants.SCREEN_HEIGHT - self.GRID_TOP
+        ))
+        for rect, i, pokemon in self._cards:
+            x = rect.x
+            y = rect.y - self.scroll_offset
 
             # Card background
             is_selected = i == self.selected_index
@@ -138,8 +174,8 @@ class SelectionScreen(BaseScreen):
             pygame.draw.rect(surface, border_color, card_rect, width=3, border_radius=6)
 
             # Sprite
-            if pokemon.name in self.sprites:
-                sprite = self.sprites[pokemon.name]
+            sprite = self._get_sprite(pokemon)
+            if sprite is not None:
                 surface.blit(sprite, (x + Constants.CARD_WIDTH // 2 - 40, y + 5))
             else:
                 # Placeholder circle
@@ -183,6 +219,12 @@ class SelectionScreen(BaseScreen):
             if stat_surf.get_width() > max_w:
                 stat_surf = stat_surf.subsurface(pygame.Rect(0, 0, max_w, stat_surf.get_height()))
             surface.blit(stat_surf, (stat_x, y + 137))
+        surface.set_clip(None)
+
+        self.filter_bar.draw(surface)
+        if not self._cards:
+            empty = self.font_button.render("No Pokemon match these filters", True, Constants.BLACK)
+            surface.blit(empty, (Constants.SCREEN_WIDTH // 2 - empty.get_width() // 2, 200))
 
         # Confirm button
         if self.selected_index is not None:
@@ -197,7 +239,7 @@ class SelectionScreen(BaseScreen):
             )
 
             # Show selected name
-            sel_pokemon = pokemon_list[self.selected_index]
+            sel_pokemon = self.game.get_pokemon(self.selected_index)
             sel_text = self.font_stat.render(
                 f"Selected: {sel_pokemon.name}", True, Constants.BLUE
             )
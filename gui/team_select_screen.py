@@ -4,19 +4,30 @@ import os
 import pygame
 
 from models.game_state import GameState
+from gui.asset_cache import AssetCache
 from gui.base_screen import BaseScreen
 from gui.constants import Constants
+from gui.hit_grid import HitGrid
+from gui.roster_filter_bar import RosterFilterBar
 
 
 class TeamSelectScreen(BaseScreen):
 
-    """Screen where the player picks 3-6 Pokemon for their team."""
+    """Screen where the player picks 3-6 Pokemon for their team.
+
+    The grid shows the Pokemon matching the filter bar; only the cards on
+    screen are laid out and drawn.
+    """
 
     MIN_TEAM = 3
     MAX_TEAM = 6
     COLS = 5
     CARD_START_X = 30
-    CARD_START_Y = 75
+    CARD_START_Y = 98
+    FILTER_BAR_Y = 58
+    # Cards are clipped above this line (below the filter bar)
+    GRID_TOP = 90
+    GRID_BOTTOM = 500
     CARD_W = 140
     CARD_H = 130
     CARD_PAD = 10
@@ -36,20 +47,57 @@ class TeamSelectScreen(BaseScreen):
 
         # Load background image
         bg_path = os.path.join("assets", "backgrounds", "team_arena.png")
-        self.background = pygame.image.load(bg_path).convert()
+        self.background = AssetCache.get_image(bg_path, convert=True)
 
         self.selected_indices = []
         self.scroll_offset = 0
         self.sprites = {}
-        self._load_sprites((64, 64))
+        self.filter_bar = RosterFilterBar(game, self.CARD_START_X, self.FILTER_BAR_Y)
 
         # Back button
         self.back_button = pygame.Rect(20, 20, 100, 36)
+        # Suggest button (team optimizer, runs in a worker process)
+        self.suggest_button = pygame.Rect(Constants.SCREEN_WIDTH - 120, 20, 100, 36)
+        self._suggestion = None
+        self.suggest_message = ""
         # Confirm button
         self.confirm_button = pygame.Rect(
             Constants.SCREEN_WIDTH // 2 - 80,
             Constants.SCREEN_HEIGHT - 55, 160, 40
         )
+        self.hit_grid = HitGrid()
+        self.hit_grid.add("back", self.back_button)
+        self.hit_grid.add("suggest", self.suggest_button)
+        self.hit_grid.add("confirm", self.confirm_button)
+        self._refresh_cards()
+
+    def _refresh_cards(self):
+        """Lay out the cards of the matches visible at the current scroll.
+
+        Cards are placed by their position among the matches. Only the rows
+        on screen are fetched from the filter bar and registered, in
+        unscrolled coordinates, for click lookup.
+        """
+        cols = self.COLS
+        row_h = self.CARD_H + self.CARD_PAD
+        first_row = self.scroll_offset // row_h
+        rows = (self.GRID_BOTTOM - self.GRID_TOP) // row_h + 2
+        self.card_grid = HitGrid()
+        self._cards = []
+        first = first_row * cols
+        for k, i in enumerate(self.filter_bar.page(first, rows * cols), first):
+            x = self.CARD_START_X + (k % cols) * (self.CARD_W + self.CARD_PAD)
+            y = self.CARD_START_Y + (k // cols) * row_h
+            rect = self.card_grid.add(i, pygame.Rect(x, y, self.CARD_W, self.CARD_H))
+            self._cards.append((rect, i, self.game.get_pokemon(i)))
+
+    def _clamp_scroll(self):
+        """Keep the scroll offset within the rows of matches."""
+        cols = self.COLS
+        rows = (self.filter_bar.count + cols - 1) // cols
+        total_h = rows * (self.CARD_H + self.CARD_PAD)
+        max_scroll = max(0, total_h - Constants.SCREEN_HEIGHT + 143)
+        self.scroll_offset = max(0, min(self.scroll_offset, max_scroll))
 
     def handle_events(self, events):
         """Clicks on Pokemon cards, back, and confirm buttons.
@@ -58,48 +106,73 @@ class TeamSelectScreen(BaseScreen):
             GameState or None: COMBAT if confirmed, MENU if back, else None.
         """
         for event in events:
+            if self.filter_bar.handle_event(event):
+                self.scroll_offset = 0
+                self._refresh_cards()
+                continue
+
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                key = self.hit_grid.hit(event.pos)
                 # Back button
-                if self.back_button.collidepoint(event.pos):
+                if key == "back":
                     return GameState.MENU
 
+                # Suggest button
+                if key == "suggest":
+                    self._request_suggestion()
+                    return None
+
                 # Confirm button
-                if len(self.selected_indices) >= self.MIN_TEAM:
-                    if self.confirm_button.collidepoint(event.pos):
-                        return GameState.COMBAT
+                if key == "confirm" and len(self.selected_indices) >= self.MIN_TEAM:
+                    return GameState.COMBAT
 
                 # Card click
-                pokemon_list = self.game.get_all_pokemon()
-                cols = self.COLS
-                start_x = self.CARD_START_X
-                start_y = self.CARD_START_Y - self.scroll_offset
-                card_w = self.CARD_W
-                card_h = self.CARD_H
-                padding = self.CARD_PAD
-                for i, _pokemon in enumerate(pokemon_list):
-                    col = i % cols
-                    row = i // cols
-                    x = start_x + col * (card_w + padding)
-                    y = start_y + row * (card_h + padding)
-                    card_rect = pygame.Rect(x, y, card_w, card_h)
-                    if card_rect.collidepoint(event.pos) and not _pokemon.locked:
-                        if i in self.selected_indices:
-                            self.selected_indices.remove(i)
-                        elif len(self.selected_indices) < self.MAX_TEAM:
-                            self.selected_indices.append(i)
+                i = None
+                if self.GRID_TOP <= event.pos[1] < self.GRID_BOTTOM:
+                    i = self.card_grid.hit(event.pos, (0, self.scroll_offset))
+                if i is not None and not self.game.get_pokemon(i).locked:
+                    if i in self.selected_indices:
+                        self.selected_indices.remove(i)
+                    elif len(self.selected_indices) < self.MAX_TEAM:
+                        self.selected_indices.append(i)
 
             if event.type == pygame.MOUSEWHEEL:
                 self.scroll_offset -= event.y * 30
-                pokemon_list = self.game.get_all_pokemon()
-                cols = self.COLS
-                card_h = self.CARD_H
-                padding = self.CARD_PAD
-                rows = (len(pokemon_list) + cols - 1) // cols
-                total_h = rows * (card_h + padding)
-                max_scroll = max(0, total_h - Constants.SCREEN_HEIGHT + 120)
-                self.scroll_offset = max(0, min(self.scroll_offset, max_scroll))
+                self._clamp_scroll()
+                self._refresh_cards()
         return None
 
+    def _request_suggestion(self):
+        """Ask the team optimizer for a team (result picked up in update())."""
+        size = len(self.selected_indices)
+        if size < self.MIN_TEAM:
+            size = self.MAX_TEAM
+        self._suggestion = self.game.team_optimizer.suggest(self.game, size)
+        self.suggest_message = "Thinking..."
+
+    def update(self, dt):
+        """Apply the suggested team once the optimizer has finished.
+
+        Also re-runs the filters if the roster changed.
+
+        Args:
+            dt: Seconds since the previous frame (unused).
+        """
+        if self.filter_bar.update():
+            self._clamp_scroll()
+            self._refresh_cards()
+        if self._suggestion is None or not self._suggestion.done():
+            return
+        result = self.game.team_optimizer.collect(self._suggestion)
+        self._suggestion = None
+        if result is None:
+            self.suggest_message = "Suggestion failed"
+        elif result["team"]:
+            self.selected_indices = list(result["team"])
+            self.suggest_message = f"Type coverage {result['coverage']:.0%}"
+        else:
+            self.suggest_message = "No team available"
+
     def draw(self, surface):
         """Draw the team selection grid."""
         surface.blit(self.background, (0, 0))
@@ -116,24 +189,24 @@ class TeamSelectScreen(BaseScreen):
         back_label = self.font_stat.render("< Back", True, Constants.WHITE)
         surface.blit(back_label, back_label.get_rect(center=self.back_button.center))
 
-        # Pokemon cards (includes locked, shown greyed out)
-        pokemon_list = self.game.get_all_pokemon()
-        cols = self.COLS
-        start_x = self.CARD_START_X
-        start_y = self.CARD_START_Y - self.scroll_offset
+        # Suggest button
+        pygame.draw.rect(
+            surface, Constants.BLUE, self.suggest_button,
+            border_radius=Constants.BUTTON_RADIUS,
+        )
+        suggest_label = self.font_stat.render("Suggest", True, Constants.WHITE)
+        surface.blit(suggest_label, suggest_label.get_rect(center=self.suggest_button.center))
+
+        # Matching Pokemon cards (includes locked, shown greyed out)
         card_w = self.CARD_W
         card_h = self.CARD_H
-        padding = self.CARD_PAD
-
-        surface.set_clip(pygame.Rect(0, 60, 800, 440))
-        for i, pokemon in enumerate(pokemon_list):
-            col = i % cols
-            row = i // cols
-            x = start_x + col * (card_w + padding)
-            y = start_y + row * (card_h + padding)
 
-            if y + card_h < 65 or y > Constants.SCREEN_HEIGHT - 70:
-                continue
+        surface.set_clip(pygame.Rect(
+            0, self.GRID_TOP, Constants.SCREEN_WIDTH, self.GRID_BOTTOM - self.GRID_TOP
+        ))
+        for rect, i, pokemon in self._cards:
+            x = rect.x
+            y = rect.y - self.scroll_offset
 
             # Card background
             is_selected = i in self.selected_indices
@@ -162,8 +235,8 @@ class TeamSelectScreen(BaseScreen):
             pygame.draw.rect(surface, border_color, card_rect, width=2, border_radius=6)
 
             # Sprite
-            if pokemon.name in self.sprites:
-                sprite = self.sprites[pokemon.name]
+            sprite = self._get_sprite(pokemon, (64, 64))
+            if sprite is not None:
                 surface.blit(sprite, (x + card_w // 2 - 32, y + 8))
             else:
                 pygame.draw.circle(
@@ -208,6 +281,11 @@ class TeamSelectScreen(BaseScreen):
 
         surface.set_clip(None)
 
+        self.filter_bar.draw(surface)
+        if not self._cards:
+            empty = self.font_button.render("No Pokemon match these filters", True, Constants.BLACK)
+            surface.blit(empty, (Constants.SCREEN_WIDTH // 2 - empty.get_width() // 2, 200))
+
         # Info text
         count = len(self.selected_indices)
         if count < self.MIN_TEAM:
@@ -222,6 +300,14 @@ class TeamSelectScreen(BaseScreen):
             (Constants.SCREEN_WIDTH // 2 - info_surf.get_width() // 2,
              Constants.SCREEN_HEIGHT - 95),
         )
+        if self.suggest_message:
+            suggest_surf = self.font_stat.render(self.suggest_message, True, Constants.DARK_GRAY)
+            surface.blit(
+                suggest_surf,
+                suggest_surf.get_rect(
+                    topright=(Constants.SCREEN_WIDTH - 20, Constants.SCREEN_HEIGHT - 45)
+                ),
+            )
 
         # Confirm button
         if count >= self.MIN_TEAM:
@@ -5,10 +5,12 @@ No classes are defined here (as per project rules: 1 file = 1 class).
 
 Usage:
     python3 main.py
+    python3 main.py --profile   (F3 toggles the frame profiler overlay)
+    python3 main.py --battle-log   (battle events to battle_events.jsonl)
+    python3 main.py --memory    (F4 toggles the memory summary overlay)
 """
 
 import os
-import random
 import sys
 
 import pygame
@@ -17,13 +19,25 @@ from models.game import Game
 from models.game_state import GameState
 from models.pokemon import Pokemon
 from gui.add_pokemon_screen import AddPokemonScreen
+from gui.asset_cache import AssetCache
 from gui.combat_screen import CombatScreen
 from gui.constants import Constants
+from gui.frame_profiler import FrameProfiler
+from gui.memory_diagnostics import MemoryDiagnostics
 from gui.menu_screen import MenuScreen
 from gui.pokedex_screen import PokedexScreen
 from gui.result_screen import ResultScreen
 from gui.selection_screen import SelectionScreen
 from gui.team_select_screen import TeamSelectScreen
+from utils.event_counter_sink import EventCounterSink
+from utils.jsonl_event_sink import JsonlEventSink
+
+PROFILE_CSV_PATH = "profile_frames.csv"
+BATTLE_EVENTS_PATH = "battle_events.jsonl"
+MEMORY_REPORT_PATH = "memory_report.txt"
+# Longest frame time passed to update(), in seconds
+MAX_FRAME_TIME = 0.1
+
 
 def main():
     """Run the Pygame main loop with state machine dispatch."""
@@ -36,10 +50,30 @@ def main():
     )
     pygame.display.set_caption("Pokemon Battle")
     clock = pygame.time.Clock()
+    dt = 0.0
+
+    # Opt-in profiler: None unless requested, so the loop only pays a
+    # single "is not None" check per phase
+    profiler = None
+    if "--profile" in sys.argv or os.environ.get("POKEMON_PROFILE"):
+        profiler = FrameProfiler()
+        profiler.register_cache("images", AssetCache.stats)
 
     game = Game()
+    counters = None
+    if "--battle-log" in sys.argv:
+        counters = EventCounterSink()
+        game.battle_events.add_sink(JsonlEventSink(BATTLE_EVENTS_PATH))
+        game.battle_events.add_sink(counters)
+    # Opt-in memory diagnostics (tracemalloc slows allocations down)
+    memory = None
+    if "--memory" in sys.argv or os.environ.get("POKEMON_MEMORY"):
+        memory = MemoryDiagnostics()
+        memory.register_surfaces("images", AssetCache.memory)
     state = GameState.MENU
     current_screen = MenuScreen(game)
+    if memory is not None:
+        memory.transition(type(current_screen).__name__)
 
     # Combat context (set during RESULT transition)
     winner_name = None
@@ -47,13 +81,22 @@ def main():
 
     running = True
     while running:
+        if profiler is not None:
+            profiler.begin_frame(type(current_screen).__name__)
         events = pygame.event.get()
         for event in events:
             if event.type == pygame.QUIT:
                 running = False
+                continue
+            if profiler is not None:
+                profiler.handle_event(event)
+            if memory is not None:
+                memory.handle_event(event)
 
         if not running:
             break
+        if profiler is not None:
+            profiler.lap("events")
 
         # Let the current screen process events
         next_state = current_screen.handle_events(events)
@@ -69,32 +112,23 @@ def main():
                 opponent_team = []
                 player_indices = []
                 # Indices reference the full list (including locked)
-                all_pokemon = game.get_all_pokemon()
-                available = game.get_available_pokemon()
                 if state == GameState.TEAM_SELECT and current_screen.selected_indices:
                     player_indices = list(current_screen.selected_indices)
                     for idx in current_screen.selected_indices:
-                        p = Pokemon(data=all_pokemon[idx].to_dict())
+                        p = Pokemon(data=game.get_pokemon(idx).to_dict(move_ids=True))
                         player_team.append(p)
-                    opp_sources = random.sample(
-                        available, min(len(player_team), len(available))
+                    # Opponents scaled to the team's average level, picked
+                    # for the target win probability
+                    opponent_team = game.opponent_generator.generate(
+                        game, player_team, game.target_win_probability
                     )
-                    for p in opp_sources:
-                        opponent_team.append(Pokemon(data=p.to_dict()))
-                    # Scale opponents to match player team average level
-                    total_level = 0
-                    for p in player_team:
-                        total_level += p.level
-                    avg_level = total_level // len(player_team)
-                    for opp in opponent_team:
-                        opp.scale_to_level(avg_level)
                 elif state == GameState.SELECTION and current_screen.selected_index is not None:
                     player_indices = [current_screen.selected_index]
-                    p = all_pokemon[current_screen.selected_index]
-                    player_team = [Pokemon(data=p.to_dict())]
-                    opp = game.get_random_opponent()
-                    opp.scale_to_level(player_team[0].level)
-                    opponent_team = [opp]
+                    p = game.get_pokemon(current_screen.selected_index)
+                    player_team = [Pokemon(data=p.to_dict(move_ids=True))]
+                    opponent_team = game.opponent_generator.generate(
+                        game, player_team, game.target_win_probability, size=1
+                    )
                 if player_team and opponent_team:
                     current_screen = CombatScreen(
                         game, player_team, opponent_team, player_indices
@@ -129,13 +163,38 @@ def main():
             elif next_state == GameState.TEAM_SELECT:
                 current_screen = TeamSelectScreen(game)
             state = next_state
+            if memory is not None:
+                memory.transition(type(current_screen).__name__)
+        if profiler is not None:
+            profiler.lap("handle_events")
 
         # Update and draw
-        current_screen.update()
+        current_screen.update(dt)
+        if profiler is not None:
+            profiler.lap("update")
         current_screen.draw(screen)
+        if profiler is not None:
+            profiler.lap("draw")
+            profiler.draw_overlay(screen, clock.get_fps())
+            profiler.lap("overlay")
+        if memory is not None:
+            memory.draw_overlay(screen)
         pygame.display.flip()
-        clock.tick(Constants.FPS)
-
+        # Real elapsed time, capped so a stall does not skip animations
+        dt = min(clock.tick(Constants.FPS) / 1000.0, MAX_FRAME_TIME)
+        if profiler is not None:
+            profiler.lap("flip")
+            profiler.end_frame()
+
+    if profiler is not None and profiler.write_csv(PROFILE_CSV_PATH):
+        print(f"Frame profile written to {PROFILE_CSV_PATH}")
+    if memory is not None:
+        if memory.write_summary(MEMORY_REPORT_PATH):
+            print(f"Memory report written to {MEMORY_REPORT_PATH}")
+        memory.close()
+    if counters is not None:
+        print(f"Battle events written to {BATTLE_EVENTS_PATH}: {counters.summary()}")
+    game.close()
     pygame.quit()
     sys.exit()
 
@@ -2,21 +2,29 @@
 
 import random
 
+from models.timeline import Timeline
+from models.tween import Tween
+
 
 class AnimationManager:
     """Manages combat animations: shake, flash, and progressive HP bar.
 
+    Each effect is a Tween on a Timeline, so effects last a fixed time
+    (in seconds) whatever the frame rate. Several managers can share the
+    screen's timeline, which then advances all of them in one pass.
+
     Usage::
 
-        anim = AnimationManager()
+        timeline = Timeline()
+        anim = AnimationManager(timeline)
 
         # Trigger effects when a hit lands
-        anim.start_shake(duration=12)
-        anim.start_flash(color=(255, 255, 255), duration=8)
+        anim.start_shake(duration=0.2)
+        anim.start_flash(color=(255, 255, 255), duration=0.15)
         anim.start_hp_animation(current_ratio=1.0, target_ratio=0.6)
 
-        # In the game loop, each frame:
-        anim.update()
+        # In the game loop, each frame (dt in seconds, from clock.tick):
+        timeline.update(dt)
 
         # In draw():
         dx, dy = anim.get_shake_offset()
@@ -25,69 +33,108 @@ class AnimationManager:
     """
 
     SHAKE_AMPLITUDE = 6
-    HP_ANIM_SPEED = 0.02
+    SHAKE_DURATION = 0.17
+    FLASH_DURATION = 0.13
+    FLASH_ALPHA = 180
+    # HP bar speed, in bar ratio per second
+    HP_ANIM_SPEED = 1.2
     HP_ANIM_THRESHOLD = 0.005
 
-    def __init__(self):
-        """Initialise the AnimationManager with all animations idle."""
-        self.shake_frames_remaining = 0
+    def __init__(self, timeline=None):
+        """Initialise the AnimationManager with all animations idle.
+
+        Args:
+            timeline: Timeline running the effects. If omitted, the
+                manager owns one and update(dt) advances it.
+        """
+        self._owns_timeline = timeline is None
+        self.timeline = timeline if timeline is not None else Timeline()
+
+        # Own generator: the number of frames drawn (which depends on the
+        # frame rate and the battle speed) must not move the battle's
+        # random rolls
+        self._shake_rng = random.Random()
+        self._shake = None
         self._shake_offset_x = 0
         self._shake_offset_y = 0
 
-        self.flash_frames_remaining = 0
-        self._flash_total_duration = 0
+        self._flash = None
         self._flash_color = None
 
-        self.animating_hp = False
+        self._hp = None
         self.current_hp_ratio = 0.0
-        self._target_hp_ratio = 0.0
 
-    def start_shake(self, duration=10):
+    def _restart(self, current, tween):
+        """Cancel a running effect and start its replacement."""
+        if current is not None:
+            current.cancel()
+        return self.timeline.add(tween)
+
+    def start_shake(self, duration=SHAKE_DURATION):
         """Begin a sprite shake effect.
 
         Args:
-            duration: Number of frames the shake lasts (default 10).
+            duration: Seconds the shake lasts.
         """
-        self.shake_frames_remaining = duration
-        self._update_shake_offset()
+        self._update_shake_offset(0.0)
+        self._shake = self._restart(
+            self._shake, Tween(duration, on_update=self._update_shake_offset)
+        )
 
-    def start_flash(self, color, duration=8):
+    def start_flash(self, color, duration=FLASH_DURATION):
         """Begin a screen-overlay flash effect.
 
         The flash is rendered as a semi-transparent colored rectangle over
-        the target sprite. It fades out linearly over ``duration`` frames.
+        the target sprite. It fades out linearly over ``duration`` seconds.
 
         Args:
             color:    (R, G, B) base color for the flash.
-            duration: Number of frames the flash lasts (default 8).
+            duration: Seconds the flash lasts.
         """
         self._flash_color = color
-        self.flash_frames_remaining = duration
-        self._flash_total_duration = duration
+        self._flash = self._restart(self._flash, Tween(duration, start=1.0, end=0.0))
 
     def start_hp_animation(self, current_ratio, target_ratio):
         """Begin progressive HP bar animation.
 
         Instead of jumping the HP bar instantly to its new value, this
-        smoothly slides it from ``current_ratio`` to ``target_ratio``.
+        slides it from ``current_ratio`` to ``target_ratio`` at
+        HP_ANIM_SPEED, easing out at the end.
 
         Args:
             current_ratio: Starting HP ratio (0.0 -- 1.0).
             target_ratio:  Ending HP ratio (0.0 -- 1.0).
         """
         self.current_hp_ratio = float(current_ratio)
-        self._target_hp_ratio = float(target_ratio)
-        if abs(self.current_hp_ratio - self._target_hp_ratio) > self.HP_ANIM_THRESHOLD:
-            self.animating_hp = True
-        else:
-            self.current_hp_ratio = self._target_hp_ratio
-            self.animating_hp = False
-
-    def update(self):
-        """Advance every active animation by one frame."""
-        self._update_shake()
-        self._update_flash()
-        self._update_hp()
+        target_ratio = float(target_ratio)
+        distance = abs(target_ratio - self.current_hp_ratio)
+        if distance <= self.HP_ANIM_THRESHOLD:
+            self.current_hp_ratio = target_ratio
+            if self._hp is not None:
+                self._hp.cancel()
+            return
+        self._hp = self._restart(self._hp, Tween(
+            distance / self.HP_ANIM_SPEED, self.current_hp_ratio, target_ratio,
+            "ease_out_quad", on_update=self._set_hp_ratio,
+        ))
+
+    @property
+    def animating_hp(self):
+        """True while the HP bar slides toward its target."""
+        return self._hp is not None and not self._hp.finished
+
+    def _set_hp_ratio(self, value):
+        """Tween callback: move the displayed HP ratio."""
+        self.current_hp_ratio = value
+
+    def update(self, dt):
+        """Advance the animations (only if the manager owns its timeline).
+
+        Args:
+            dt: Elapsed seconds since the previous frame.
+        """
+        if self._owns_timeline:
+            self.timeline.update(dt)
 
     def get_shake_offset(self):
         """Return the current (dx, dy) pixel offset for the shaking sprite.
@@ -95,7 +142,7 @@ class AnimationManager:
         Returns:
             tuple: (dx, dy) in pixels. (0, 0) when shake is inactive.
         """
-        if self.shake_frames_remaining > 0:
+        if self._shake is not None and not self._shake.finished:
             return (self._shake_offset_x, self._shake_offset_y)
         return (0, 0)
 
@@ -107,14 +154,10 @@ class AnimationManager:
         Returns:
             tuple or None: (R, G, B, alpha) while flashing, None otherwise.
         """
-        if self.flash_frames_remaining <= 0 or self._flash_color is None:
+        if self._flash is None or self._flash.finished or self._flash_color is None:
             return None
-
-        alpha = int(
-            180 * (self.flash_frames_remaining / self._flash_total_duration)
-        )
         r, g, b = self._flash_color
-        return (r, g, b, alpha)
+        return (r, g, b, int(self.FLASH_ALPHA * self._flash.value))
 
     def is_animating(self):
         """Return True if any animation is currently running.
@@ -122,51 +165,13 @@ class AnimationManager:
         Returns:
             bool: True if shake, flash, or HP bar animation is active.
         """
-        return (
-            self.shake_frames_remaining > 0
-            or self.flash_frames_remaining > 0
-            or self.animating_hp
-        )
+        for tween in (self._shake, self._flash, self._hp):
+            if tween is not None and not tween.finished:
+                return True
+        return False
 
-    def _update_shake(self):
-        """Advance the shake animation by one frame."""
-        if self.shake_frames_remaining > 0:
-            self.shake_frames_remaining -= 1
-            if self.shake_frames_remaining > 0:
-                self._update_shake_offset()
-            else:
-                self._shake_offset_x = 0
-                self._shake_offset_y = 0
-
-    def _update_shake_offset(self):
+    def _update_shake_offset(self, _progress):
         """Randomise the current shake pixel offset."""
         amp = self.SHAKE_AMPLITUDE
-        self._shake_offset_x = random.randint(-amp, amp)
-        self._shake_offset_y = random.randint(-amp, amp)
-
-    def _update_flash(self):
-        """Advance the flash animation by one frame."""
-        if self.flash_frames_remaining > 0:
-            self.flash_frames_remaining -= 1
-
-    def _update_hp(self):
-        """Advance the HP bar animation by one frame.
-
-        Uses linear interpolation: move current_hp_ratio toward
-        _target_hp_ratio by HP_ANIM_SPEED each frame, and stop once
-        the difference is below HP_ANIM_THRESHOLD.
-        """
-        if not self.animating_hp:
-            return
-
-        diff = self._target_hp_ratio - self.current_hp_ratio
-
-        if abs(diff) <= self.HP_ANIM_THRESHOLD:
-            self.current_hp_ratio = self._target_hp_ratio
-            self.animating_hp = False
-            return
-
-        step = min(self.HP_ANIM_SPEED, abs(diff))
-        if diff < 0:
-            step = -step
-        self.current_hp_ratio += step
+        self._shake_offset_x = self._shake_rng.randint(-amp, amp)
+        self._shake_offset_y = self._shake_rng.randint(-amp, amp)
@@ -0,0 +1,81 @@
+"""Battle event bus module -- typed battle events dispatched to sinks."""
+
+import time
+
+
+class BattleEventBus:
+    """Dispatches structured battle events to pluggable sinks.
+
+    Combat and the turn logic report what happens (hits, misses, KOs,
+    switches, XP, evolutions, unlocks) as events: plain dicts with a
+    "kind", a sequence number "seq", a timestamp "t" and kind-specific
+    fields. Each sink receives every event through its handle(event)
+    method and must not modify it.
+
+    The bus is falsy while no sink is attached, and producers guard every
+    emit with ``if bus:``. Without sinks, no event dict is ever built, so
+    the cost is a single truth test.
+
+    Example:
+        bus = BattleEventBus()
+        bus.add_sink(RingBufferSink(100))
+        if bus:
+            bus.emit(BattleEventBus.MISS, attacker="Pikachu", move="Thunder")
+    """
+
+    HIT = "hit"
+    MISS = "miss"
+    EFFECTIVENESS = "effectiveness"
+    KO = "ko"
+    SWITCH = "switch"
+    XP = "xp"
+    EVOLUTION = "evolution"
+    UNLOCK = "unlock"
+
+    def __init__(self):
+        """Create a bus with no sinks."""
+        self._sinks = []
+        self._seq = 0
+
+    def __bool__(self):
+        """Return True if at least one sink is attached."""
+        return bool(self._sinks)
+
+    def add_sink(self, sink):
+        """Attach a sink.
+
+        Args:
+            sink: Object with handle(event), optionally close().
+        """
+        self._sinks.append(sink)
+
+    def remove_sink(self, sink):
+        """Detach a sink (it is not closed).
+
+        Args:
+            sink: A sink previously passed to add_sink().
+        """
+        if sink in self._sinks:
+            self._sinks.remove(sink)
+
+    def emit(self, kind, **fields):
+        """Send an event to every sink.
+
+        Args:
+            kind: Event kind (one of the class constants).
+            **fields: Event-specific fields (JSON-serializable values).
+        """
+        self._seq += 1
+        fields["kind"] = kind
+        fields["seq"] = self._seq
+        fields["t"] = time.time()
+        for sink in self._sinks:
+            sink.handle(fields)
+
+    def close(self):
+        """Close every sink that supports it and detach them all."""
+        for sink in self._sinks:
+            close = getattr(sink, "close", None)
+            if close is not None:
+                close()
+        self._sinks = []
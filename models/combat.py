@@ -2,23 +2,32 @@
 
 import random
 
+from models.battle_event_bus import BattleEventBus
+
 
 class Combat:
     """Manages a battle between two Pokemon."""
 
     BASE_XP_REWARD = 20  # XP given to the winner
 
-    def __init__(self, player_pokemon, opponent_pokemon, type_chart):
+    def __init__(self, player_pokemon, opponent_pokemon, type_chart, event_bus=None,
+                 rng=None):
         """Create a new Combat instance.
 
         Args:
             player_pokemon: The player's Pokemon object.
             opponent_pokemon: The opponent's Pokemon object.
             type_chart: A TypeChart instance for effectiveness lookup.
+            event_bus: Optional BattleEventBus receiving hit, miss,
+                effectiveness, KO and XP events.
+            rng: Optional random.Random for the accuracy rolls (defaults to
+                the shared random module).
         """
         self.player_pokemon = player_pokemon
         self.opponent_pokemon = opponent_pokemon
         self.type_chart = type_chart
+        self.event_bus = event_bus
+        self.rng = rng if rng is not None else random
 
     def get_type_multiplier(self, defender, move):
         """Get the type effectiveness multiplier for an attack.
@@ -81,9 +90,14 @@ class Combat:
         move_name = move.name
 
         # Check for miss
-        miss = random.randint(1, 100) > move.accuracy
+        miss = self.rng.randint(1, 100) > move.accuracy
 
         if miss:
+            if self.event_bus:
+                self.event_bus.emit(
+                    BattleEventBus.MISS, side=self._side(attacker),
+                    attacker=attacker.name, defender=defender.name, move=move_name,
+                )
             message = f"{attacker.name}'s {move_name} missed!"
             result = {
                 "hit": False,
@@ -110,6 +124,9 @@ class Combat:
         else:
             effective = "normal"
 
+        if self.event_bus:
+            self._emit_hit(attacker, defender, move, damage, multiplier, effective)
+
         # Build message
         message = f"{attacker.name} used {move_name}! {damage} damage!"
         if effective == "immune":
@@ -133,6 +150,30 @@ class Combat:
         }
         return result
 
+    def _side(self, pokemon):
+        """Return "player" or "opponent" for an event's side field."""
+        return "player" if pokemon is self.player_pokemon else "opponent"
+
+    def _emit_hit(self, attacker, defender, move, damage, multiplier, effective):
+        """Emit the hit event, then effectiveness and KO events if relevant."""
+        bus = self.event_bus
+        side = self._side(attacker)
+        bus.emit(
+            BattleEventBus.HIT, side=side, attacker=attacker.name,
+            defender=defender.name, move=move.name, move_type=move.move_type,
+            damage=damage, defender_hp=defender.hp,
+        )
+        if effective != "normal":
+            bus.emit(
+                BattleEventBus.EFFECTIVENESS, side=side, move=move.name,
+                defender=defender.name, multiplier=multiplier, effective=effective,
+            )
+        if not defender.is_alive():
+            bus.emit(
+                BattleEventBus.KO, side=side, attacker=attacker.name,
+                defender=defender.name, move=move.name,
+            )
+
     def get_winner(self):
         """Return the name of the winning Pokemon, or None if battle continues.
 
@@ -172,7 +213,13 @@ class Combat:
             if not opp.is_alive():
                 total_xp += self.BASE_XP_REWARD + opp.level * 2
         if total_xp > 0:
+            old_level = winner.level
             winner.gain_xp(total_xp)
+            if self.event_bus:
+                self.event_bus.emit(
+                    BattleEventBus.XP, pokemon=winner.name, amount=total_xp,
+                    old_level=old_level, level=winner.level,
+                )
         return total_xp
 
     def register_to_pokedex(self, pokemon, pokedex):
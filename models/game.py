@@ -1,142 +1,478 @@
 """Game module -- top-level game state manager."""
 
-import os
+import collections
+import functools
 import random
+import time
 
+from models.battle_event_bus import BattleEventBus
+from models.lazy_roster import LazyRoster
+from models.opponent_generator import OpponentGenerator
 from models.pokemon import Pokemon
 from models.pokedex import Pokedex
+from models.roster_descriptions import RosterDescriptions
+from models.roster_index import RosterIndex
+from models.species_registry import SpeciesRegistry
+from models.team_optimizer import TeamOptimizer
 from models.type_chart import TypeChart
 from utils.file_handler import FileHandler
+from utils.pokemon_importer import PokemonImporter
+from utils.save_codec import SaveCodec
+from utils.save_slot_manager import SaveSlotManager
+from utils.save_worker import SaveWorker
 
 
 class Game:
     """Top-level game state manager."""
 
     POKEMON_SOURCE_PATH = "data/pokemon.json"
-    SAVE_PATH = "saves/save.json"
+    # Optional memory-mapped species file (python3 -m tools.build_species_db),
+    # used instead of POKEMON_SOURCE_PATH when at least as recent
+    SPECIES_DATABASE_PATH = "data/pokemon.bin"
+    SAVE_DIR = "saves"
+    # "json" (<slot>.json) or "compact" (<slot>.bin, see SaveCodec)
+    SAVE_FORMAT = "json"
     TYPE_CHART_PATH = "data/type_chart.json"
     POKEDEX_PATH = "data/pokedex.json"
+    # Roster changes remembered for roster_changes() (older: full rebuild)
+    ROSTER_CHANGE_LOG = 1024
+    # Journal records written before the next save is a full snapshot
+    JOURNAL_COMPACT_EVERY = 64
+    # Player win probability opponent teams are generated for
+    TARGET_WIN_PROBABILITY = 0.55
+    # Seconds close() waits for pending saves before giving up
+    CLOSE_TIMEOUT = 10.0
+
+    def __init__(self, save_dir=None):
+        """Initialize the game: load type chart, then restore save or load source.
 
-    def __init__(self):
-        """Initialize the game: load type chart, then restore save or load source."""
+        Args:
+            save_dir: Directory for save slots (defaults to SAVE_DIR).
+        """
         self.file_handler = FileHandler()
+        self.save_worker = SaveWorker(self.file_handler)
         self.type_chart = TypeChart()
         self.type_chart.load_from_file(self.TYPE_CHART_PATH)
+        # Species data and evolution graph, read once; evolutions use it
+        self.species = SpeciesRegistry()
+        self.species.load_from_file(self.POKEMON_SOURCE_PATH, self.SPECIES_DATABASE_PATH)
+        Pokemon.species_registry = self.species
         self.pokedex = Pokedex()
+        # Structured battle events; no sinks (and no cost) unless attached
+        self.battle_events = BattleEventBus()
         self.pokemon_list = []
         self.evolution_count = 0
-        if self.file_handler.file_exists(self.SAVE_PATH):
+        # Lowercase name -> roster index, for O(1) duplicate checks
+        self._name_index = {}
+        # Name search and filter bitsets of the selection screens
+        self.roster_index = RosterIndex()
+        # Bumped on every roster change (keys the team optimizer cache)
+        self.roster_version = 0
+        # (version, changed roster index or None for "everything")
+        self._roster_log = collections.deque(maxlen=self.ROSTER_CHANGE_LOG)
+        # Stats, types and moves of every entry for opponents and suggestions
+        self.roster_descriptions = RosterDescriptions(self)
+        self.team_optimizer = TeamOptimizer()
+        self.opponent_generator = OpponentGenerator(self.type_chart)
+        self.target_win_probability = self.TARGET_WIN_PROBABILITY
+        # Combat animation speed multiplier (CombatScreen turbo toggle)
+        self.battle_speed = 1.0
+
+        # A save found in the other format is migrated on the next save
+        self.save_format = self.SAVE_FORMAT
+        self._save_codec = None
+        self._snapshot_path = None      # file holding the last snapshot
+
+        # Journaled saves: changes are appended to the slot journal as small
+        # records and folded into a full snapshot every JOURNAL_COMPACT_EVERY
+        self.journal_enabled = True
+        self._journal = []              # records not yet handed to the worker
+        self._journal_seq = 0           # seq of the last recorded change
+        self._journal_length = 0        # records on disk since the snapshot
+        self._pokedex_saved = 0         # pokedex entries already persisted
+        self._needs_full_save = True
+
+        # Save slots; last_team feeds the "team levels" shown in the menu
+        self.slots = SaveSlotManager(save_dir or self.SAVE_DIR, self.file_handler)
+        self.last_team = []
+        self._set_slot(self.slots.active)
+        if self.has_save() and self._existing_save_path() is not None:
             self.load_game()
         else:
             self._load_from_source()
 
+    def _set_slot(self, slot):
+        """Point the save paths at a slot (does not load or save anything).
+
+        Args:
+            slot: Slot name.
+        """
+        self.slot = slot
+        paths = self.slots.get_paths(slot)
+        self.save_path = paths[".json"]
+        self.compact_save_path = paths[".bin"]
+        self.journal_path = paths[".journal"]
+        self._snapshot_path = None
+
     def _load_from_source(self):
-        """Load Pokemon from the immutable source file (data/pokemon.json)."""
-        if self.file_handler.file_exists(self.POKEMON_SOURCE_PATH):
-            data = self.file_handler.load_json(self.POKEMON_SOURCE_PATH)
+        """Load Pokemon from the immutable source file (data/pokemon.json).
+
+        With a species database, the roster is a LazyRoster: Pokemon are
+        built from their record when first displayed or battled.
+        """
+        if self.species.database is not None:
+            self.pokemon_list = LazyRoster(self.species.database)
+        else:
             self.pokemon_list = []
-            for p in data:
+            for p in self.species.get_all():
                 self.pokemon_list.append(Pokemon(data=p))
+        self._rebuild_name_index()
+
+    def _roster_changed(self, indices=None):
+        """Bump roster_version and remember which entries changed.
+
+        Args:
+            indices: Changed roster indices (None: the whole roster).
+        """
+        self.roster_version += 1
+        if indices is None:
+            self._roster_log.append((self.roster_version, None))
         else:
-            self.pokemon_list = []
+            for index in indices:
+                self._roster_log.append((self.roster_version, index))
+
+    def roster_changes(self, since):
+        """Return the roster entries changed after a roster_version.
+
+        Lets caches keyed on the roster (opponent strengths, team
+        suggestions) patch the entries that changed instead of rebuilding.
+
+        Args:
+            since: A roster_version seen earlier (None: never seen).
+
+        Returns:
+            set[int] or None: Changed roster indices (added entries
+                included), or None if the whole roster must be re-read
+                (replaced, or changed too much since then).
+        """
+        if since is None:
+            return None
+        if since == self.roster_version:
+            return set()
+        if not self._roster_log or self._roster_log[0][0] > since + 1:
+            # The log does not reach back that far
+            return None
+        changed = set()
+        for version, index in reversed(self._roster_log):
+            if version <= since:
+                break
+            if index is None:
+                return None
+            changed.add(index)
+        return changed
+
+    def _rebuild_name_index(self):
+        """Rebuild the name map and search index after the roster was replaced."""
+        self._roster_changed()
+        self._name_index = {}
+        entries = list(self.roster_summaries())
+        for i, p in enumerate(entries):
+            self._name_index.setdefault(p.name.lower(), i)
+        self.roster_index.rebuild(entries)
+
+    def roster_summaries(self, moves=False):
+        """Iterate over the roster without building lazy entries.
+
+        Args:
+            moves: Also decode the moves of lazy entries.
 
-    def new_game(self):
-        """Reset the game state for a fresh start."""
+        Returns:
+            iterator: Pokemon, or SpeciesDatabase.Summary for lazy entries
+                not in memory (name, level, stats, types, locked, moves).
+        """
+        if isinstance(self.pokemon_list, LazyRoster):
+            return self.pokemon_list.summaries(moves)
+        return iter(self.pokemon_list)
+
+    def new_game(self, slot=None):
+        """Reset the game state for a fresh start.
+
+        Args:
+            slot: Slot to start the new game in (default: current slot).
+        """
+        self.save_worker.flush()
+        if slot is not None:
+            self._set_slot(slot)
         self.pokedex.reset()
         self.evolution_count = 0
+        self.last_team = []
         self._load_from_source()
-        self.save_game()
+        self.save_game(full=True)
+
+    def list_slots(self):
+        """Return the metadata of all save slots (read from the index only).
+
+        Returns:
+            list[dict]: Slot metadata, see SaveSlotManager.
+        """
+        return self.slots.list_slots()
+
+    def load_slot(self, slot):
+        """Switch to a slot and load its save (only that slot is read).
+
+        Args:
+            slot: Slot name.
+
+        Raises:
+            ValueError: If the slot has no save.
+        """
+        self.save_worker.flush()
+        previous = self.slot
+        self._set_slot(slot)
+        if not self.has_save() or self._existing_save_path() is None:
+            self._set_slot(previous)
+            raise ValueError(f"Save slot '{slot}' is empty")
+        self.load_game()
+        self.slots.active = slot
+        self.save_worker.submit({self.slots.index_path: self.slots.snapshot()})
+
+    def save_as(self, slot, on_complete=None):
+        """Save the current game into another slot and keep playing there.
+
+        Args:
+            slot: Target slot name.
+            on_complete: Optional callable(success), see save_game().
+        """
+        self.save_worker.flush()
+        self._set_slot(slot)
+        self.save_game(on_complete=on_complete, full=True)
 
     def get_random_opponent(self):
         """Pick a random Pokemon from the full list as an opponent.
 
         The opponent is a fresh copy (full HP) so the original list is not
-        modified.
+        modified. The pick is drawn from the roster index, so only that
+        entry is built.
 
         Returns:
             Pokemon: A new Pokemon instance with full HP, or None if list empty.
         """
-        available = self.get_available_pokemon()
-        if not available:
+        available = self.roster_index.query(locked=False)
+        count = available.bit_count()
+        if not count:
             return None
-        source = random.choice(available)
-        opponent = Pokemon(data=source.to_dict())
+        index = self.roster_index.page(available, random.randrange(count), 1)[0]
+        source = self.get_pokemon(index)
+        opponent = Pokemon(data=source.to_dict(move_ids=True))
         return opponent
 
-    def add_pokemon(self, pokemon_data):
+    def add_pokemon(self, pokemon_data, journal=True):
         """Add a new Pokemon to the available list.
 
         Args:
             pokemon_data: Dictionary with Pokemon attributes.
+            journal: Record the addition in the save journal. Bulk imports
+                pass False and force a full snapshot instead.
 
         Returns:
             bool: True if added, False if a Pokemon with this name exists.
         """
         name = pokemon_data.get("name", "").lower()
-        for p in self.pokemon_list:
-            if p.name.lower() == name:
-                return False
+        if name in self._name_index:
+            return False
         new_pokemon = Pokemon(data=pokemon_data)
+        self._name_index[name] = len(self.pokemon_list)
         self.pokemon_list.append(new_pokemon)
+        self.roster_index.add(new_pokemon)
+        self._roster_changed([len(self.pokemon_list) - 1])
+        if journal:
+            self._record("add", pokemon=new_pokemon.to_dict())
         return True
 
+    def import_pokemon(self, path, file_format=None, rejects_path=None):
+        """Stream-import custom Pokemon from a JSONL or CSV file.
+
+        Rows are read one at a time, validated with Pokemon.validate_data(),
+        and deduplicated by name against the roster (and earlier rows)
+        through the name index. The next save is a full snapshot.
+
+        Args:
+            path: File to import.
+            file_format: "jsonl" or "csv" (default: from the extension).
+            rejects_path: Optional JSONL file receiving every rejected row.
+
+        Returns:
+            dict: Import report, see PokemonImporter.report().
+        """
+        importer = PokemonImporter(rejects_path)
+        try:
+            for line, data in importer.read(path, file_format):
+                if not self.add_pokemon(data, journal=False):
+                    importer.reject(line, "A Pokemon with this name already exists")
+        finally:
+            importer.close()
+        report = importer.report()
+        if report["accepted"]:
+            self._needs_full_save = True
+        return report
+
     def get_available_pokemon(self):
         """Return the list of unlocked (available) Pokemon.
 
+        The unlocked entries are found with the roster index, so only those
+        are built when the roster is lazy.
+
         Returns:
-            list[Pokemon]: Pokemon that are not locked.
+            list[Pokemon]: Pokemon that are not locked, in roster order.
         """
-        available = []
-        for p in self.pokemon_list:
-            if not p.locked:
-                available.append(p)
-        return available
+        available = self.roster_index.query(locked=False)
+        indices = self.roster_index.page(available, 0, available.bit_count())
+        return [self.get_pokemon(i) for i in indices]
 
     def get_all_pokemon(self):
         """Return the full list including locked Pokemon (for display).
 
+        With a LazyRoster, entries not in memory are throwaway copies:
+        change the roster through get_pokemon().
+
         Returns:
             list[Pokemon]: All Pokemon in the roster.
         """
         return list(self.pokemon_list)
 
+    def get_pokemon(self, index):
+        """Return the roster entry at an index (built on first use if lazy).
+
+        Args:
+            index: Position in the roster.
+
+        Returns:
+            Pokemon: The roster's own instance.
+        """
+        return self.pokemon_list[index]
+
+    def count_available(self):
+        """Return the number of unlocked Pokemon (from the roster index).
+
+        Returns:
+            int: Unlocked roster entries.
+        """
+        return self.roster_index.query(locked=False).bit_count()
+
     def unlock_pokemon(self, name):
         """Unlock a Pokemon by name (e.g. after evolution).
 
         Args:
             name: Name of the Pokemon to unlock.
+
+        Returns:
+            bool: True if a locked Pokemon was unlocked.
         """
-        for p in self.pokemon_list:
-            if p.name.lower() == name.lower() and p.locked:
-                p.locked = False
-                return
+        index = self._name_index.get(name.lower())
+        if index is None or not self.pokemon_list[index].locked:
+            return False
+        self._unlock_index(index)
+        return True
+
+    def unlock_evolution(self, old_name, new_name):
+        """Unlock every form reached by an evolution.
+
+        A single XP award can skip a stage (Bulbasaur straight to
+        Venusaur); the intermediate forms are unlocked too.
+
+        Args:
+            old_name: Species before evolving.
+            new_name: Species after evolving.
+
+        Returns:
+            list[str]: Names that were unlocked.
+        """
+        unlocked = []
+        for name in self.species.stages_between(old_name, new_name):
+            if self.unlock_pokemon(name):
+                unlocked.append(name)
+        return unlocked
+
+    def _unlock_index(self, index):
+        """Unlock the roster entry at index and journal the change.
+
+        Args:
+            index: Position in self.pokemon_list.
+        """
+        self.pokemon_list[index].locked = False
+        self.roster_index.update(index, self.pokemon_list[index])
+        self._roster_changed([index])
+        self._record("unlock", index=index)
+        if self.battle_events:
+            self.battle_events.emit(
+                BattleEventBus.UNLOCK, pokemon=self.pokemon_list[index].name
+            )
 
     def sync_from_combat(self, player_team, original_indices):
         """Synchronize combat copies back to the original roster.
 
         After combat, the copies may have gained XP, levels, evolved, etc.
-        This method copies those changes back to the originals.
+        Only the fields that changed during the battle (see
+        Pokemon.dirty_fields) are copied back and journaled, so a forfeit
+        or a lost battle leaves the roster and the next save untouched.
 
         Args:
             player_team: List of Pokemon copies used during combat.
             original_indices: List of indices into self.pokemon_list,
                 matching each copy to its original.
+
+        Returns:
+            set[int]: Roster indices that changed.
         """
+        changes = []
+        renamed = []
         for team_idx, orig_idx in enumerate(original_indices):
             copy = player_team[team_idx]
+            fields = copy.dirty_fields()
+            if not fields:
+                continue
             original = self.pokemon_list[orig_idx]
-            original.xp = copy.xp
-            original.level = copy.level
-            original.xp_to_next_level = copy.xp_to_next_level
-            original.max_hp = copy.max_hp
-            original.hp = copy.max_hp  # Full heal after combat
-            original.attack = copy.attack
-            original.defense = copy.defense
-            original.name = copy.name
-            original.sprite_path = copy.sprite_path
-            original.evolution_level = copy.evolution_level
-            original.evolution_target = copy.evolution_target
-            original.moves = copy.moves
+            if "name" in fields and fields["name"] != original.name:
+                renamed.append((orig_idx, original.name))
+            original.apply_dict(fields)
+            copy.mark_clean()
+            changes.append([orig_idx, fields])
+        if not changes:
+            return set()
+        self._roster_changed([orig_idx for orig_idx, _ in changes])
+        for orig_idx, _ in changes:
+            self.roster_index.update(orig_idx, self.pokemon_list[orig_idx])
+        for orig_idx, old_name in renamed:
+            self._rename_in_name_index(orig_idx, old_name)
+        self.last_team = list(original_indices)
+        self._record("battle", pokemon=changes)
+        changed = set()
+        for orig_idx, _ in changes:
+            changed.add(orig_idx)
+        return changed
+
+    def _rename_in_name_index(self, index, old_name):
+        """Update the name map after the entry at index was renamed (evolution).
+
+        Keeps what _rebuild_name_index() would build -- each name maps to
+        its lowest roster index -- without re-reading the roster. Call it
+        after roster_index.update() for that entry.
+
+        Args:
+            index: Roster index of the renamed entry.
+            old_name: Its name before the change.
+        """
+        old = old_name.lower()
+        if self._name_index.get(old) == index:
+            other = self.roster_index.find(old)
+            if other is None:
+                del self._name_index[old]
+            else:
+                self._name_index[old] = other
+        new = self.pokemon_list[index].name.lower()
+        current = self._name_index.get(new)
+        if current is None or index < current:
+            self._name_index[new] = index
 
     def record_evolution(self):
         """Record that an evolution happened. Checks legendary unlocks.
@@ -145,6 +481,7 @@ class Game:
             str or None: Unlock message if a legendary was unlocked.
         """
         self.evolution_count += 1
+        self._record("evolution_count", value=self.evolution_count)
         return self._check_legendary_unlocks()
 
     def _check_legendary_unlocks(self):
@@ -156,72 +493,342 @@ class Game:
         Returns:
             str or None: Unlock message, or None.
         """
-        # Early return if both already unlocked
-        mewtwo_locked = False
-        mew_locked = False
-        for p in self.pokemon_list:
-            if p.name.lower() == "mewtwo" and p.locked:
-                mewtwo_locked = True
-            if p.name.lower() == "mew" and p.locked:
-                mew_locked = True
-        if not mewtwo_locked and not mew_locked:
-            return None
-
         messages = []
-
-        if self.evolution_count >= 10 and mewtwo_locked:
-            for p in self.pokemon_list:
-                if p.name.lower() == "mewtwo" and p.locked:
-                    p.locked = False
-                    messages.append("Mewtwo has been unlocked!")
-
-        if self.pokedex.get_count() >= 151 and mew_locked:
-            for p in self.pokemon_list:
-                if p.name.lower() == "mew" and p.locked:
-                    p.locked = False
-                    messages.append("Mew has been unlocked!")
+        if self.evolution_count >= 10 and self.unlock_pokemon("mewtwo"):
+            messages.append("Mewtwo has been unlocked!")
+        if self.pokedex.get_count() >= 151 and self.unlock_pokemon("mew"):
+            messages.append("Mew has been unlocked!")
 
         if messages:
             return " ".join(messages)
         return None
 
     def has_save(self):
-        """Check if a save file exists.
+        """Check if the current slot holds a save.
+
+        Answered from the in-memory slot index (no filesystem access).
+
+        Returns:
+            bool: True if the current slot has been saved.
+        """
+        return self.slots.has_slot(self.slot)
+
+    def _save_paths(self):
+        """Return (path for save_format, path of the other format)."""
+        if self.save_format == "compact":
+            return self.compact_save_path, self.save_path
+        return self.save_path, self.compact_save_path
+
+    def _existing_save_path(self):
+        """Return the save file to load, preferring the current format.
+
+        Returns:
+            str or None: Path of an existing save file.
+        """
+        for path in self._save_paths():
+            if self.file_handler.file_exists(path):
+                return path
+        return None
+
+    def _get_codec(self):
+        """Return the SaveCodec, built once from the species registry."""
+        if self._save_codec is None:
+            if self.species.database is not None:
+                self._save_codec = SaveCodec(species_lookup=self.species.get)
+            else:
+                self._save_codec = SaveCodec(self.species.get_all())
+        return self._save_codec
+
+    def save_game(self, on_complete=None, full=False):
+        """Save current game state to the current slot (<slot>.json or .bin).
+
+        In journal mode, only the changes since the last save are appended to
+        <slot>.journal, so the cost follows the size of the change rather
+        than the roster. A full snapshot is written (and the journal cleared)
+        on the first save, every JOURNAL_COMPACT_EVERY records, or on request.
+
+        Either way the work is handed to the save worker, which writes
+        atomically in the background. Rapid repeated saves are coalesced.
+
+        Args:
+            on_complete: Optional callable(success) run on the worker thread
+                once the save has actually landed on disk.
+            full: Force a full snapshot (compaction).
+        """
+        self._record_pokedex_additions()
+        pending = self._journal_length + len(self._journal)
+        if (full or not self.journal_enabled or self._needs_full_save
+                or self._snapshot_path != self._save_paths()[0]
+                or pending >= self.JOURNAL_COMPACT_EVERY):
+            self._save_snapshot(on_complete)
+            return
+
+        records = self._journal
+        if not records and self._index_is_current():
+            # Nothing changed since the last save: write nothing
+            self.save_worker.submit({}, on_complete)
+            return
+        self._journal = []
+        self._journal_length += len(records)
+        self.save_worker.submit(*self._index_write())
+        self.save_worker.submit_append(
+            self.journal_path, records, self._full_save_on_failure(on_complete)
+        )
+        for record in records:
+            if record["op"] == "pokedex":
+                self.save_pokedex()
+                break
+
+    def _save_snapshot(self, on_complete=None):
+        """Write a full snapshot and clear the journal it supersedes.
+
+        Args:
+            on_complete: Optional callable(success) run once written.
+        """
+        self._journal = []
+        self._journal_length = 0
+        self._needs_full_save = False
+
+        path, other_path = self._save_paths()
+        self._snapshot_path = path
+        snapshot = self._snapshot()
+        if self.save_format == "compact":
+            # Encoded on the worker thread
+            snapshot = functools.partial(self._get_codec().encode, snapshot)
+        writes = {
+            path: snapshot,
+            self.POKEDEX_PATH: self._snapshot_pokedex(),
+        }
+        # Index last: the worker stops at a failed write, so the slot is
+        # only listed once its snapshot is written
+        index_writes, done = self._index_write(self._full_save_on_failure(on_complete))
+        writes.update(index_writes)
+        self.save_worker.submit(
+            writes,
+            done,
+            # A save in the other format is now stale (format migration)
+            truncate=[self.journal_path, other_path],
+        )
+
+    def _full_save_on_failure(self, on_complete):
+        """Wrap a save callback so a failed write forces a full snapshot.
+
+        The journal records handed to the worker are no longer queued in
+        memory: if they do not land, the next save must write a snapshot
+        rather than find nothing to do.
+
+        Args:
+            on_complete: Optional callable(success) to chain.
+
+        Returns:
+            callable: The callback for the save worker.
+        """
+        def done(success):
+            if not success:
+                self._needs_full_save = True
+            if on_complete is not None:
+                on_complete(success)
+
+        return done
+
+    def _index_is_current(self):
+        """Return True if the index already describes this slot as it is.
 
         Returns:
-            bool: True if saves/save.json exists.
+            bool: True if the slot is active and its recorded team and
+                roster size are unchanged.
         """
-        return self.file_handler.file_exists(self.SAVE_PATH)
+        meta = self.slots.get(self.slot)
+        return (
+            meta is not None
+            and self.slots.active == self.slot
+            and meta.get("team") == self.last_team
+            and meta.get("roster_size") == len(self.pokemon_list)
+            and meta.get("format") == self.save_format
+        )
+
+    def _index_write(self, on_complete=None):
+        """Stage this slot's metadata and return the index write.
 
-    def save_game(self):
-        """Save current game state to saves/save.json."""
-        save_dir = os.path.dirname(self.SAVE_PATH)
-        if save_dir:
-            os.makedirs(save_dir, exist_ok=True)
+        The metadata is recorded in memory (see SaveSlotManager.commit)
+        only once the write has landed.
+
+        Args:
+            on_complete: Optional callable(success) to chain.
+
+        Returns:
+            tuple: ({index path: index snapshot}, callable(success)) for
+                the save worker.
+        """
+        team_levels = []
+        for index in self.last_team:
+            if index < len(self.pokemon_list):
+                team_levels.append(self.pokemon_list[index].level)
+        meta = {
+            "name": self.slot,
+            "timestamp": time.time(),
+            "pokedex_count": self.pokedex.get_count(),
+            "team_levels": team_levels,
+            "team": list(self.last_team),
+            "roster_size": len(self.pokemon_list),
+            "format": self.save_format,
+        }
+        index = self.slots.stage(meta)
+
+        def done(success):
+            if success:
+                self.slots.commit(meta)
+            else:
+                self.slots.discard(meta)
+            if on_complete is not None:
+                on_complete(success)
+
+        return {self.slots.index_path: index}, done
+
+    def _record(self, op, **fields):
+        """Queue a journal record describing one change.
+
+        Records hold absolute values (not increments), so replaying one that
+        is already folded into the snapshot is harmless.
+
+        Args:
+            op: Record type ("battle", "unlock", "evolution_count", "add",
+                "pokedex").
+            **fields: Record payload (JSON-serializable, not mutated later).
+        """
+        if not self.journal_enabled:
+            return
+        self._journal_seq += 1
+        record = {"seq": self._journal_seq, "op": op}
+        record.update(fields)
+        self._journal.append(record)
+
+    def _record_pokedex_additions(self):
+        """Journal the Pokedex entries registered since the last save."""
+        entries = self.pokedex.get_all_entries()
+        if len(entries) < self._pokedex_saved:
+            # Pokedex was reset: only a full snapshot can express that
+            self._needs_full_save = True
+        elif len(entries) > self._pokedex_saved:
+            new_entries = []
+            for entry in entries[self._pokedex_saved:]:
+                copy = dict(entry)
+                copy["types"] = list(entry.get("types", []))
+                new_entries.append(copy)
+            self._record("pokedex", entries=new_entries)
+        self._pokedex_saved = len(entries)
+
+    def _replay(self, record):
+        """Apply one journal record to the in-memory state.
+
+        Args:
+            record: Dict produced by _record().
+        """
+        op = record["op"]
+        if op == "battle":
+            for index, fields in record["pokemon"]:
+                self.pokemon_list[index].apply_dict(fields)
+        elif op == "unlock":
+            self.pokemon_list[record["index"]].locked = False
+        elif op == "evolution_count":
+            self.evolution_count = record["value"]
+        elif op == "add":
+            self.pokemon_list.append(Pokemon(data=record["pokemon"]))
+        elif op == "pokedex":
+            for entry in record["entries"]:
+                self.pokedex.add_raw_entry(entry)
+
+    def _snapshot(self):
+        """Build an immutable copy of the state to persist.
+
+        Returns:
+            dict: Save data made only of fresh dicts/lists/scalars, safe to
+                serialize on another thread while the game keeps running.
+        """
         pokemon_dicts = []
-        for p in self.pokemon_list:
-            pokemon_dicts.append(p.to_dict())
-        save_data = {
+        snapshot = {}
+        if isinstance(self.pokemon_list, LazyRoster):
+            # Only what differs from the species database: changed species
+            # entries and added Pokemon, with their roster index
+            roster = self.pokemon_list
+            indices = []
+            for index, p in roster.changes():
+                indices.append(index)
+                pokemon_dicts.append(p.to_dict())
+            for offset, p in enumerate(roster.added()):
+                indices.append(roster.species_count + offset)
+                pokemon_dicts.append(p.to_dict())
+            snapshot["species_roster"] = roster.species_count
+            snapshot["roster_indices"] = indices
+        else:
+            for p in self.pokemon_list:
+                pokemon_dicts.append(p.to_dict())
+        snapshot.update({
             "pokemon_list": pokemon_dicts,
             "evolution_count": self.evolution_count,
-            "pokedex": self.pokedex.get_all_entries(),
-        }
-        self.file_handler.save_json(self.SAVE_PATH, save_data)
-        self.save_pokedex()
+            "pokedex": self._snapshot_pokedex(),
+            "journal_seq": self._journal_seq,
+        })
+        return snapshot
+
+    def _snapshot_pokedex(self):
+        """Copy the Pokedex entries (entries share type lists with Pokemon).
+
+        Returns:
+            list[dict]: Detached copies of all entries.
+        """
+        entries = []
+        for entry in self.pokedex.get_all_entries():
+            copy = dict(entry)
+            copy["types"] = list(entry.get("types", []))
+            entries.append(copy)
+        return entries
 
-    def save_pokedex(self):
-        """Write the pokedex to data/pokedex.json."""
-        self.file_handler.save_json(self.POKEDEX_PATH, self.pokedex.get_all_entries())
+    def save_pokedex(self, on_complete=None):
+        """Write the pokedex to data/pokedex.json (in the background).
+
+        Args:
+            on_complete: Optional callable(success) run once written.
+        """
+        self.save_worker.submit(
+            {self.POKEDEX_PATH: self._snapshot_pokedex()}, on_complete
+        )
+
+    def close(self):
+        """Flush pending saves and battle events, stop the save worker and
+        close the species database (call before exit)."""
+        self.battle_events.close()
+        self.team_optimizer.close()
+        if not self.save_worker.close(self.CLOSE_TIMEOUT):
+            print(f"[WARN] Pending saves not written after {self.CLOSE_TIMEOUT} s")
+        self.species.close()
 
     def load_game(self):
-        """Load game state from saves/save.json."""
-        data = self.file_handler.load_json(self.SAVE_PATH)
+        """Load the current slot's save file, then replay its journal.
+
+        Reads <slot>.bin (compact) or <slot>.json, whichever matches
+        save_format first. Loading the other format schedules a migration:
+        the next save is a full snapshot in the current format.
+        """
+        self.save_worker.flush()
+        path = self._existing_save_path()
+        if path is None:
+            raise ValueError(f"No save file for slot '{self.slot}'")
+        if path == self.compact_save_path:
+            blob = self.file_handler.load_bytes(path)
+            data = self._get_codec().decode(blob)
+        else:
+            data = self.file_handler.load_json(path)
         try:
-            new_list = []
-            for p in data["pokemon_list"]:
-                new_list.append(Pokemon(data=p))
+            if "species_roster" in data:
+                new_list = self._lazy_roster_from(data)
+            else:
+                new_list = []
+                for p in data["pokemon_list"]:
+                    new_list.append(Pokemon(data=p))
             new_pokedex_entries = data["pokedex"]
             new_evolution_count = data.get("evolution_count", 0)
+            snapshot_seq = data.get("journal_seq", 0)
         except (KeyError, TypeError) as e:
             raise ValueError(f"Invalid save file: {e}")
         self.pokemon_list = new_list
@@ -229,4 +836,50 @@ class Game:
         self.pokedex.reset()
         for entry in new_pokedex_entries:
             self.pokedex.add_raw_entry(entry)
+
+        self._journal = []
+        self._journal_seq = snapshot_seq
+        self._journal_length = 0
+        for record in self.file_handler.load_jsonl(self.journal_path):
+            seq = record.get("seq", 0)
+            if seq <= snapshot_seq:
+                continue  # already folded into the snapshot
+            try:
+                self._replay(record)
+            except (KeyError, IndexError, TypeError, ValueError) as e:
+                raise ValueError(f"Invalid journal record {seq}: {e}")
+            self._journal_seq = seq
+            self._journal_length += 1
+        self._rebuild_name_index()
+        self._pokedex_saved = self.pokedex.get_count()
+        self._snapshot_path = path
+        self._needs_full_save = False
+        meta = self.slots.get(self.slot) or {}
+        self.last_team = list(meta.get("team", []))
         self.save_pokedex()
+
+    def _lazy_roster_from(self, data):
+        """Rebuild a LazyRoster from a save that only stores its changes.
+
+        Args:
+            data: Save data with species_roster and roster_indices.
+
+        Returns:
+            LazyRoster: The species entries, changed ones replaced, then the
+                added Pokemon.
+
+        Raises:
+            ValueError: If the species database is missing or has changed.
+        """
+        database = self.species.database
+        if database is None or len(database) != data["species_roster"]:
+            raise ValueError("Save made with a different species database")
+        roster = LazyRoster(database)
+        for index, p in zip(data["roster_indices"], data["pokemon_list"]):
+            if index < roster.species_count:
+                roster[index] = Pokemon(data=p)
+            elif index == len(roster):
+                roster.append(Pokemon(data=p))
+            else:
+                raise ValueError(f"Invalid roster index {index}")
+        return roster
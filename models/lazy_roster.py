@@ -0,0 +1,149 @@
+"""Lazy roster module -- roster list backed by a species database."""
+
+import collections
+
+from models.pokemon import Pokemon
+
+
+class LazyRoster:
+    """Roster whose species entries are built as Pokemon on first use.
+
+    Stands in for the Game's pokemon_list when the species come from a
+    SpeciesDatabase: entry i (i < len(database)) is species i, and Pokemon
+    added later follow. roster[i] builds the Pokemon from its record the
+    first time it is displayed or battled. Up to CACHE_SIZE of them are
+    kept (least recently used first out); an entry that no longer matches
+    its record (XP, unlock...) is never dropped, so changes are not lost.
+
+    Iterating builds a throwaway Pokemon for each entry not in memory, so
+    whole-roster scans (opponent pool, team suggestions) cost time but do
+    not keep the roster in memory: use roster[i] to change an entry.
+
+    Example:
+        roster = LazyRoster(database)
+        len(roster)                  # number of species
+        roster[24].name              # "Pikachu" (built now, then cached)
+        roster.append(custom_pokemon)
+        roster.changes()             # [(index, Pokemon)] differing from the file
+    """
+
+    CACHE_SIZE = 2048
+
+    def __init__(self, database):
+        """Create a roster of every species of a database.
+
+        Args:
+            database: An open SpeciesDatabase.
+        """
+        self.database = database
+        self.species_count = len(database)
+        # Recently used entries still equal to their record
+        self._cache = collections.OrderedDict()
+        # Entries changed since they were built (kept for good)
+        self._changed = {}
+        self._added = []
+
+    def __len__(self):
+        """Return the number of entries (species + added Pokemon)."""
+        return self.species_count + len(self._added)
+
+    def _position(self, index):
+        """Check an index (negative counts from the end) and return it."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("roster index out of range")
+        return index
+
+    def __getitem__(self, index):
+        """Return the Pokemon at a roster index, building it if needed."""
+        index = self._position(index)
+        if index >= self.species_count:
+            return self._added[index - self.species_count]
+        pokemon = self._changed.get(index)
+        if pokemon is not None:
+            return pokemon
+        pokemon = self._cache.get(index)
+        if pokemon is not None:
+            self._cache.move_to_end(index)
+            return pokemon
+        pokemon = Pokemon(data=self.database.record(index))
+        self._cache[index] = pokemon
+        if len(self._cache) > self.CACHE_SIZE:
+            self._evict()
+        return pokemon
+
+    def __setitem__(self, index, pokemon):
+        """Replace the entry at a roster index (kept for good)."""
+        index = self._position(index)
+        if index >= self.species_count:
+            self._added[index - self.species_count] = pokemon
+            return
+        self._cache.pop(index, None)
+        self._changed[index] = pokemon
+
+    def _evict(self):
+        """Drop the least recently used entry, unless it was changed."""
+        index, pokemon = self._cache.popitem(last=False)
+        if pokemon.to_dict() != self.database.record(index):
+            self._changed[index] = pokemon
+
+    def _loaded(self, index):
+        """Return the in-memory Pokemon of a species entry, or None."""
+        pokemon = self._changed.get(index)
+        if pokemon is None:
+            pokemon = self._cache.get(index)
+        return pokemon
+
+    def __iter__(self):
+        """Yield every entry (throwaway Pokemon for entries not in memory)."""
+        for index in range(self.species_count):
+            pokemon = self._loaded(index)
+            if pokemon is None:
+                pokemon = Pokemon(data=self.database.record(index))
+            yield pokemon
+        yield from self._added
+
+    def append(self, pokemon):
+        """Add a Pokemon after the last entry.
+
+        Args:
+            pokemon: The new Pokemon.
+        """
+        self._added.append(pokemon)
+
+    def loaded_count(self):
+        """Return the number of entries held in memory as Pokemon."""
+        return len(self._cache) + len(self._changed) + len(self._added)
+
+    def summaries(self, moves=False):
+        """Yield the name, level, stats, types and lock state of every entry.
+
+        Entries in memory are yielded as is; the others as
+        SpeciesDatabase.Summary read from their record, without building
+        a Pokemon (enough for the name and search indexes).
+
+        Args:
+            moves: Also decode the Summary moves (matchup tables).
+        """
+        for index in range(self.species_count):
+            pokemon = self._loaded(index)
+            yield pokemon if pokemon is not None else self.database.summary(index, moves)
+        yield from self._added
+
+    def changes(self):
+        """Return the species entries that differ from their record.
+
+        Returns:
+            list[tuple]: (roster index, Pokemon), by index.
+        """
+        changed = []
+        for index in sorted(set(self._changed) | set(self._cache)):
+            pokemon = self._loaded(index)
+            if pokemon.to_dict() != self.database.record(index):
+                changed.append((index, pokemon))
+        return changed
+
+    def added(self):
+        """Return the Pokemon added after the species entries."""
+        return list(self._added)
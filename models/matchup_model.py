@@ -0,0 +1,187 @@
+"""Matchup model module -- precomputed damage and coverage tables."""
+
+from models.pokemon import Pokemon
+
+
+class MatchupModel:
+    """Precomputed matchup tables between candidate and opponent Pokemon.
+
+    Works on plain tuples (see describe()) rather than Pokemon objects, so
+    it can be built in a worker process. For every (candidate, opponent)
+    pair it stores:
+
+    - margin: expected share of the opponent's HP dealt per turn with the
+      candidate's best move, minus the share of its own HP the candidate
+      loses to the opponent's best move (both at the candidate's level,
+      the way opponents are scaled before a battle);
+    - coverage: whether the candidate has a super effective move.
+
+    Coverage is kept as one bitmask per candidate (bit j = opponent j), so
+    the coverage of a team is the OR of its members' masks.
+
+    Example:
+        model = MatchupModel(game.type_chart.chart)
+        model.build(candidates, opponents)
+        coverage, margin = model.team_score([0, 4, 7])
+    """
+
+    def __init__(self, chart):
+        """Create an empty model.
+
+        Args:
+            chart: Type chart dict {attack_type: {defend_type: multiplier}}
+                (TypeChart.chart).
+        """
+        self.chart = chart
+        self._multipliers = {}
+        self.opponent_count = 0
+        self.margins = []
+        self.coverage = []
+
+    @staticmethod
+    def describe(pokemon):
+        """Reduce a Pokemon to the picklable tuple the model works on.
+
+        Args:
+            pokemon: A Pokemon.
+
+        Returns:
+            tuple: (name, level, max_hp, attack, defense, types, moves),
+                with moves as (move_type, power, accuracy) tuples.
+        """
+        moves = []
+        for m in pokemon.moves:
+            moves.append((m.move_type, m.power, m.accuracy))
+        return (
+            pokemon.name, pokemon.level, pokemon.max_hp, pokemon.attack,
+            pokemon.defense, tuple(pokemon.types), tuple(moves),
+        )
+
+    def multiplier(self, move_type, defend_types):
+        """Return the (memoized) combined type multiplier.
+
+        Args:
+            move_type: Attacking type.
+            defend_types: Tuple of the defender's types.
+
+        Returns:
+            float: Combined multiplier.
+        """
+        key = (move_type, defend_types)
+        value = self._multipliers.get(key)
+        if value is None:
+            value = 1.0
+            row = self.chart.get(move_type.lower(), {})
+            for defend_type in defend_types:
+                value *= row.get(defend_type.lower(), 1.0)
+            self._multipliers[key] = value
+        return value
+
+    def best_damage(self, level, attack, moves, defense, defend_types):
+        """Return the best expected damage per turn and the best multiplier.
+
+        Uses the Combat.calculate_damage formula, weighted by accuracy.
+
+        Args:
+            level: Attacker level.
+            attack: Attacker attack stat.
+            moves: Attacker moves as (move_type, power, accuracy) tuples.
+            defense: Defender defense stat.
+            defend_types: Tuple of the defender's types.
+
+        Returns:
+            tuple: (expected damage, highest multiplier).
+        """
+        best = 0.0
+        best_multiplier = 0.0
+        factor = (2 * level / 5 + 2) * attack / max(1, defense) / 50
+        for move_type, power, accuracy in moves:
+            multiplier = self.multiplier(move_type, defend_types)
+            if multiplier > best_multiplier:
+                best_multiplier = multiplier
+            if multiplier == 0.0:
+                continue
+            damage = max(1, int((factor * power + 2) * multiplier))
+            expected = damage * accuracy / 100
+            if expected > best:
+                best = expected
+        return best, best_multiplier
+
+    def mean_damage(self, level, attack, moves, defense, defend_types):
+        """Return the expected damage per turn of a random move choice.
+
+        Same formula as best_damage(), averaged over the moves (the way
+        the opponent AI picks its moves).
+
+        Args:
+            level: Attacker level.
+            attack: Attacker attack stat.
+            moves: Attacker moves as (move_type, power, accuracy) tuples.
+            defense: Defender defense stat.
+            defend_types: Tuple of the defender's types.
+
+        Returns:
+            float: Expected damage.
+        """
+        if not moves:
+            return 0.0
+        total = 0.0
+        factor = (2 * level / 5 + 2) * attack / max(1, defense) / 50
+        for move_type, power, accuracy in moves:
+            multiplier = self.multiplier(move_type, defend_types)
+            if multiplier == 0.0:
+                continue
+            total += max(1, int((factor * power + 2) * multiplier)) * accuracy / 100
+        return total / len(moves)
+
+    def build(self, candidates, opponents):
+        """Fill the margin and coverage tables.
+
+        Args:
+            candidates: List of describe() tuples (team candidates).
+            opponents: List of describe() tuples (opponent pool).
+        """
+        self.opponent_count = len(opponents)
+        self.margins = []
+        self.coverage = []
+        for _, level, hp, attack, defense, types, moves in candidates:
+            row = []
+            mask = 0
+            for j, opponent in enumerate(opponents):
+                _, o_level, o_hp, o_attack, o_defense, o_types, o_moves = opponent
+                diff = level - o_level
+                # Scale the opponent to the candidate's level (Pokemon.scale_to_level)
+                o_hp = max(1, o_hp + diff * Pokemon.HP_PER_LEVEL)
+                o_attack = max(1, o_attack + diff * Pokemon.ATTACK_PER_LEVEL)
+                o_defense = max(1, o_defense + diff * Pokemon.DEFENSE_PER_LEVEL)
+                dealt, multiplier = self.best_damage(level, attack, moves, o_defense, o_types)
+                taken, _ = self.best_damage(level, o_attack, o_moves, defense, types)
+                row.append(dealt / o_hp - taken / max(1, hp))
+                if multiplier >= 2.0:
+                    mask |= 1 << j
+            self.margins.append(row)
+            self.coverage.append(mask)
+
+    def team_score(self, members):
+        """Score a team against the opponent pool.
+
+        Args:
+            members: Candidate indices.
+
+        Returns:
+            tuple: (coverage share 0-1, mean over opponents of the best
+                member's margin).
+        """
+        if not members or not self.opponent_count:
+            return 0.0, 0.0
+        mask = 0
+        for i in members:
+            mask |= self.coverage[i]
+        total = 0.0
+        for j in range(self.opponent_count):
+            best = self.margins[members[0]][j]
+            for i in members[1:]:
+                if self.margins[i][j] > best:
+                    best = self.margins[i][j]
+            total += best
+        return bin(mask).count("1") / self.opponent_count, total / self.opponent_count
@@ -4,10 +4,16 @@
 class Move:
     """A Pokemon attack move with type, power, and accuracy.
 
+    Moves are immutable: the same Move object is shared by every Pokemon
+    that knows it (see MoveRegistry), so setting an attribute raises
+    AttributeError. Build a new Move (or ask the registry) instead.
+
     Example:
         thunderbolt = Move("Thunderbolt", "electric", 90, 100)
     """
 
+    __slots__ = ("name", "move_type", "power", "accuracy")
+
     def __init__(self, name="", move_type="normal", power=0, accuracy=100, data=None):
         """Create a new Move instance.
 
@@ -27,10 +33,26 @@ class Move:
             raise ValueError("Move name cannot be empty")
         if not (0 <= accuracy <= 100):
             raise ValueError("Accuracy must be between 0 and 100")
-        self.name = name
-        self.move_type = move_type
-        self.power = power
-        self.accuracy = accuracy
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "move_type", move_type)
+        object.__setattr__(self, "power", power)
+        object.__setattr__(self, "accuracy", accuracy)
+
+    def __setattr__(self, name, value):
+        """Refuse changes: the Move may be shared by many Pokemon."""
+        raise AttributeError("Move objects are immutable")
+
+    def __reduce__(self):
+        """Pickle/copy support (slots and a blocked __setattr__)."""
+        return (Move, (self.name, self.move_type, self.power, self.accuracy))
+
+    def key(self):
+        """Return the (name, move_type, power, accuracy) identity of the move.
+
+        Returns:
+            tuple: The fields that make two moves interchangeable.
+        """
+        return (self.name, self.move_type, self.power, self.accuracy)
 
     def to_dict(self):
         """Serialize this Move to a dictionary for JSON storage.
@@ -0,0 +1,188 @@
+"""Move registry module -- process-wide table of shared, interned moves."""
+
+import threading
+
+from models.move import Move
+
+
+class MoveRegistry:
+    """Process-wide table of Move objects, one per distinct move.
+
+    Most Pokemon know the same few moves ("Tackle", the default type
+    attack...). Building them from data used to create and validate a new
+    Move for every Pokemon, and again for every battle copy. The registry
+    interns moves by (name, move_type, power, accuracy): the first request
+    builds and validates the Move, later ones return that same object.
+    Moves are immutable, so sharing them is safe.
+
+    Each interned move also gets an ID (0, 1, 2... in the order first
+    seen), so Pokemon can be serialized with move IDs instead of move
+    dicts (Pokemon.to_dict(move_ids=True)). IDs are only valid in the
+    process that assigned them: anything written to disk keeps move dicts.
+
+    Usage::
+
+        tackle = MoveRegistry.get("Tackle", "normal", 40, 100)
+        tackle is MoveRegistry.from_dict(tackle.to_dict())   # True
+        move_id = MoveRegistry.id_of(tackle)
+        MoveRegistry.by_id(move_id) is tackle                # True
+        MoveRegistry.moves([{"name": ...}, move_id])         # [Move, Move]
+    """
+
+    _moves = {}
+    _ids = {}
+    _by_id = []
+    _defaults = {}
+    # Interning is rare (once per distinct move); the lock keeps IDs
+    # unique if two threads intern the same move at once
+    _lock = threading.Lock()
+
+    @classmethod
+    def _intern(cls, key):
+        """Return the shared Move for a key tuple, building it if needed.
+
+        Raises:
+            ValueError: If the move is invalid (see Move).
+        """
+        move = cls._moves.get(key)
+        if move is not None:
+            return move
+        move = Move(*key)
+        with cls._lock:
+            shared = cls._moves.get(key)
+            if shared is not None:
+                return shared
+            cls._ids[key] = len(cls._by_id)
+            cls._by_id.append(move)
+            cls._moves[key] = move
+        return move
+
+    @classmethod
+    def get(cls, name, move_type="normal", power=0, accuracy=100):
+        """Return the shared Move with these fields.
+
+        Args:
+            name: Display name.
+            move_type: Elemental type.
+            power: Base power.
+            accuracy: Hit chance as percentage (0-100).
+
+        Returns:
+            Move: The interned move.
+
+        Raises:
+            ValueError: If the move is invalid (see Move).
+        """
+        return cls._intern((name, move_type, power, accuracy))
+
+    @classmethod
+    def from_dict(cls, data):
+        """Return the shared Move for a move dict (Move.to_dict() format).
+
+        Args:
+            data: Dict with name, move_type, power and optionally accuracy.
+
+        Returns:
+            Move: The interned move.
+
+        Raises:
+            KeyError: If a required key is missing.
+            ValueError: If the move is invalid (see Move).
+        """
+        return cls._intern(
+            (data["name"], data["move_type"], data["power"], data.get("accuracy", 100))
+        )
+
+    @classmethod
+    def id_of(cls, move):
+        """Return the ID of a move, interning it if needed.
+
+        Args:
+            move: A Move (interned or not).
+
+        Returns:
+            int: The move ID (valid in this process only).
+        """
+        key = move.key()
+        move_id = cls._ids.get(key)
+        if move_id is None:
+            cls._intern(key)
+            move_id = cls._ids[key]
+        return move_id
+
+    @classmethod
+    def by_id(cls, move_id):
+        """Return the move with a given ID.
+
+        Args:
+            move_id: ID returned by id_of().
+
+        Returns:
+            Move: The interned move.
+
+        Raises:
+            ValueError: If no move has that ID.
+        """
+        if isinstance(move_id, bool) or not isinstance(move_id, int) \
+                or not 0 <= move_id < len(cls._by_id):
+            raise ValueError(f"Unknown move ID {move_id!r}")
+        return cls._by_id[move_id]
+
+    @classmethod
+    def moves(cls, entries):
+        """Return the shared moves for a list of move dicts and/or move IDs.
+
+        Args:
+            entries: Iterable of move dicts or move IDs.
+
+        Returns:
+            list[Move]: The interned moves, in order.
+
+        Raises:
+            KeyError: If a move dict misses a required key.
+            ValueError: If a move is invalid or an ID unknown.
+        """
+        # Hit path inlined: this runs for every move of every Pokemon built
+        shared = cls._moves
+        by_id = cls._by_id
+        moves = []
+        for entry in entries:
+            if isinstance(entry, dict):
+                key = (entry["name"], entry["move_type"], entry["power"],
+                       entry.get("accuracy", 100))
+                move = shared.get(key)
+                if move is None:
+                    move = cls._intern(key)
+            elif type(entry) is int and 0 <= entry < len(by_id):
+                move = by_id[entry]
+            else:
+                move = cls.by_id(entry)
+            moves.append(move)
+        return moves
+
+    @classmethod
+    def defaults(cls, primary_type):
+        """Return the fallback moves of Pokemon without moves.
+
+        Tackle (normal) plus "<Type> Attack" for a non-normal primary type,
+        computed once per type.
+
+        Args:
+            primary_type: The Pokemon's first type (None if it has none).
+
+        Returns:
+            tuple[Move]: The shared default moves.
+        """
+        defaults = cls._defaults.get(primary_type)
+        if defaults is None:
+            defaults = (cls.get("Tackle", "normal", 40, 100),)
+            if primary_type and primary_type != "normal":
+                defaults += (cls.get(f"{primary_type.capitalize()} Attack",
+                                     primary_type, 50, 100),)
+            cls._defaults[primary_type] = defaults
+        return defaults
+
+    @classmethod
+    def count(cls):
+        """Return the number of interned moves."""
+        return len(cls._by_id)
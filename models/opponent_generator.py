@@ -0,0 +1,407 @@
+"""Opponent generator module -- opponent teams for a target difficulty."""
+
+import bisect
+import collections
+import math
+import random
+from array import array
+
+from models.matchup_model import MatchupModel
+from models.pokemon import Pokemon
+from models.team_battle import TeamBattle
+
+
+class OpponentGenerator:
+    """Builds opponent teams the player beats with a chosen probability.
+
+    Two estimates are used:
+
+    - a type-neutral unit strength, attack * move power * HP * defense at
+      the battle level (damage scales with attack/defense and the time to
+      knock out with HP, so the product ranks how long a Pokemon lasts and
+      how hard it hits). The available roster is kept sorted by this
+      strength per battle level, so finding Pokemon near a target
+      strength is a binary search, whatever the roster size. Strengths
+      are computed from Game.roster_descriptions (no Pokemon built) and,
+      after a battle, only the entries that changed
+      (Game.roster_changes) are moved in the sorted lists;
+    - win_probability(), an estimate for two teams including type
+      matchups and team order. _playthrough() plays the battle out on
+      expected values, the way TeamBattle.resolve() does: both sides
+      send their Pokemon in team order, each turn removes the expected
+      share of the opposing Pokemon's HP (best move for the player,
+      average move for the opponent AI, which picks at random), and the
+      player strikes first whenever a new pair faces off (battle start,
+      after any KO). Its margin -- HP left on the player's side minus
+      the opponent's, in Pokemon, over the larger team size -- becomes
+      a probability with
+
+          P(win) = 1 / (1 + exp(-(BIAS + SHARPNESS * margin)))
+
+      SHARPNESS and BIAS were fitted (maximum likelihood) on
+      TeamBattle.resolve() outcomes of generated teams (random and
+      same-family teams of 1-6, levels 5-40, targets 0.2-0.9);
+      benchmarks/bench_models.py checks the calibration.
+
+    The model alone still misses for some teams (the expected-value
+    playthrough ignores misses, whole hits and the AI's random moves,
+    which matter most at low levels), so generate() corrects it with
+    simulated battles. It starts from the unit strength that makes even
+    teams (for the target odds) and runs TRIALS rounds: draw CANDIDATES
+    teams around the wanted strength, keep the one the model (shifted by
+    the offset measured so far) puts closest to the target, and play it
+    SIMULATIONS times with TeamBattle.resolve(). The offset is the
+    log-odds gap between the battles won over all rounds and the model;
+    a team's estimate is its own wins plus PRIOR_BATTLES battles at the
+    shifted model's odds. The wanted strength then moves by the
+    estimate's error, and is bisected once teams on both sides of the
+    target were seen. The team whose estimate is closest to the target
+    is returned. Only the played teams are built as Pokemon.
+
+    Example:
+        generator = OpponentGenerator(game.type_chart)
+        opponents = generator.generate(game, player_team, target=0.6)
+    """
+
+    SHARPNESS = 12.7
+    BIAS = -1.0
+    TRIALS = 6
+    # Teams drawn (and estimated by the model) per trial
+    CANDIDATES = 6
+    # Battles played per trial, and weight (in battles) of the model's
+    # odds in a team's estimate
+    SIMULATIONS = 12
+    PRIOR_BATTLES = 4
+    # Log-odds change per unit of log strength ratio (generate's steps)
+    STRENGTH_SLOPE = 5.0
+    # Neighbours (by strength rank) each pick is drawn from, for variety
+    WINDOW = 6
+    INDEX_CACHE_SIZE = 8
+    # Strength recorded for locked entries (real strengths are >= 1)
+    UNAVAILABLE = -1.0
+
+    def __init__(self, type_chart, seed=None):
+        """Create a generator.
+
+        Args:
+            type_chart: Loaded TypeChart.
+            seed: Optional random seed (for reproducible teams).
+        """
+        self.rng = random.Random(seed)
+        self.type_chart = type_chart
+        self._indexes = collections.OrderedDict()
+        # Used for its memoized type multipliers and damage formula
+        self._model = MatchupModel(type_chart.chart)
+
+    def generate(self, game, player_team, target=0.55, size=None):
+        """Build an opponent team for the player's team.
+
+        Opponents are copies of available roster entries, scaled to the
+        player team's average level.
+
+        Args:
+            game: The Game instance (roster, roster_descriptions,
+                roster_changes()).
+            player_team: List of the player's Pokemon.
+            target: Desired player win probability (0-1).
+            size: Opponent team size (default: same as the player team).
+
+        Returns:
+            list[Pokemon]: The opponent team (empty if none available).
+        """
+        if size is None:
+            size = len(player_team)
+        level = sum(p.level for p in player_team) // max(1, len(player_team))
+        strengths, order = self._index(game, level)
+        size = min(size, len(order))
+        if size <= 0:
+            return []
+
+        target = min(0.99, max(0.01, target))
+        player_strength = 0.0
+        for p in player_team:
+            player_strength += self.unit_strength(
+                p.max_hp, p.attack, p.defense, p.moves, best_move=True
+            )
+        player_strength /= max(1, len(player_team))
+        # Log-odds fall by STRENGTH_SLOPE per unit of log(s_opponent / s_player)
+        log_wanted = math.log(player_strength) - self._logit(target) / self.STRENGTH_SLOPE
+
+        players = [MatchupModel.describe(p) for p in player_team]
+        entries = game.roster_descriptions.entries
+        goal = self._logit(target)
+        offset = 0.0
+        logits = []
+        wins = battles = 0
+        low = high = None
+        best_team = None
+        best_error = None
+        for _ in range(self.TRIALS):
+            # Screen CANDIDATES draws with the model, play the closest one
+            picks = logit = None
+            for _ in range(self.CANDIDATES):
+                drawn = self._draw(strengths, order, math.exp(log_wanted), size)
+                opponents = [self._scaled(entries[i], level) for i in drawn]
+                drawn_logit = self._logit(self._probability(players, opponents))
+                if picks is None or abs(drawn_logit + offset - goal) < abs(logit + offset - goal):
+                    picks, logit = drawn, drawn_logit
+            team = []
+            for index in picks:
+                p = Pokemon(data=game.get_pokemon(index).to_dict(move_ids=True))
+                p.scale_to_level(level)
+                team.append(p)
+            won = self.simulate(player_team, team, self.SIMULATIONS)
+            wins += won
+            battles += self.SIMULATIONS
+            logits.append(logit)
+            # Log-odds the model is off by, over the battles played so far
+            offset = self._logit((wins + 0.5) / (battles + 1)) - sum(logits) / len(logits)
+            prior = 1 / (1 + math.exp(-(logit + offset)))
+            estimate = (won + self.PRIOR_BATTLES * prior) / (self.SIMULATIONS + self.PRIOR_BATTLES)
+            error = abs(estimate - target)
+            if best_error is None or error < best_error:
+                best_team, best_error = team, error
+            # Too easy: aim stronger next time (and the other way round),
+            # halving the bracket once teams on both sides were seen
+            if estimate > target:
+                low = log_wanted
+            else:
+                high = log_wanted
+            if low is not None and high is not None:
+                log_wanted = (low + high) / 2
+            else:
+                log_wanted += (self._logit(estimate) - goal) / self.STRENGTH_SLOPE
+        return best_team
+
+    def simulate(self, player_team, opponent_team, battles):
+        """Play copies of two teams with TeamBattle.resolve() and count wins.
+
+        Args:
+            player_team: List of Pokemon (not modified).
+            opponent_team: List of Pokemon (not modified).
+            battles: Number of battles to play.
+
+        Returns:
+            int: Battles the player won.
+        """
+        players = [p.to_dict(move_ids=True) for p in player_team]
+        opponents = [p.to_dict(move_ids=True) for p in opponent_team]
+        wins = 0
+        for _ in range(battles):
+            battle = TeamBattle(
+                [Pokemon(data=data) for data in players],
+                [Pokemon(data=data) for data in opponents],
+                self.type_chart, rng=self.rng,
+            )
+            battle.resolve()
+            wins += battle.winner == "player"
+        return wins
+
+    @staticmethod
+    def _logit(probability):
+        """Return the log-odds of a probability (clamped to 0.001-0.999)."""
+        probability = min(0.999, max(0.001, probability))
+        return math.log(probability / (1 - probability))
+
+    def _draw(self, strengths, order, wanted, size):
+        """Pick `size` distinct roster indices with strength near `wanted`."""
+        center = bisect.bisect_left(strengths, wanted)
+        picks = []
+        used = set()
+        for _ in range(size):
+            for _attempt in range(4 * self.WINDOW):
+                rank = center + self.rng.randint(-self.WINDOW, self.WINDOW)
+                rank = min(len(order) - 1, max(0, rank))
+                if rank not in used:
+                    break
+            else:
+                # Window exhausted: take the nearest unused rank
+                rank = next(r for r in range(len(order)) if r not in used)
+            used.add(rank)
+            picks.append(order[rank])
+        return picks
+
+    def _index(self, game, level):
+        """Return (sorted strengths, roster indices) for the available roster.
+
+        Cached per level. A cached index is brought up to date by moving
+        the entries changed since it was built; it is rebuilt only when
+        the roster was replaced.
+        """
+        descriptions = game.roster_descriptions
+        descriptions.refresh()
+        index = self._indexes.get(level)
+        if index is not None:
+            self._indexes.move_to_end(level)
+            changes = game.roster_changes(index[0])
+            if changes is not None:
+                self._patch(descriptions, level, index, changes)
+                index[0] = game.roster_version
+                return index[1], index[2]
+        # Strength of every roster index (UNAVAILABLE if locked)
+        known = array("d")
+        entries = []
+        locked = descriptions.locked
+        for i, description in enumerate(descriptions.entries):
+            strength = self._strength(description, locked[i], level)
+            known.append(strength)
+            if strength != self.UNAVAILABLE:
+                entries.append((strength, i))
+        entries.sort()
+        index = [game.roster_version, [s for s, _ in entries], [i for _, i in entries], known]
+        self._indexes[level] = index
+        while len(self._indexes) > self.INDEX_CACHE_SIZE:
+            self._indexes.popitem(last=False)
+        return index[1], index[2]
+
+    def _patch(self, descriptions, level, index, changes):
+        """Move changed roster entries to their new place in a level index.
+
+        Ties stay ordered by roster index, as after a full rebuild.
+        """
+        _, strengths, order, known = index
+        for i in sorted(changes):
+            if i < len(known) and known[i] != self.UNAVAILABLE:
+                pos = bisect.bisect_left(strengths, known[i])
+                while order[pos] != i:
+                    pos += 1
+                del strengths[pos]
+                del order[pos]
+            while len(known) <= i:
+                known.append(self.UNAVAILABLE)
+            strength = self._strength(descriptions.entries[i], descriptions.locked[i], level)
+            known[i] = strength
+            if strength == self.UNAVAILABLE:
+                continue
+            pos = bisect.bisect_left(strengths, strength)
+            while pos < len(order) and strengths[pos] == strength and order[pos] < i:
+                pos += 1
+            strengths.insert(pos, strength)
+            order.insert(pos, i)
+
+    def _strength(self, description, locked, level):
+        """Return a roster entry's unit strength at a level (UNAVAILABLE if locked).
+
+        Args:
+            description: MatchupModel.describe() tuple of the entry.
+            locked: Whether the entry is locked.
+            level: Battle level.
+        """
+        if locked:
+            return self.UNAVAILABLE
+        _, _, hp, attack, defense, _, moves = self._scaled(description, level)
+        powers = [power * accuracy / 100 for _, power, accuracy in moves] or [1.0]
+        return self._combine(hp, attack, defense, sum(powers) / len(powers))
+
+    @staticmethod
+    def _scaled(description, level):
+        """Return a MatchupModel.describe() tuple as at another level.
+
+        Applies the stat changes of Pokemon.scale_to_level() to the tuple.
+        """
+        name, entry_level, hp, attack, defense, types, moves = description
+        if entry_level == level:
+            return description
+        diff = level - entry_level
+        return (
+            name, level,
+            max(1, hp + diff * Pokemon.HP_PER_LEVEL),
+            max(1, attack + diff * Pokemon.ATTACK_PER_LEVEL),
+            max(1, defense + diff * Pokemon.DEFENSE_PER_LEVEL),
+            types, moves,
+        )
+
+    @staticmethod
+    def unit_strength(hp, attack, defense, moves, best_move=False):
+        """Return the type-neutral strength of one Pokemon.
+
+        Args:
+            hp: Max HP.
+            attack: Attack stat.
+            defense: Defense stat.
+            moves: List of Move.
+            best_move: Use the best move's expected power (player) instead
+                of the average (opponent AI).
+
+        Returns:
+            float: attack * expected power * hp * defense.
+        """
+        powers = [m.power * m.accuracy / 100 for m in moves] or [1.0]
+        power = max(powers) if best_move else sum(powers) / len(powers)
+        return OpponentGenerator._combine(hp, attack, defense, power)
+
+    @staticmethod
+    def _combine(hp, attack, defense, power):
+        """Return attack * expected power * hp * defense (power floored at 1)."""
+        return attack * max(1.0, power) * hp * defense
+
+    def win_probability(self, player_team, opponent_team):
+        """Estimate the chance that player_team beats opponent_team.
+
+        Args:
+            player_team: List of Pokemon.
+            opponent_team: List of Pokemon.
+
+        Returns:
+            float: Estimated win probability (0-1).
+        """
+        if not opponent_team:
+            return 1.0
+        if not player_team:
+            return 0.0
+        players = [MatchupModel.describe(p) for p in player_team]
+        opponents = [MatchupModel.describe(p) for p in opponent_team]
+        return self._probability(players, opponents)
+
+    def _probability(self, players, opponents):
+        """win_probability() on MatchupModel.describe() tuples."""
+        margin = self._playthrough(players, opponents)
+        return 1 / (1 + math.exp(-(self.BIAS + self.SHARPNESS * margin)))
+
+    def _playthrough(self, players, opponents):
+        """Play a battle out on expected damage (see the class docstring).
+
+        Args:
+            players: MatchupModel.describe() tuples, in team order.
+            opponents: MatchupModel.describe() tuples, in team order.
+
+        Returns:
+            float: (player HP left - opponent HP left) in Pokemon, over
+                the larger team size (-1 to 1).
+        """
+        player_hp = [1.0] * len(players)
+        opponent_hp = [1.0] * len(opponents)
+        i = j = 0
+        while i < len(players) and j < len(opponents):
+            hit = self._share(players[i], opponents[j], best_move=True)
+            taken = self._share(opponents[j], players[i], best_move=False)
+            if hit <= 0 and taken <= 0:
+                # Nobody can hurt the other: resolve() forfeits
+                return -1.0
+            # The player strikes first in every new pair
+            opponent_hp[j] -= hit
+            if opponent_hp[j] <= 0:
+                opponent_hp[j] = 0.0
+                j += 1
+                continue
+            player_turns = opponent_hp[j] / hit if hit > 0 else math.inf
+            opponent_turns = player_hp[i] / taken if taken > 0 else math.inf
+            if player_turns <= opponent_turns:
+                player_hp[i] -= player_turns * taken
+                opponent_hp[j] = 0.0
+                j += 1
+            else:
+                opponent_hp[j] -= opponent_turns * hit
+                player_hp[i] = 0.0
+                i += 1
+        return (sum(player_hp) - sum(opponent_hp)) / max(len(players), len(opponents))
+
+    def _share(self, attacker, defender, best_move):
+        """Share of the defender's HP the attacker removes per turn (at most 1)."""
+        _, level, _, attack, _, _, moves = attacker
+        _, _, hp, _, defense, types, _ = defender
+        if best_move:
+            damage, _ = self._model.best_damage(level, attack, moves, defense, types)
+        else:
+            damage = self._model.mean_damage(level, attack, moves, defense, types)
+        return min(1.0, damage / max(1, hp))
@@ -1,6 +1,9 @@
 """Pokemon module -- represents a Pokemon creature with stats and types."""
 
-from models.move import Move
+import math
+
+from models.move_registry import MoveRegistry
+from models.type_chart import TypeChart
 
 
 class Pokemon:
@@ -12,6 +15,28 @@ class Pokemon:
         pikachu.is_alive()        # returns True
     """
 
+    # to_dict() keys stored as-is on the instance (see apply_dict)
+    PLAIN_FIELDS = (
+        "name", "level", "attack", "defense", "sprite_path", "xp",
+        "xp_to_next_level", "evolution_level", "evolution_target", "locked",
+    )
+
+    # Level curve: reaching level L costs XP_BASE + L * XP_PER_LEVEL more XP
+    XP_BASE = 10
+    XP_PER_LEVEL = 5
+    # Stat gains per level
+    HP_PER_LEVEL = 5
+    ATTACK_PER_LEVEL = 3
+    DEFENSE_PER_LEVEL = 2
+    # Largest stat, move power and level accepted from users (validate_data)
+    MAX_STAT = 9999
+    MAX_LEVEL = 100
+
+    # SpeciesRegistry set by Game: evolved forms take the species' types,
+    # moves and next stage (Bulbasaur -> Ivysaur -> Venusaur). Setting it
+    # on an instance overrides it for that Pokemon only (battle server)
+    species_registry = None
+
     def __init__(self, name="", hp=20, level=5, attack=10, defense=10,
                  types=None, sprite_path="", data=None):
         """Create a new Pokemon instance.
@@ -41,12 +66,12 @@ class Pokemon:
         self.level = level
         self.attack = attack
         self.defense = defense
-        self.types = types if types is not None else ["normal"]
+        self.types = list(types) if types is not None else ["normal"]
         self.sprite_path = sprite_path
 
         # XP and evolution system
         self.xp = 0
-        self.xp_to_next_level = 10 + level * 5
+        self.xp_to_next_level = self.xp_needed(level)
         self.evolution_level = None
         self.evolution_target = None
 
@@ -56,35 +81,144 @@ class Pokemon:
         # Locked Pokemon are not available for selection at game start
         self.locked = False
 
+        # Baseline for dirty_fields(), set by mark_clean()
+        self._clean_state = None
+
         # If built from data, restore extra fields
         if data is not None:
             self.xp = data.get("xp", 0)
-            self.xp_to_next_level = data.get("xp_to_next_level", 10 + self.level * 5)
+            self.xp_to_next_level = data.get("xp_to_next_level", self.xp_needed(self.level))
             self.evolution_level = data.get("evolution_level", None)
             self.evolution_target = data.get("evolution_target", None)
             raw_moves = data.get("moves", [])
             if raw_moves:
-                moves = []
-                for m in raw_moves:
-                    moves.append(Move(data=m))
-                self.moves = moves
+                # Shared Move objects (dicts or move IDs), validated once
+                self.moves = MoveRegistry.moves(raw_moves)
             if not self.moves:
                 self.moves = self.get_default_moves()
             self.locked = data.get("locked", False)
 
+    @staticmethod
+    def validate_data(data):
+        """Validate user-supplied Pokemon data and return a clean copy.
+
+        These are the rules of the Add Pokemon form, shared with the bulk
+        importer: a non-empty name (capitalized), integer HP/Attack/Defense
+        from 1 to MAX_STAT, one or two known types, and valid moves if any
+        (see _validate_move).
+
+        Args:
+            data: Dict with name, hp, attack, defense, types, and optionally
+                level and moves. Numbers may be given as strings.
+
+        Returns:
+            dict: Data ready for Pokemon(data=...) / Game.add_pokemon().
+
+        Raises:
+            ValueError: With a human-readable reason if a rule is broken.
+        """
+        name = str(data.get("name") or "").strip()
+        if not name:
+            raise ValueError("Name is required")
+
+        try:
+            stats = []
+            for key in ("hp", "attack", "defense"):
+                value = data.get(key)
+                if isinstance(value, (bool, float)):
+                    raise ValueError(key)
+                stats.append(int(value))
+        except (TypeError, ValueError):
+            raise ValueError("HP, Attack, Defense must be numbers")
+        hp, attack, defense = stats
+        if hp < 1 or attack < 1 or defense < 1:
+            raise ValueError("Stats must be at least 1")
+        if max(stats) > Pokemon.MAX_STAT:
+            raise ValueError(f"Stats must be at most {Pokemon.MAX_STAT}")
+
+        types = data.get("types") or []
+        if isinstance(types, str):
+            types = [types]
+        types = [str(t).strip().lower() for t in types if str(t).strip()]
+        if not types:
+            raise ValueError("Select at least one type")
+        if len(types) > 2:
+            raise ValueError("A Pokemon has at most two types")
+        for t in types:
+            if t not in TypeChart.TYPES:
+                raise ValueError(f"Unknown type '{t}'")
+
+        level = data.get("level", 5)
+        try:
+            if isinstance(level, (bool, float)):
+                raise ValueError(level)
+            level = int(level)
+        except (TypeError, ValueError):
+            raise ValueError("Level must be a number")
+        if not 1 <= level <= Pokemon.MAX_LEVEL:
+            raise ValueError(f"Level must be between 1 and {Pokemon.MAX_LEVEL}")
+
+        moves = []
+        for m in data.get("moves") or []:
+            moves.append(Pokemon._validate_move(m))
+
+        return {
+            "name": name.capitalize(),
+            "hp": hp,
+            "level": level,
+            "attack": attack,
+            "defense": defense,
+            "types": types,
+            "sprite_path": str(data.get("sprite_path") or ""),
+            "moves": moves,
+        }
+
+    @staticmethod
+    def _validate_move(data):
+        """Validate one user-supplied move dict and return a clean copy.
+
+        A move needs a non-empty name, a known move_type, an integer power
+        from 0 to MAX_STAT and an integer accuracy from 0 to 100 (default
+        100). Nothing is coerced: these values go into the shared
+        MoveRegistry, the damage formula and compact saves.
+
+        Raises:
+            ValueError: With a human-readable reason if a rule is broken.
+        """
+        if not isinstance(data, dict):
+            raise ValueError(f"Invalid move: expected an object, got {data!r}")
+        for key in ("name", "move_type", "power"):
+            if key not in data:
+                raise ValueError(f"Invalid move: missing '{key}'")
+        name = data["name"]
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError("Invalid move: name is required")
+        move_type = data["move_type"]
+        if not isinstance(move_type, str) or move_type.strip().lower() not in TypeChart.TYPES:
+            raise ValueError(f"Invalid move: unknown type {move_type!r}")
+        power = data["power"]
+        if type(power) is not int or not 0 <= power <= Pokemon.MAX_STAT:
+            raise ValueError(
+                f"Invalid move: power must be an integer from 0 to {Pokemon.MAX_STAT}, got {power!r}"
+            )
+        accuracy = data.get("accuracy", 100)
+        if type(accuracy) is not int or not 0 <= accuracy <= 100:
+            raise ValueError(
+                f"Invalid move: accuracy must be an integer from 0 to 100, got {accuracy!r}"
+            )
+        move = MoveRegistry.get(name.strip(), move_type.strip().lower(), power, accuracy)
+        return move.to_dict()
+
     def get_default_moves(self):
         """Generate fallback moves if this Pokemon has none.
 
-        Creates Tackle (normal) + a move matching the Pokemon's primary type.
+        Tackle (normal) + a move matching the Pokemon's primary type, shared
+        through MoveRegistry.
 
         Returns:
-            list[Move]: Default move list.
+            list[Move]: Default move list (a new list of shared moves).
         """
-        defaults = [Move("Tackle", "normal", 40, 100)]
-        if self.types and self.types[0] != "normal":
-            type_move_name = f"{self.types[0].capitalize()} Attack"
-            defaults.append(Move(type_move_name, self.types[0], 50, 100))
-        return defaults
+        return list(MoveRegistry.defaults(self.types[0] if self.types else None))
 
     def take_damage(self, amount):
         """Reduce HP by the given amount, floored at 0.
@@ -102,43 +236,139 @@ class Pokemon:
         """
         return self.hp > 0
 
+    @classmethod
+    def xp_needed(cls, level):
+        """Return the XP needed to go from `level` to `level + 1`.
+
+        Args:
+            level: Current level.
+
+        Returns:
+            int: XP_BASE + level * XP_PER_LEVEL.
+        """
+        return cls.XP_BASE + level * cls.XP_PER_LEVEL
+
+    @classmethod
+    def compute_levels(cls, level, xp, xp_to_next_level, amount):
+        """Compute the outcome of an XP award in constant time.
+
+        The first level costs xp_to_next_level (as stored, which may not
+        follow the curve); level k after that costs xp_needed(k). The XP
+        needed for m more levels from level L1 is the arithmetic series
+        m * xp_needed(L1) + XP_PER_LEVEL * m * (m - 1) / 2, so m is the
+        largest root of a quadratic, found with an integer square root.
+
+        Args:
+            level: Current level.
+            xp: Current XP towards the next level.
+            xp_to_next_level: XP needed for the next level.
+            amount: XP awarded.
+
+        Returns:
+            tuple: (levels gained, remaining xp, new xp_to_next_level).
+        """
+        total = xp + amount
+        if total < xp_to_next_level:
+            return 0, total, xp_to_next_level
+        total -= xp_to_next_level
+        first = level + 1
+        # Largest m with a*m^2 + b*m <= 2*total (series doubled)
+        a = cls.XP_PER_LEVEL
+        b = 2 * cls.xp_needed(first) - cls.XP_PER_LEVEL
+        m = (math.isqrt(b * b + 8 * a * total) - b) // (2 * a)
+        # isqrt rounds down; settle the last step exactly
+        while a * (m + 1) * (m + 1) + b * (m + 1) <= 2 * total:
+            m += 1
+        while m > 0 and a * m * m + b * m > 2 * total:
+            m -= 1
+        spent = (a * m * m + b * m) // 2
+        new_level = first + m
+        return m + 1, total - spent, cls.xp_needed(new_level)
+
     def gain_xp(self, amount):
         """Add XP and handle level ups.
 
+        Runs in constant time whatever the award (see compute_levels);
+        evolutions are then applied for the final level.
+
         Args:
             amount: XP points to add (positive int).
+
+        Returns:
+            int: Number of levels gained.
+        """
+        levels, self.xp, self.xp_to_next_level = self.compute_levels(
+            self.level, self.xp, self.xp_to_next_level, amount
+        )
+        if levels:
+            self._level_up(levels)
+        return levels
+
+    @staticmethod
+    def gain_xp_team(team, amounts):
+        """Apply XP to a whole team at once.
+
+        Args:
+            team: List of Pokemon.
+            amounts: One XP amount for everyone, or a list with one amount
+                per team member.
+
+        Returns:
+            list[int]: Levels gained by each team member.
         """
-        self.xp += amount
-        while self.xp >= self.xp_to_next_level:
-            self.xp -= self.xp_to_next_level
-            self._level_up()
-
-    def _level_up(self):
-        """Increase level and stats. Called automatically by gain_xp()."""
-        self.level += 1
-        self.max_hp += 5
-        self.attack += 3
-        self.defense += 2
+        if isinstance(amounts, int):
+            amounts = [amounts] * len(team)
+        gained = []
+        for pokemon, amount in zip(team, amounts):
+            gained.append(pokemon.gain_xp(amount))
+        return gained
+
+    def _level_up(self, levels=1):
+        """Increase level and stats, then evolve if due. Called by gain_xp().
+
+        Args:
+            levels: Number of levels gained.
+        """
+        self.level += levels
+        self.max_hp += levels * self.HP_PER_LEVEL
+        self.attack += levels * self.ATTACK_PER_LEVEL
+        self.defense += levels * self.DEFENSE_PER_LEVEL
         self.hp = self.max_hp
-        self.xp_to_next_level = 10 + self.level * 5
         self._try_evolve()
 
     def _try_evolve(self):
-        """Evolve this Pokemon if level requirement is met.
+        """Evolve this Pokemon as far as its level allows.
 
-        Updates name and sprite path. Stats are kept as-is (accumulated
-        from level ups).
+        Stats are kept as-is (accumulated from level ups). When
+        a species_registry is set, the evolved form takes its
+        species' types, moves, sprite and next stage, so a large XP award
+        can evolve through several stages at once. Otherwise only the name
+        and sprite path change.
         """
-        if self.evolution_level is None or self.evolution_target is None:
-            return
-        if self.level < self.evolution_level:
-            return
+        while self.evolution_level is not None and self.evolution_target is not None:
+            if self.level < self.evolution_level:
+                return
 
-        self.name = self.evolution_target
-        # Derive sprite path from the new name
-        self.sprite_path = f"assets/sprites/{self.name.lower()}.png"
-        self.evolution_level = None
-        self.evolution_target = None
+            self.name = self.evolution_target
+            self.evolution_level = None
+            self.evolution_target = None
+            species = None
+            if self.species_registry is not None:
+                species = self.species_registry.get(self.name)
+            if species is None:
+                # Derive sprite path from the new name
+                self.sprite_path = f"assets/sprites/{self.name.lower()}.png"
+                continue
+            self.name = species["name"]
+            self.sprite_path = species.get(
+                "sprite_path", f"assets/sprites/{self.name.lower()}.png"
+            )
+            self.types = list(species.get("types", self.types))
+            if species.get("moves"):
+                self.moves = MoveRegistry.moves(species["moves"])
+            next_stage = self.species_registry.next_stage(self.name)
+            if next_stage is not None:
+                self.evolution_level, self.evolution_target = next_stage
 
     def scale_to_level(self, target_level):
         """Scale this Pokemon's stats to match a target level.
@@ -153,21 +383,87 @@ class Pokemon:
             return
         diff = target_level - self.level
         self.level = target_level
-        self.max_hp = max(1, self.max_hp + diff * 5)
-        self.attack = max(1, self.attack + diff * 3)
-        self.defense = max(1, self.defense + diff * 2)
+        self.max_hp = max(1, self.max_hp + diff * self.HP_PER_LEVEL)
+        self.attack = max(1, self.attack + diff * self.ATTACK_PER_LEVEL)
+        self.defense = max(1, self.defense + diff * self.DEFENSE_PER_LEVEL)
         self.hp = self.max_hp
-        self.xp_to_next_level = 10 + self.level * 5
+        self.xp_to_next_level = self.xp_needed(self.level)
+
+    def apply_dict(self, data):
+        """Overwrite attributes from a (possibly partial) to_dict() dictionary.
 
-    def to_dict(self):
+        Used to replay saved changes. As in to_dict(), "hp" is the max HP and
+        the Pokemon is fully healed.
+
+        Args:
+            data: Dict with any subset of the to_dict() keys (moves as move
+                dicts or move IDs).
+        """
+        for key, value in data.items():
+            if key == "hp":
+                self.max_hp = value
+                self.hp = value
+            elif key == "moves":
+                self.moves = MoveRegistry.moves(value)
+            elif key == "types":
+                self.types = list(value)
+            elif key in self.PLAIN_FIELDS:
+                setattr(self, key, value)
+
+    def _tracked_state(self):
+        """Return the fields synced back after a battle, as to_dict() values.
+
+        Moves are kept as move IDs: comparing them is cheaper than
+        comparing move dicts.
+        """
+        state = self.to_dict(move_ids=True)
+        # Lock state is roster-only; battle copies never change it
+        del state["locked"]
+        return state
+
+    def mark_clean(self):
+        """Record the current state as the baseline for dirty_fields()."""
+        self._clean_state = self._tracked_state()
+
+    def dirty_fields(self):
+        """Return the fields changed since mark_clean().
+
+        Returns:
+            dict: Changed to_dict() keys and their current values ("hp" is
+                the max HP). Every tracked field if mark_clean() was never
+                called.
+        """
+        state = self._tracked_state()
+        if self._clean_state is None:
+            changed = state
+        else:
+            changed = {}
+            for key, value in state.items():
+                if self._clean_state.get(key) != value:
+                    changed[key] = value
+        if "moves" in changed:
+            # Changes are journaled: store moves as dicts, not process IDs
+            changed["moves"] = [m.to_dict() for m in self.moves]
+        return changed
+
+    def to_dict(self, move_ids=False):
         """Serialize this Pokemon to a dictionary for JSON storage.
 
+        Args:
+            move_ids: Store moves as MoveRegistry IDs instead of move dicts.
+                Smaller and faster for in-process copies (battle teams),
+                but only valid in this process: never write it to disk.
+
         Returns:
             dict: All Pokemon data as a plain dictionary.
         """
         moves_list = []
-        for m in self.moves:
-            moves_list.append(m.to_dict())
+        if move_ids:
+            for m in self.moves:
+                moves_list.append(MoveRegistry.id_of(m))
+        else:
+            for m in self.moves:
+                moves_list.append(m.to_dict())
         # Saves max_hp as "hp" -- Pokemon are fully healed on load (by design)
         return {
             "name": self.name,
@@ -175,7 +471,7 @@ class Pokemon:
             "level": self.level,
             "attack": self.attack,
             "defense": self.defense,
-            "types": self.types,
+            "types": list(self.types),
             "sprite_path": self.sprite_path,
             "xp": self.xp,
             "xp_to_next_level": self.xp_to_next_level,
@@ -0,0 +1,91 @@
+"""Roster descriptions module -- matchup view of every roster entry, kept current."""
+
+from models.matchup_model import MatchupModel
+from models.move_registry import MoveRegistry
+
+
+class RosterDescriptions:
+    """MatchupModel.describe() tuple and lock state of every roster entry.
+
+    The opponent generator and the team optimizer need the stats, types
+    and moves of the whole roster. Reading them from the Pokemon meant
+    building one for every lazy record (seconds on a large roster), on
+    the UI thread, for every battle or suggestion. This table is built
+    once -- from the species database records when the roster is lazy,
+    without building any Pokemon -- and then refresh() only re-describes
+    the entries changed since (Game.roster_changes).
+
+    Equal types and move tuples are shared between entries, so the table
+    stays small even for a large roster.
+
+    Example:
+        descriptions = RosterDescriptions(game)
+        descriptions.refresh()
+        for index, description in descriptions.available():
+            ...
+    """
+
+    def __init__(self, game):
+        """Create an empty table (filled by the first refresh()).
+
+        Args:
+            game: The Game whose roster is described.
+        """
+        self.game = game
+        self.version = None
+        self.entries = []
+        self.locked = bytearray()
+        self._shared = {}
+
+    def refresh(self):
+        """Bring the table up to date with the roster.
+
+        Returns:
+            set[int] or None: Indices re-described, None after a full build.
+        """
+        game = self.game
+        changes = game.roster_changes(self.version)
+        if changes is None:
+            self.entries = []
+            self.locked = bytearray()
+            self._shared = {}
+            for entry in game.roster_summaries(moves=True):
+                self.entries.append(self._describe(entry))
+                self.locked.append(entry.locked)
+        else:
+            for index in changes:
+                pokemon = game.get_pokemon(index)
+                while len(self.entries) <= index:
+                    self.entries.append(None)
+                    self.locked.append(1)
+                self.entries[index] = self._describe(pokemon)
+                self.locked[index] = pokemon.locked
+        self.version = game.roster_version
+        return changes
+
+    def available(self):
+        """Return (roster index, description) for every unlocked entry.
+
+        Returns:
+            list[tuple]: Entries in roster order.
+        """
+        locked = self.locked
+        return [(i, d) for i, d in enumerate(self.entries) if not locked[i]]
+
+    def _describe(self, entry):
+        """Describe a Pokemon or a SpeciesDatabase.Summary (moves decoded)."""
+        if not isinstance(entry, tuple):
+            description = MatchupModel.describe(entry)
+        else:
+            moves = entry.moves
+            if not moves:
+                # What the Pokemon built from this record would know
+                defaults = MoveRegistry.defaults(entry.types[0] if entry.types else None)
+                moves = [(m.move_type, m.power, m.accuracy) for m in defaults]
+            description = (
+                entry.name, entry.level, entry.max_hp, entry.attack,
+                entry.defense, tuple(entry.types), tuple(moves),
+            )
+        types = self._shared.setdefault(description[5], description[5])
+        moves = self._shared.setdefault(description[6], description[6])
+        return description[:5] + (types, moves)
@@ -0,0 +1,360 @@
+"""Roster index module -- name search and filters over bitsets."""
+
+import itertools
+from array import array
+
+
+class RosterIndex:
+    """Search index of the roster: name prefixes, n-grams and bitsets.
+
+    Every roster position has one bit in each bitset it belongs to: one
+    per type, locked, level, level block (LEVEL_BLOCK levels), stat value,
+    stat bucket (STAT_BUCKET points of max HP, attack or defense) and
+    first letter of the name. A query ANDs/ORs a few of them as Python ints, whose bitwise
+    operations work a machine word at a time, so it costs a few
+    microseconds per bitset whatever the roster size. Bitsets are stored
+    as bytearrays (setting a bit is O(1)) and converted to ints on first
+    use, cached until they change.
+
+    Names are matched by prefix for 1 or 2 letters and by substring from 3
+    letters on, through posting lists (roster positions per two-letter
+    prefix and per 3- and 4-letter gram). A 3 or 4 letter query is one
+    posting list; a longer one ANDs the postings of its 4-grams, then
+    checks the few candidates left against the full query.
+
+    The Game keeps the index up to date: rebuild() when the roster is
+    replaced, add() for a new Pokemon, update() when one changes (level,
+    stats, evolution, unlock).
+
+    Example:
+        index = RosterIndex()
+        index.rebuild(game.get_all_pokemon())
+        matches = index.query("char", types=["fire"], locked=False)
+        matches.bit_count()          # number of matches
+        index.page(matches, 0, 20)   # first 20 roster indices
+    """
+
+    STATS = ("max_hp", "attack", "defense")
+    STAT_BUCKET = 10
+    LEVEL_BLOCK = 10
+    # Bytes scanned per step when skipping to a page of matches
+    CHUNK_BYTES = 64
+    # Posting-list bitsets (prefixes, trigrams) kept after a query
+    SPARSE_CACHE_SIZE = 256
+
+    def __init__(self):
+        """Create an empty index."""
+        self._reset()
+
+    def _reset(self):
+        """Drop every entry."""
+        self._size = 0
+        # Per entry: (lowercase name, level, types, locked, stats...), the
+        # fields its keys are computed from
+        self._entries = []
+        self._max_level = 0
+        self._max_bucket = {stat: 0 for stat in self.STATS}
+        # Dense bitsets (bytearray, bit i = roster index i)
+        self._dense = {}
+        # Sparse keys: roster indices per two-letter prefix / 3-4 letter gram
+        self._postings = {}
+        # Int versions of the bitsets, dropped when the key changes
+        self._ints = {}
+        self._sparse_ints = {}
+
+    def __len__(self):
+        """Return the number of indexed Pokemon."""
+        return self._size
+
+    def rebuild(self, pokemon_list):
+        """Index a whole roster (replaces the current entries).
+
+        Each bitset and posting list is built once from all its indices,
+        rather than entry by entry as add() does.
+
+        Args:
+            pokemon_list: Iterable of Pokemon (or any objects with their
+                name, level, max_hp, attack, defense, types and locked), in
+                roster order.
+        """
+        self._reset()
+        dense_indices = {}
+        sparse_indices = {}
+        for index, pokemon in enumerate(pokemon_list):
+            entry = self._entry(pokemon)
+            self._entries.append(entry)
+            dense, sparse = self._keys(entry)
+            for key in dense:
+                dense_indices.setdefault(key, []).append(index)
+            for key in sparse:
+                sparse_indices.setdefault(key, []).append(index)
+        self._size = len(self._entries)
+        for key, indices in dense_indices.items():
+            bits = bytearray((self._size + 7) // 8)
+            for index in indices:
+                bits[index >> 3] |= 1 << (index & 7)
+            self._dense[key] = bits
+        for key, indices in sparse_indices.items():
+            self._postings[key] = array("I", indices)
+
+    def add(self, pokemon):
+        """Index a Pokemon appended to the roster.
+
+        Args:
+            pokemon: The Pokemon at roster index len(index).
+        """
+        self._size += 1
+        self._entries.append(None)
+        self.update(self._size - 1, pokemon)
+
+    def update(self, index, pokemon):
+        """Re-index a roster entry after it changed.
+
+        Args:
+            index: Roster index.
+            pokemon: The Pokemon now at that index.
+        """
+        if not 0 <= index < self._size:
+            raise ValueError(f"Roster index {index} out of range")
+        entry = self._entry(pokemon)
+        old = self._entries[index]
+        if old == entry:
+            return
+        old_dense, old_sparse = self._keys(old) if old is not None else ((), set())
+        dense, sparse = self._keys(entry)
+        self._entries[index] = entry
+        self._unlink(index, set(old_dense) - set(dense), old_sparse - sparse)
+        self._link(index, set(dense) - set(old_dense), sparse - old_sparse)
+
+    def _entry(self, pokemon):
+        """Return the indexed fields of a Pokemon as a tuple."""
+        return (pokemon.name.lower(), pokemon.level,
+                tuple(t.lower() for t in pokemon.types), bool(pokemon.locked)) + tuple(
+                    getattr(pokemon, stat) for stat in self.STATS)
+
+    def _keys(self, entry):
+        """Return the (dense keys, sparse keys) of an entry tuple."""
+        name, level, types, locked = entry[:4]
+        self._max_level = max(self._max_level, level)
+        dense = [("type", t) for t in types]
+        if locked:
+            dense.append(("locked",))
+        dense.append(("level", level))
+        dense.append(("level_block", level // self.LEVEL_BLOCK))
+        for stat, value in zip(self.STATS, entry[4:]):
+            bucket = value // self.STAT_BUCKET
+            dense.append((stat, bucket))
+            dense.append((stat, "value", value))
+            self._max_bucket[stat] = max(self._max_bucket[stat], bucket)
+        if name:
+            dense.append(("prefix", name[0]))
+        sparse = set()
+        if len(name) >= 2:
+            sparse.add(("prefix", name[:2]))
+        for size in (3, 4):
+            for k in range(len(name) - size + 1):
+                sparse.add(("gram", name[k:k + size]))
+        return dense, sparse
+
+    def _link(self, index, dense, sparse):
+        """Add a roster index to bitsets and posting lists."""
+        byte = index >> 3
+        bit = 1 << (index & 7)
+        for key in dense:
+            bits = self._dense.get(key)
+            if bits is None:
+                bits = self._dense[key] = bytearray()
+            if len(bits) <= byte:
+                # Grow geometrically: bulk imports append one bit at a time
+                bits.extend(bytes(max(byte + 1 - len(bits), len(bits))))
+            bits[byte] |= bit
+            self._ints.pop(key, None)
+        for key in sparse:
+            postings = self._postings.get(key)
+            if postings is None:
+                postings = self._postings[key] = array("I")
+            postings.append(index)
+            self._sparse_ints.pop(key, None)
+
+    def _unlink(self, index, dense, sparse):
+        """Remove a roster index from bitsets and posting lists."""
+        byte = index >> 3
+        mask = 0xFF ^ (1 << (index & 7))
+        for key in dense:
+            self._dense[key][byte] &= mask
+            self._ints.pop(key, None)
+        for key in sparse:
+            postings = self._postings[key]
+            postings.remove(index)
+            if not postings:
+                del self._postings[key]
+            self._sparse_ints.pop(key, None)
+
+    def _bits(self, key):
+        """Return a bitset as an int (0 for an unknown key)."""
+        bits = self._ints.get(key)
+        if bits is not None:
+            return bits
+        bits = self._sparse_ints.get(key)
+        if bits is not None:
+            return bits
+        if key in self._dense:
+            bits = int.from_bytes(self._dense[key], "little")
+            self._ints[key] = bits
+            return bits
+        postings = self._postings.get(key)
+        if postings is None:
+            return 0
+        data = bytearray((self._size + 7) // 8)
+        for index in postings:
+            data[index >> 3] |= 1 << (index & 7)
+        bits = int.from_bytes(data, "little")
+        if len(self._sparse_ints) >= self.SPARSE_CACHE_SIZE:
+            self._sparse_ints = {}
+        self._sparse_ints[key] = bits
+        return bits
+
+    def query(self, text="", types=(), level_range=None, locked=None, min_stats=None):
+        """Return the roster entries matching every given criterion.
+
+        Args:
+            text: Name search: prefix for 1-2 letters, substring from 3
+                letters on (case-insensitive). Empty matches everything.
+            types: Types the Pokemon must all have.
+            level_range: Optional inclusive (low, high) levels.
+            locked: True for locked only, False for unlocked only, None
+                for both.
+            min_stats: Optional {stat: minimum} with stats in STATS.
+
+        Returns:
+            int: Bitset of matching roster indices (bit i = index i); use
+                bit_count() for the count and page() for the indices.
+
+        Raises:
+            ValueError: If a stat is not in STATS.
+        """
+        matches = (1 << self._size) - 1
+        text = text.strip().lower()
+        if text:
+            matches &= self._name_bits(text, matches)
+        for pokemon_type in types:
+            matches &= self._bits(("type", pokemon_type.lower()))
+        if locked is not None:
+            locked_bits = self._bits(("locked",))
+            matches &= locked_bits if locked else ~locked_bits
+        if level_range is not None and matches:
+            matches &= self._level_bits(*level_range)
+        for stat, minimum in (min_stats or {}).items():
+            if not matches:
+                break
+            matches &= self._stat_bits(stat, minimum)
+        return matches
+
+    def find(self, name):
+        """Return the lowest roster index with exactly this name.
+
+        Args:
+            name: Name (case-insensitive).
+
+        Returns:
+            int or None: The roster index, None if no entry has that name.
+        """
+        name = name.lower()
+        matches = self.query(name)
+        for index in self._iter_indices(matches):
+            if self._entries[index][0] == name:
+                return index
+        return None
+
+    def _name_bits(self, text, candidates):
+        """Return the bitset of names matching a search text."""
+        if len(text) <= 2:
+            return self._bits(("prefix", text))
+        if len(text) <= 4:
+            return self._bits(("gram", text))
+        matches = candidates
+        for k in range(len(text) - 3):
+            matches &= self._bits(("gram", text[k:k + 4]))
+            if not matches:
+                return 0
+        # The 4-grams may appear apart: check the candidates
+        checked = bytearray((self._size + 7) // 8)
+        for index in self._iter_indices(matches):
+            if text in self._entries[index][0]:
+                checked[index >> 3] |= 1 << (index & 7)
+        return int.from_bytes(checked, "little")
+
+    def _level_bits(self, low, high):
+        """Return the bitset of levels low..high (whole blocks at once)."""
+        block = self.LEVEL_BLOCK
+        level = max(low, 0)
+        high = min(high, self._max_level)
+        bits = 0
+        while level <= high:
+            if level % block == 0 and level + block - 1 <= high:
+                bits |= self._bits(("level_block", level // block))
+                level += block
+            else:
+                bits |= self._bits(("level", level))
+                level += 1
+        return bits
+
+    def _stat_bits(self, stat, minimum):
+        """Return the bitset of entries with `stat` >= minimum.
+
+        Buckets above the threshold are taken whole; the rest of the
+        bucket holding the threshold is taken value by value.
+        """
+        if stat not in self.STATS:
+            raise ValueError(f"Unknown stat '{stat}' (expected one of {self.STATS})")
+        minimum = max(minimum, 0)
+        first = minimum // self.STAT_BUCKET
+        bits = 0
+        for bucket in range(first + 1, self._max_bucket[stat] + 1):
+            bits |= self._bits((stat, bucket))
+        if minimum % self.STAT_BUCKET == 0:
+            return bits | self._bits((stat, first))
+        for value in range(minimum, (first + 1) * self.STAT_BUCKET):
+            bits |= self._bits((stat, "value", value))
+        return bits
+
+    def _iter_indices(self, bits, skip=0):
+        """Yield the set bit positions of a bitset, in increasing order.
+
+        Args:
+            bits: Bitset int.
+            skip: Number of set bits to skip first (whole chunks are
+                skipped by their bit count).
+        """
+        data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+        chunk = self.CHUNK_BYTES
+        for offset in range(0, len(data), chunk):
+            word = int.from_bytes(data[offset:offset + chunk], "little")
+            if not word:
+                continue
+            if skip:
+                count = word.bit_count()
+                if skip >= count:
+                    skip -= count
+                    continue
+            base = offset * 8
+            while word:
+                low = word & -word
+                if skip:
+                    skip -= 1
+                else:
+                    yield base + low.bit_length() - 1
+                word ^= low
+
+    def page(self, matches, start, count):
+        """Return a slice of the matching roster indices.
+
+        Args:
+            matches: Bitset returned by query().
+            start: Position of the first match wanted.
+            count: Number of matches wanted.
+
+        Returns:
+            list[int]: Roster indices, in roster order.
+        """
+        return list(itertools.islice(self._iter_indices(matches, start), count))
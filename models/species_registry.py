@@ -0,0 +1,217 @@
+"""Species registry module -- species data and the evolution graph."""
+
+import os
+
+from utils.file_handler import FileHandler
+from utils.species_database import SpeciesDatabase
+
+
+class SpeciesRegistry:
+    """Species data from data/pokemon.json, indexed by name.
+
+    Built once per game. Besides a name -> species map, it precomputes the
+    evolution graph from each species' evolution_level/evolution_target:
+    the next stage, the previous stage and the full chain of every species,
+    so evolution and unlock lookups are dictionary reads.
+
+    For very large species lists, the data can come from a memory-mapped
+    SpeciesDatabase instead (see load_from_file): species are then decoded
+    on demand and only the evolution graph is kept in memory.
+
+    Example:
+        registry = SpeciesRegistry()
+        registry.load_from_file("data/pokemon.json")
+        registry.next_stage("Bulbasaur")    # (16, "Ivysaur")
+        registry.chain("Ivysaur")           # ["Bulbasaur", "Ivysaur", "Venusaur"]
+        registry.stages_between("Bulbasaur", "Venusaur")   # ["Ivysaur", "Venusaur"]
+    """
+
+    def __init__(self):
+        """Initialize an empty registry. Call load_from_file() to populate."""
+        self.file_handler = FileHandler()
+        self._species = []
+        self._by_name = {}
+        # SpeciesDatabase the species are read from, if any
+        self.database = None
+        self._next = {}
+        self._previous = {}
+        self._chains = {}
+
+    def load_from_file(self, path="data/pokemon.json", database_path=None):
+        """Load the species list from a local JSON file.
+
+        Args:
+            path: Path to the JSON file.
+            database_path: Optional species database (SpeciesDatabase file).
+                Used instead of the JSON file if it is at least as recent.
+        """
+        if database_path is not None and os.path.isfile(database_path):
+            if not os.path.isfile(path) or os.path.getmtime(database_path) >= os.path.getmtime(path):
+                try:
+                    self.load_database(SpeciesDatabase.open(database_path))
+                    return
+                except (OSError, ValueError) as e:
+                    print(f"[WARN] Could not open species database: {e}")
+        if os.path.isfile(path):
+            self.load(self.file_handler.load_json(path))
+        else:
+            print(f"[WARN] Species file not found: {path}")
+
+    def load_database(self, database):
+        """Read species from a SpeciesDatabase and build the evolution graph.
+
+        Only the evolving species are decoded up front; get() looks names
+        up in the database.
+
+        Args:
+            database: An open SpeciesDatabase (the registry keeps it).
+        """
+        self.close()
+        self._species = []
+        self._by_name = {}
+        self.database = database
+        self._build_graph(database.evolutions(), database.get)
+
+    def close(self):
+        """Close the species database, if any."""
+        if self.database is not None:
+            self.database.close()
+            self.database = None
+
+    def load(self, species):
+        """Index a species list and build the evolution graph.
+
+        Args:
+            species: List of species dicts (data/pokemon.json format).
+        """
+        self.close()
+        self._species = species
+        self._by_name = {}
+        for s in species:
+            self._by_name.setdefault(s["name"].lower(), s)
+        evolutions = []
+        for s in species:
+            evolutions.append(
+                (s["name"], s.get("evolution_level"), s.get("evolution_target"))
+            )
+        self._build_graph(evolutions, self.get)
+
+    def _build_graph(self, evolutions, get):
+        """Build the next/previous stage maps, then the chains.
+
+        Args:
+            evolutions: Iterable of (name, evolution level, target name).
+            get: Callable(name) returning a species dict or None.
+        """
+        self._next = {}
+        self._previous = {}
+        for name, level, target in evolutions:
+            if not target or level is None:
+                continue
+            target_species = get(target)
+            if target_species is None:
+                continue
+            self._next[name.lower()] = (level, target_species["name"])
+            self._previous.setdefault(target.lower(), name)
+        self._build_chains()
+
+    def _build_chains(self):
+        """Precompute the full evolution chain of every evolving species.
+
+        Species outside any evolution get their one-stage chain from
+        chain() on demand.
+        """
+        self._chains = {}
+        for key in self._next:
+            if key in self._previous:
+                continue
+            # key is a base stage: walk forward (guarding against cycles)
+            chain = [self.get(key)["name"]]
+            seen = {key}
+            current = key
+            while current in self._next:
+                name = self._next[current][1]
+                current = name.lower()
+                if current in seen:
+                    break
+                seen.add(current)
+                chain.append(name)
+            for name in chain:
+                self._chains[name.lower()] = chain
+
+    def get(self, name):
+        """Return a species by name (case-insensitive).
+
+        Args:
+            name: Species name.
+
+        Returns:
+            dict or None: The species data (do not modify), None if unknown.
+        """
+        if self.database is not None:
+            return self.database.get(name)
+        return self._by_name.get(name.lower())
+
+    def get_all(self):
+        """Return every species, in file order.
+
+        With a species database, every record is decoded: avoid on large
+        databases (the Game reads them through a LazyRoster instead).
+
+        Returns:
+            list[dict]: Species data (do not modify).
+        """
+        if self.database is not None:
+            return [self.database.record(i) for i in range(len(self.database))]
+        return self._species
+
+    def next_stage(self, name):
+        """Return the next evolution of a species.
+
+        Args:
+            name: Species name.
+
+        Returns:
+            tuple or None: (evolution_level, target name), None if the
+                species does not evolve.
+        """
+        return self._next.get(name.lower())
+
+    def chain(self, name):
+        """Return the full evolution chain a species belongs to.
+
+        Args:
+            name: Species name.
+
+        Returns:
+            list[str]: Species names from base to final stage ([] if
+                unknown).
+        """
+        chain = self._chains.get(name.lower())
+        if chain is not None:
+            return list(chain)
+        species = self.get(name)
+        return [species["name"]] if species is not None else []
+
+    def stages_between(self, old_name, new_name):
+        """Return the stages reached when evolving from one species to another.
+
+        Used to unlock every form a Pokemon went through, including
+        intermediate stages skipped by a single large XP award.
+
+        Args:
+            old_name: Species before evolving.
+            new_name: Species after evolving.
+
+        Returns:
+            list[str]: Stages after old_name, up to and including new_name
+                ([new_name] if they are not in the same chain).
+        """
+        chain = self._chains.get(old_name.lower(), [])
+        lowered = [name.lower() for name in chain]
+        if old_name.lower() in lowered and new_name.lower() in lowered:
+            start = lowered.index(old_name.lower()) + 1
+            end = lowered.index(new_name.lower()) + 1
+            if start < end:
+                return chain[start:end]
+        return [new_name]
@@ -0,0 +1,282 @@
+"""Team battle module -- headless team battle rules (no pygame)."""
+
+import random
+
+from models.battle_event_bus import BattleEventBus
+from models.combat import Combat
+
+
+class TeamBattle:
+    """A team battle driven by actions, following the CombatScreen rules.
+
+    The player acts, then the opponent answers with a random move:
+
+    - attack: the opponent answers unless its Pokemon fainted, in which
+      case its next Pokemon comes in and the player acts again;
+    - switch: the opponent answers the new Pokemon. After a faint the
+      player must switch (phase FORCED_SWITCH) and there is no answer;
+    - forfeit: the battle ends without XP.
+
+    When the opponent team is defeated, the active player Pokemon gains
+    XP for every KO (Combat.award_xp). Each battle owns its Pokemon, its
+    random generator and its event bus, so many battles can run side by
+    side without sharing state. A battle can also pick up one already in
+    progress (active indices, fainted Pokemon) and resolve() it to the end.
+
+    Example:
+        battle = TeamBattle(player_team, opponent_team, game.type_chart)
+        while battle.phase != TeamBattle.FINISHED:
+            if battle.phase == TeamBattle.FORCED_SWITCH:
+                battle.switch(battle.available_switches()[0])
+            else:
+                battle.attack(0)
+        battle.winner      # "player", "opponent" or None (forfeit)
+    """
+
+    PLAYER_TURN = "player_turn"
+    FORCED_SWITCH = "forced_switch"
+    FINISHED = "finished"
+
+    # resolve() gives up after this many turns (teams that cannot hurt
+    # each other would otherwise never finish)
+    MAX_TURNS = 1000
+
+    def __init__(self, player_team, opponent_team, type_chart, event_bus=None,
+                 rng=None, player_index=0, opponent_index=0):
+        """Start a battle between two non-empty teams.
+
+        If the player's active Pokemon has already fainted, the battle
+        starts in FORCED_SWITCH.
+
+        Args:
+            player_team: List of the player's Pokemon (modified in place).
+            opponent_team: List of the opponent's Pokemon (modified in place).
+            type_chart: A TypeChart instance.
+            event_bus: Optional BattleEventBus for this battle's events.
+            rng: Optional random.Random (accuracy rolls, opponent moves).
+            player_index: Team index of the player's active Pokemon.
+            opponent_index: Team index of the opponent's active Pokemon.
+        """
+        if not player_team or not opponent_team:
+            raise ValueError("Both teams need at least one Pokemon")
+        self.player_team = player_team
+        self.opponent_team = opponent_team
+        self.type_chart = type_chart
+        self.event_bus = event_bus
+        self.rng = rng if rng is not None else random.Random()
+        self.player_index = player_index
+        self.opponent_index = opponent_index
+        self.phase = self.PLAYER_TURN
+        self.winner = None
+        self.xp_gained = 0
+        self.turns = 0
+        self.combat = self._new_combat()
+        if not self.player.is_alive() and self.available_switches():
+            self.phase = self.FORCED_SWITCH
+
+    @property
+    def player(self):
+        """The player's active Pokemon."""
+        return self.player_team[self.player_index]
+
+    @property
+    def opponent(self):
+        """The opponent's active Pokemon."""
+        return self.opponent_team[self.opponent_index]
+
+    def _new_combat(self):
+        """Return a Combat for the current pair of active Pokemon."""
+        return Combat(
+            self.player, self.opponent, self.type_chart, self.event_bus, self.rng
+        )
+
+    def available_switches(self):
+        """Return the indices of the player's Pokemon that can come in.
+
+        Returns:
+            list[int]: Alive, non-active team indices.
+        """
+        switches = []
+        for i, p in enumerate(self.player_team):
+            if p.is_alive() and i != self.player_index:
+                switches.append(i)
+        return switches
+
+    def best_move(self):
+        """Return the move with the highest expected damage on the opponent.
+
+        Expected damage is the damage (capped at the opponent's HP, so a
+        sure KO beats an overkill that may miss) times the hit chance.
+
+        Returns:
+            int: Index in the active Pokemon's moves.
+        """
+        best_index = 0
+        best_expected = -1.0
+        for i, move in enumerate(self.player.moves):
+            multiplier = self.combat.get_type_multiplier(self.opponent, move)
+            damage = self.combat.calculate_damage(
+                self.player, self.opponent, move, multiplier
+            )
+            expected = min(damage, self.opponent.hp) * move.accuracy / 100
+            if expected > best_expected:
+                best_index = i
+                best_expected = expected
+        return best_index
+
+    def resolve(self, max_turns=MAX_TURNS):
+        """Play the battle to the end without input.
+
+        The player uses best_move() and sends in its first available
+        Pokemon after a faint; the opponent plays as usual. After
+        `max_turns` turns the player forfeits.
+
+        Args:
+            max_turns: Turn limit (counted from the start of the battle).
+
+        Returns:
+            list[str]: Log messages of every turn.
+        """
+        messages = []
+        while self.phase != self.FINISHED:
+            if self.phase == self.FORCED_SWITCH:
+                messages += self.switch(self.available_switches()[0])
+            elif self.turns >= max_turns:
+                messages += self.forfeit()
+            else:
+                messages += self.attack(self.best_move())
+        return messages
+
+    def attack(self, move_index):
+        """Attack with one of the active Pokemon's moves.
+
+        Args:
+            move_index: Index in the active Pokemon's moves.
+
+        Returns:
+            list[str]: Log messages of the turn.
+
+        Raises:
+            ValueError: If it is not the player's turn or the move is invalid.
+        """
+        if self.phase != self.PLAYER_TURN:
+            raise ValueError(f"Cannot attack during {self.phase}")
+        if not 0 <= move_index < len(self.player.moves):
+            raise ValueError(f"Invalid move index {move_index}")
+        self.turns += 1
+        result = self.combat.attack(
+            self.player, self.opponent, self.player.moves[move_index]
+        )
+        messages = [result["message"]]
+        if result["ko"]:
+            if self._next_alive_opponent(messages):
+                return messages
+            self._finish("player", messages)
+            return messages
+        self._opponent_turn(messages)
+        return messages
+
+    def switch(self, index):
+        """Bring in another Pokemon of the player's team.
+
+        Args:
+            index: Team index of an alive, non-active Pokemon.
+
+        Returns:
+            list[str]: Log messages of the turn.
+
+        Raises:
+            ValueError: If the battle is over or the Pokemon cannot come in.
+        """
+        if self.phase == self.FINISHED:
+            raise ValueError("The battle is over")
+        if index not in self.available_switches():
+            raise ValueError(f"Cannot switch to {index}")
+        forced = self.phase == self.FORCED_SWITCH
+        old_name = self.player.name
+        self.player_index = index
+        if self.event_bus:
+            self.event_bus.emit(
+                BattleEventBus.SWITCH, side="player", forced=forced,
+                old=old_name, new=self.player.name,
+            )
+        self.combat = self._new_combat()
+        self.phase = self.PLAYER_TURN
+        if forced:
+            return [f"Go, {self.player.name}!"]
+        messages = [f"You switched {old_name} for {self.player.name}!"]
+        self._opponent_turn(messages)
+        return messages
+
+    def forfeit(self):
+        """Give up the battle (no XP).
+
+        Returns:
+            list[str]: Log messages.
+        """
+        if self.phase != self.FINISHED:
+            self.phase = self.FINISHED
+            self.winner = None
+        return ["You forfeited - no XP gained."]
+
+    def _opponent_turn(self, messages):
+        """Let the opponent attack with a random move."""
+        move = self.rng.choice(self.opponent.moves)
+        result = self.combat.attack(self.opponent, self.player, move)
+        messages.append(result["message"])
+        if result["ko"]:
+            if self.available_switches():
+                self.phase = self.FORCED_SWITCH
+                messages.append("Choose your next Pokemon!")
+            else:
+                self._finish("opponent", messages)
+
+    def _next_alive_opponent(self, messages):
+        """Send in the opponent's next Pokemon. Returns False if none left."""
+        for i, p in enumerate(self.opponent_team):
+            if p.is_alive() and i != self.opponent_index:
+                if self.event_bus:
+                    self.event_bus.emit(
+                        BattleEventBus.SWITCH, side="opponent", forced=True,
+                        old=self.opponent.name, new=p.name,
+                    )
+                self.opponent_index = i
+                self.combat = self._new_combat()
+                messages.append(f"Opponent sends {self.opponent.name}!")
+                return True
+        return False
+
+    def _finish(self, winner, messages):
+        """End the battle; the player's active Pokemon gains XP on a win."""
+        self.phase = self.FINISHED
+        self.winner = winner
+        if winner == "player":
+            self.xp_gained = self.combat.award_xp(self.player, self.opponent_team)
+            messages.append("You win the battle!")
+        else:
+            messages.append("You lost the battle!")
+
+    def state(self):
+        """Return a JSON-serializable snapshot of the battle.
+
+        Returns:
+            dict: phase, winner, turns, xp_gained, active indices and
+                name/level/hp/max_hp of every Pokemon.
+        """
+        def team_state(team):
+            return [
+                {"name": p.name, "level": p.level, "hp": p.hp, "max_hp": p.max_hp}
+                for p in team
+            ]
+
+        return {
+            "phase": self.phase,
+            "winner": self.winner,
+            "turns": self.turns,
+            "xp_gained": self.xp_gained,
+            "player_index": self.player_index,
+            "opponent_index": self.opponent_index,
+            "player_team": team_state(self.player_team),
+            "opponent_team": team_state(self.opponent_team),
+            "moves": [m.name for m in self.player.moves],
+        }
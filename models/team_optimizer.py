@@ -0,0 +1,228 @@
+"""Team optimizer module -- suggests a team against an opponent pool."""
+
+import collections
+import concurrent.futures
+import multiprocessing
+from concurrent.futures.process import BrokenProcessPool
+
+from models.matchup_model import MatchupModel
+
+
+class TeamOptimizer:
+    """Searches team compositions for type coverage and damage margin.
+
+    A team is scored against the opponent pool with a MatchupModel:
+
+        score = COVERAGE_WEIGHT * coverage + mean best margin
+
+    where coverage is the share of opponents at least one member hits
+    super effectively, and the margin of an opponent is that of the team
+    member best suited to face it. The search is a beam search (the
+    BEAM_WIDTH best partial teams are extended one member at a time)
+    followed by a swap pass (local search) on the best team.
+
+    The search runs in a worker process so the UI stays responsive:
+    suggest() returns a concurrent.futures.Future. Results are cached per
+    (roster version, opponent pool, team size), so asking again for an
+    unchanged roster returns the same future at once. Candidates come
+    from Game.roster_descriptions, which only re-reads the entries changed
+    since the last call, so no roster entry is built on the UI thread.
+
+    Example:
+        future = game.team_optimizer.suggest(game, 6)
+        ...
+        if future.done():
+            team = future.result()["team"]   # roster indices
+    """
+
+    BEAM_WIDTH = 8
+    COVERAGE_WEIGHT = 0.5
+    # Larger rosters are pre-filtered / sampled down to these sizes
+    MAX_CANDIDATES = 60
+    MAX_OPPONENTS = 150
+    CACHE_SIZE = 16
+
+    def __init__(self):
+        """Create an optimizer (the worker process starts on first use)."""
+        self._executor = None
+        self._cache = collections.OrderedDict()
+
+    def suggest(self, game, team_size, opponent_pool=None):
+        """Start (or reuse) a search for the best team.
+
+        Args:
+            game: The Game instance (roster_descriptions, type chart,
+                roster_version).
+            team_size: Number of Pokemon in the team.
+            opponent_pool: Pokemon opponents are drawn from (default: the
+                available roster, as in main.py).
+
+        Returns:
+            concurrent.futures.Future: Resolves to a dict with "team"
+                (roster indices), "coverage" and "margin".
+        """
+        if opponent_pool is None:
+            # The available roster, which roster_version already identifies
+            opponents = None
+            pool_key = None
+        else:
+            opponents = [MatchupModel.describe(p) for p in opponent_pool]
+            pool_key = tuple((o[0], o[1]) for o in opponents)
+        key = (game.roster_version, pool_key, team_size)
+        future = self._cache.get(key)
+        if future is not None and not (future.done() and self.collect(future) is None):
+            self._cache.move_to_end(key)
+            return future
+
+        game.roster_descriptions.refresh()
+        candidates = game.roster_descriptions.available()
+        if opponents is None:
+            opponents = [description for _, description in candidates]
+        future = self._submit(
+            game.type_chart.chart, candidates, opponents, team_size
+        )
+        self._cache[key] = future
+        while len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return future
+
+    def _submit(self, chart, candidates, opponents, team_size):
+        """Run search() in the worker process (in-line if unavailable)."""
+        args = (chart, candidates, opponents, team_size,
+                self.BEAM_WIDTH, self.COVERAGE_WEIGHT,
+                self.MAX_CANDIDATES, self.MAX_OPPONENTS)
+        if self._executor is None:
+            try:
+                # spawn: never fork a process that holds the SDL display
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=1, mp_context=multiprocessing.get_context("spawn")
+                )
+            except (OSError, NotImplementedError, ValueError) as e:
+                print(f"[WARN] Team optimizer running in-process: {e}")
+                self._executor = False
+        if self._executor:
+            try:
+                return self._executor.submit(TeamOptimizer.search, *args)
+            except RuntimeError as e:
+                print(f"[WARN] Team optimizer running in-process: {e}")
+                self._executor = False
+        future = concurrent.futures.Future()
+        try:
+            future.set_result(TeamOptimizer.search(*args))
+        except (ValueError, IndexError) as e:
+            future.set_exception(e)
+        return future
+
+    def collect(self, future):
+        """Return the result of a finished suggest() future.
+
+        Args:
+            future: A done future returned by suggest().
+
+        Returns:
+            dict or None: The search result, None if the search failed.
+        """
+        try:
+            return future.result()
+        except (concurrent.futures.CancelledError, BrokenProcessPool,
+                OSError, ValueError, IndexError) as e:
+            print(f"[WARN] Team suggestion failed: {e}")
+            return None
+
+    def close(self):
+        """Stop the worker process, cancelling pending searches."""
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+    @staticmethod
+    def search(chart, candidates, opponents, team_size, beam_width=BEAM_WIDTH,
+               coverage_weight=COVERAGE_WEIGHT, max_candidates=MAX_CANDIDATES,
+               max_opponents=MAX_OPPONENTS):
+        """Find a high-scoring team (runs in the worker process).
+
+        Args:
+            chart: Type chart dict (TypeChart.chart).
+            candidates: List of (roster index, MatchupModel.describe()).
+            opponents: List of MatchupModel.describe() tuples.
+            team_size: Number of Pokemon in the team.
+            beam_width: Partial teams kept at each step.
+            coverage_weight: Weight of coverage against margin.
+            max_candidates: Candidates kept after pre-filtering.
+            max_opponents: Opponents kept (evenly spaced sample).
+
+        Returns:
+            dict: "team" (roster indices), "coverage" (0-1), "margin".
+        """
+        if len(opponents) > max_opponents:
+            step = len(opponents) / max_opponents
+            opponents = [opponents[int(k * step)] for k in range(max_opponents)]
+        model = MatchupModel(chart)
+        model.build([description for _, description in candidates], opponents)
+        count = model.opponent_count
+        if not candidates or not count:
+            return {"team": [], "coverage": 0.0, "margin": 0.0}
+
+        # Pre-filter: best average margins plus widest individual coverage
+        pool = list(range(len(candidates)))
+        if len(pool) > max_candidates:
+            by_margin = sorted(pool, key=lambda i: -sum(model.margins[i]))
+            by_coverage = sorted(pool, key=lambda i: -bin(model.coverage[i]).count("1"))
+            keep = set(by_margin[:max_candidates * 2 // 3])
+            for i in by_coverage:
+                if len(keep) >= max_candidates:
+                    break
+                keep.add(i)
+            pool = sorted(keep)
+
+        def score(best, mask):
+            return coverage_weight * bin(mask).count("1") / count + sum(best) / count
+
+        team_size = min(team_size, len(pool))
+        beams = [((), None, 0)]
+        for _ in range(team_size):
+            expanded = {}
+            for members, best, mask in beams:
+                for i in pool:
+                    if i in members:
+                        continue
+                    key = frozenset(members + (i,))
+                    if key in expanded:
+                        continue
+                    row = model.margins[i]
+                    if best is None:
+                        new_best = list(row)
+                    else:
+                        new_best = [b if b > r else r for b, r in zip(best, row)]
+                    new_mask = mask | model.coverage[i]
+                    expanded[key] = (score(new_best, new_mask), members + (i,), new_best, new_mask)
+            ranked = sorted(expanded.values(), key=lambda entry: -entry[0])
+            beams = [(m, b, k) for _, m, b, k in ranked[:beam_width]]
+
+        # Local search: swap members for outsiders while the score improves
+        team = list(beams[0][0])
+        current = TeamOptimizer._team_value(model, team, coverage_weight)
+        improved = True
+        while improved:
+            improved = False
+            for slot in range(len(team)):
+                for i in pool:
+                    if i in team:
+                        continue
+                    trial = team[:slot] + [i] + team[slot + 1:]
+                    value = TeamOptimizer._team_value(model, trial, coverage_weight)
+                    if value > current + 1e-9:
+                        team, current, improved = trial, value, True
+
+        coverage, margin = model.team_score(team)
+        return {
+            "team": [candidates[i][0] for i in team],
+            "coverage": coverage,
+            "margin": margin,
+        }
+
+    @staticmethod
+    def _team_value(model, team, coverage_weight):
+        """Return the weighted score of a complete team."""
+        coverage, margin = model.team_score(team)
+        return coverage_weight * coverage + margin
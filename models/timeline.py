@@ -0,0 +1,98 @@
+"""Timeline module -- runs tweens in parallel and in sequence."""
+
+import collections
+
+from models.tween import Tween
+
+
+class Timeline:
+    """Advances every active tween in one update pass.
+
+    Tweens run on tracks: add() starts a new track (parallel to the
+    others), sequence() a track whose tweens run one after the other.
+    Time left over when a tween ends in the middle of a frame carries into
+    the next tween of its track, so sequences keep exact timing whatever
+    the frame rate. A screen owns one Timeline and calls update(dt) once
+    per frame with the real elapsed time from clock.tick().
+
+    Example:
+        timeline = Timeline()
+        timeline.add(Tween(0.2, on_update=set_alpha))            # parallel
+        timeline.sequence([Tween(0.3, on_update=move),
+                           Tween(0.3, on_update=fade)], on_complete=done)
+        timeline.wait(1.5, attack)                                # delayed call
+        ...
+        timeline.update(dt)   # every frame
+    """
+
+    def __init__(self):
+        """Create an empty timeline."""
+        self._tracks = []
+
+    def add(self, tween):
+        """Run a tween on its own track.
+
+        Args:
+            tween: A Tween.
+
+        Returns:
+            Tween: The same tween (to cancel or inspect it later).
+        """
+        self._tracks.append(collections.deque([tween]))
+        return tween
+
+    def sequence(self, tweens, on_complete=None):
+        """Run tweens one after the other.
+
+        Args:
+            tweens: List of Tween.
+            on_complete: Optional callable() once the last one ends.
+
+        Returns:
+            list[Tween]: The tweens of the track.
+        """
+        track = collections.deque(tweens)
+        if on_complete is not None:
+            track.append(Tween(0.0, on_complete=on_complete))
+        if track:
+            self._tracks.append(track)
+        return list(track)
+
+    def wait(self, seconds, on_complete):
+        """Call a function after a delay.
+
+        Args:
+            seconds: Delay in seconds.
+            on_complete: Callable() to run.
+
+        Returns:
+            Tween: The delay (cancel() it to drop the call).
+        """
+        return self.add(Tween(seconds, on_complete=on_complete))
+
+    def update(self, dt):
+        """Advance every track by `dt` seconds.
+
+        Tracks added by completion callbacks start on the next update.
+
+        Args:
+            dt: Elapsed seconds since the previous update.
+        """
+        for track in list(self._tracks):
+            remaining = dt
+            while track:
+                tween = track[0]
+                if not tween.finished:
+                    remaining = tween.advance(remaining)
+                    if not tween.finished:
+                        break
+                track.popleft()
+        self._tracks = [track for track in self._tracks if track]
+
+    def is_active(self):
+        """Return True while any tween is pending or running."""
+        return bool(self._tracks)
+
+    def clear(self):
+        """Drop every track without calling completion callbacks."""
+        self._tracks = []
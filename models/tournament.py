@@ -0,0 +1,385 @@
+"""Tournament module -- round-robin headless battles and an Elo ladder."""
+
+import concurrent.futures
+import math
+import multiprocessing
+import os
+import random
+from array import array
+
+from models.pokemon import Pokemon
+from models.team_battle import TeamBattle
+from models.type_chart import TypeChart
+from utils.file_handler import FileHandler
+from utils.shared_roster import SharedRoster
+
+
+class Tournament:
+    """Round robin between entries (species or teams), played headless.
+
+    Every entry meets every other one `games` times with TeamBattle rules,
+    all Pokemon scaled to the same level (scale_to_level), sides swapped
+    every game. Both sides pick random moves and send in their next
+    Pokemon after a faint; a battle still running after MAX_TURNS turns
+    is a draw (e.g. two teams that cannot hurt each other).
+
+    The pairings are split into chunks of CHUNK_SIZE, played in a process
+    pool with at most 2 chunks per worker in flight. The scaled Pokemon are
+    exported once to a SharedRoster that workers attach to, instead of
+    being pickled into each of them. Each finished chunk is
+    appended to a JSON-lines results file (the checkpoint):
+
+        {"config": {...}}                         first line
+        {"chunk": 12, "r": [[i, j, half_points_i], ...]}
+
+    so an interrupted run resumes where it stopped when run() is called
+    again with the same file and settings. Memory stays flat as the roster
+    grows: results live in the file, and the ladder loads them once as
+    three integer columns (12 bytes per pairing).
+
+    Ratings are on the Elo scale (1500 +- 400 log10 odds), fitted to all
+    results at once with a Bradley-Terry model rather than updated game by
+    game, so they do not depend on the order chunks finish in.
+
+    Example:
+        entries = [(p.name, [p.to_dict()]) for p in game.get_available_pokemon()]
+        tournament = Tournament(entries, game.type_chart.chart, level=50)
+        tournament.run("tournament.jsonl")
+        for name, rating, score, played in tournament.ladder("tournament.jsonl"):
+            ...
+    """
+
+    CHUNK_SIZE = 64
+    MAX_TURNS = 300
+    # Bradley-Terry fit: iterations, convergence tolerance, and one virtual
+    # draw against a 1500-rated entry (keeps unbeaten entries finite)
+    FIT_ITERATIONS = 500
+    FIT_TOLERANCE = 1e-7
+    PRIOR_GAMES = 1
+
+    # Set in each worker process by _init_worker()
+    _worker = None
+
+    def __init__(self, entries, chart, level=50, games=10, seed=0,
+                 chunk_size=CHUNK_SIZE):
+        """Create a tournament.
+
+        Args:
+            entries: List of (name, team) with team a list of Pokemon data
+                dicts (Pokemon.to_dict() or species format).
+            chart: Type chart dict (TypeChart.chart).
+            level: Level every Pokemon is scaled to.
+            games: Games per pairing.
+            seed: Seed of the per-chunk random generators.
+            chunk_size: Pairings per chunk of work.
+        """
+        if len(entries) < 2:
+            raise ValueError("A tournament needs at least two entries")
+        self.entries = entries
+        self.chart = chart
+        self.level = level
+        self.games = games
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.file_handler = FileHandler()
+
+    def config(self):
+        """Return the settings recorded in (and checked against) the results file."""
+        return {
+            "names": [name for name, _ in self.entries],
+            "level": self.level,
+            "games": self.games,
+            "seed": self.seed,
+            "chunk_size": self.chunk_size,
+        }
+
+    def pair_count(self):
+        """Return the number of pairings."""
+        n = len(self.entries)
+        return n * (n - 1) // 2
+
+    def chunk_count(self):
+        """Return the number of chunks of work."""
+        return -(-self.pair_count() // self.chunk_size)
+
+    def chunk_pairs(self, chunk):
+        """Return the (i, j) pairings of a chunk, i < j.
+
+        Args:
+            chunk: Chunk number.
+
+        Returns:
+            list[tuple]: Entry index pairs.
+        """
+        n = len(self.entries)
+        start = chunk * self.chunk_size
+        i = 0
+        before = 0
+        while i < n - 1 and before + (n - 1 - i) <= start:
+            before += n - 1 - i
+            i += 1
+        j = i + 1 + (start - before)
+        pairs = []
+        while len(pairs) < self.chunk_size and i < n - 1:
+            pairs.append((i, j))
+            j += 1
+            if j == n:
+                i += 1
+                j = i + 1
+        return pairs
+
+    def run(self, results_path, workers=None, progress=None):
+        """Play every chunk not yet in the results file.
+
+        Args:
+            results_path: JSON-lines results file (created, or resumed if
+                it holds results for the same config).
+            workers: Worker processes (default: CPU count, 0 = in-process).
+            progress: Optional callable(done_chunks, total_chunks).
+
+        Raises:
+            ValueError: If the file holds results for other settings.
+        """
+        done = self._load_done(results_path)
+        total = self.chunk_count()
+        todo = (k for k in range(total) if k not in done)
+        shared, teams = self._share_roster()
+        try:
+            self._run_chunks(results_path, done, total, todo,
+                             (shared.name, teams), workers, progress)
+        finally:
+            shared.close()
+            shared.unlink()
+
+    def _share_roster(self):
+        """Export the scaled Pokemon of every entry to shared memory.
+
+        Returns:
+            tuple: (SharedRoster, teams) where teams lists each entry's
+                roster indices, or is None when every entry is the single
+                Pokemon at its own index (so the worker arguments do not
+                grow with the roster).
+        """
+        pokemon_list = []
+        teams = []
+        for _, team in self.entries:
+            indices = []
+            for data in team:
+                pokemon = Pokemon(data=data)
+                pokemon.scale_to_level(self.level)
+                indices.append(len(pokemon_list))
+                pokemon_list.append(pokemon)
+            teams.append(indices)
+        type_chart = TypeChart()
+        type_chart.chart = self.chart
+        shared = SharedRoster.create(pokemon_list, type_chart)
+        if all(indices == [k] for k, indices in enumerate(teams)):
+            teams = None
+        return shared, teams
+
+    def _run_chunks(self, results_path, done, total, todo, init_args, workers,
+                    progress):
+        """Play the chunks in `todo` on a process pool (in-process if unavailable)."""
+        if workers is None:
+            workers = os.cpu_count() or 1
+        executor = None
+        if workers > 0:
+            try:
+                # spawn: never fork a process that may hold the SDL display
+                executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=Tournament._init_worker, initargs=init_args,
+                )
+            except (OSError, NotImplementedError, ValueError) as e:
+                print(f"[WARN] Tournament running in-process: {e}")
+        if executor is None:
+            Tournament._init_worker(*init_args)
+            try:
+                for k in todo:
+                    self._record(results_path, k, Tournament._play_chunk(
+                        k, self.chunk_pairs(k), self.games, self.seed))
+                    done.add(k)
+                    if progress is not None:
+                        progress(len(done), total)
+            finally:
+                Tournament._worker[0].close()
+                Tournament._worker = None
+            return
+
+        in_flight = {}
+        limit = 2 * workers
+        try:
+            while True:
+                for k in todo:
+                    future = executor.submit(
+                        Tournament._play_chunk, k, self.chunk_pairs(k),
+                        self.games, self.seed,
+                    )
+                    in_flight[future] = k
+                    if len(in_flight) >= limit:
+                        break
+                if not in_flight:
+                    break
+                finished, _ = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in finished:
+                    k = in_flight.pop(future)
+                    self._record(results_path, k, future.result())
+                    done.add(k)
+                    if progress is not None:
+                        progress(len(done), total)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _load_done(self, results_path):
+        """Return the finished chunk numbers, writing the header if new."""
+        done = set()
+        header = None
+        for record in self.file_handler.iter_jsonl(results_path):
+            if header is None:
+                header = record.get("config")
+                if header != self.config():
+                    raise ValueError(
+                        f"{results_path} holds results for other settings"
+                    )
+            elif "chunk" in record:
+                done.add(record["chunk"])
+        if header is None:
+            self.file_handler.append_jsonl(results_path, [{"config": self.config()}])
+        return done
+
+    def _record(self, results_path, chunk, rows):
+        """Append a finished chunk to the results file (fsynced)."""
+        self.file_handler.append_jsonl(results_path, [{"chunk": chunk, "r": rows}])
+
+    @staticmethod
+    def _init_worker(roster_name, teams):
+        """Attach a worker process to the shared roster (no copy)."""
+        roster = SharedRoster.attach(roster_name)
+        if teams is None:
+            teams = [[k] for k in range(roster.count)]
+        Tournament._worker = (roster, roster.type_chart(), teams)
+
+    @staticmethod
+    def _play_chunk(chunk, pairs, games, seed):
+        """Play the games of a chunk (runs in a worker process).
+
+        Returns:
+            list[list]: [i, j, half points of i] per pairing (a win is 2,
+                a draw 1).
+        """
+        roster, type_chart, teams = Tournament._worker
+        rng = random.Random(f"{seed}-{chunk}")
+        rows = []
+        for i, j in pairs:
+            half_points = 0
+            for game in range(games):
+                team_i = [roster.make_pokemon(k) for k in teams[i]]
+                team_j = [roster.make_pokemon(k) for k in teams[j]]
+                if game % 2 == 0:
+                    half_points += Tournament._play(team_i, team_j, type_chart, rng)
+                else:
+                    half_points += 2 - Tournament._play(team_j, team_i, type_chart, rng)
+            rows.append([i, j, half_points])
+        return rows
+
+    @staticmethod
+    def _play(team_a, team_b, type_chart, rng):
+        """Play one battle; return 2 if team_a wins, 1 for a draw, else 0."""
+        battle = TeamBattle(team_a, team_b, type_chart, rng=rng)
+        while battle.phase != TeamBattle.FINISHED:
+            if battle.turns >= Tournament.MAX_TURNS:
+                return 1
+            if battle.phase == TeamBattle.FORCED_SWITCH:
+                battle.switch(battle.available_switches()[0])
+            else:
+                battle.attack(rng.randrange(len(battle.player.moves)))
+        return 2 if battle.winner == "player" else 0
+
+    def _rows(self, results_path):
+        """Yield every [i, j, half_points] row of the results file."""
+        for record in self.file_handler.iter_jsonl(results_path):
+            for row in record.get("r", ()):
+                yield row
+
+    def _columns(self, results_path):
+        """Load the results file as (i, j, half_points) array("I") columns."""
+        first, second, half_points = array("I"), array("I"), array("I")
+        for i, j, h in self._rows(results_path):
+            first.append(i)
+            second.append(j)
+            half_points.append(h)
+        return first, second, half_points
+
+    def ladder(self, results_path):
+        """Compute the ladder from the results file.
+
+        Args:
+            results_path: Results file written by run().
+
+        Returns:
+            list[tuple]: (name, rating, score, games played) sorted by
+                rating, best first; score is the share of points won.
+        """
+        n = len(self.entries)
+        games = self.games
+        half_points = [0] * n
+        played = [0] * n
+        first, second, results = self._columns(results_path)
+        for i, j, h in zip(first, second, results):
+            half_points[i] += h
+            half_points[j] += 2 * games - h
+            played[i] += games
+            played[j] += games
+
+        # Bradley-Terry strengths by minorization-maximization, one pass
+        # over the pairing columns per iteration
+        prior = self.PRIOR_GAMES
+        strength = [1.0] * n
+        for _ in range(self.FIT_ITERATIONS):
+            denominators = [prior / (s + 1.0) for s in strength]
+            for i, j in zip(first, second):
+                d = games / (strength[i] + strength[j])
+                denominators[i] += d
+                denominators[j] += d
+            updated = [
+                (half_points[i] / 2 + prior / 2) / denominators[i] for i in range(n)
+            ]
+            change = max(abs(math.log(u / s)) for u, s in zip(updated, strength))
+            strength = updated
+            if change < self.FIT_TOLERANCE:
+                break
+
+        ladder = []
+        for i, (name, _) in enumerate(self.entries):
+            rating = 1500 + 400 * math.log10(strength[i])
+            score = half_points[i] / (2 * played[i]) if played[i] else 0.0
+            ladder.append((name, rating, score, played[i]))
+        ladder.sort(key=lambda entry: -entry[1])
+        return ladder
+
+    def write_matrix(self, results_path, csv_path):
+        """Write the win matrix as CSV (row entry's score against column's).
+
+        Holds the full matrix in memory (4 bytes per cell).
+
+        Args:
+            results_path: Results file written by run().
+            csv_path: Destination CSV file.
+        """
+        n = len(self.entries)
+        matrix = array("f", [-1.0]) * (n * n)
+        for i, j, h in self._rows(results_path):
+            matrix[i * n + j] = h / (2 * self.games)
+            matrix[j * n + i] = 1 - h / (2 * self.games)
+        names = [name.replace(",", " ") for name, _ in self.entries]
+        lines = ["," + ",".join(names)]
+        for i in range(n):
+            cells = []
+            for j in range(n):
+                value = matrix[i * n + j]
+                cells.append("" if value < 0 else f"{value:.3f}")
+            lines.append(names[i] + "," + ",".join(cells))
+        self.file_handler.write_atomic(csv_path, ("\n".join(lines) + "\n").encode("utf-8"))
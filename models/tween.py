@@ -0,0 +1,79 @@
+"""Tween module -- a value interpolated over time with easing."""
+
+
+class Tween:
+    """Interpolates a value from `start` to `end` over `duration` seconds.
+
+    Time-based, not frame-based: advance(dt) moves the tween by real
+    elapsed seconds, so an animation lasts as long at 30 FPS as at 60 FPS.
+    Tweens are usually run by a Timeline, which also chains them.
+
+    Example:
+        tween = Tween(0.5, start=1.0, end=0.25, easing="ease_out_quad",
+                      on_update=set_ratio, on_complete=done)
+        timeline.add(tween)
+    """
+
+    # Easing curves: progress 0-1 -> eased progress 0-1
+    EASINGS = {
+        "linear": lambda t: t,
+        "ease_in_quad": lambda t: t * t,
+        "ease_out_quad": lambda t: t * (2 - t),
+        "ease_in_out_quad": lambda t: 2 * t * t if t < 0.5 else 1 - (2 - 2 * t) ** 2 / 2,
+        "ease_out_cubic": lambda t: 1 - (1 - t) ** 3,
+    }
+
+    def __init__(self, duration, start=0.0, end=1.0, easing="linear",
+                 on_update=None, on_complete=None):
+        """Create a tween (it starts when first advanced).
+
+        Args:
+            duration: Length in seconds (0 completes on the first advance).
+            start: Value at the beginning.
+            end: Value at the end.
+            easing: Name of a curve in EASINGS.
+            on_update: Optional callable(value), called on every advance.
+            on_complete: Optional callable(), called once at the end.
+        """
+        if easing not in self.EASINGS:
+            raise ValueError(f"Unknown easing '{easing}'")
+        self.duration = max(0.0, float(duration))
+        self.start = start
+        self.end = end
+        self._ease = self.EASINGS[easing]
+        self.on_update = on_update
+        self.on_complete = on_complete
+        self.elapsed = 0.0
+        self.value = start
+        self.finished = False
+
+    def advance(self, dt):
+        """Move the tween forward in time.
+
+        Args:
+            dt: Elapsed seconds.
+
+        Returns:
+            float: Seconds left over after the tween finished (0.0 while
+                it is still running), for the next tween of a sequence.
+        """
+        if self.finished:
+            return dt
+        self.elapsed += dt
+        leftover = 0.0
+        if self.elapsed >= self.duration:
+            leftover = self.elapsed - self.duration
+            progress = 1.0
+            self.finished = True
+        else:
+            progress = self.elapsed / self.duration
+        self.value = self.start + (self.end - self.start) * self._ease(progress)
+        if self.on_update is not None:
+            self.on_update(self.value)
+        if self.finished and self.on_complete is not None:
+            self.on_complete()
+        return leftover
+
+    def cancel(self):
+        """Stop the tween where it is, without calling on_complete."""
+        self.finished = True
@@ -0,0 +1,44 @@
+"""Species database command -- convert a species JSON file to the mmap format.
+
+Usage (from the project root):
+    python3 -m tools.build_species_db
+    python3 -m tools.build_species_db custom_species.json --output data/pokemon.bin
+
+The game reads data/pokemon.bin instead of data/pokemon.json when it is at
+least as recent (rebuild it after editing the JSON file).
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from models.game import Game
+from utils.file_handler import FileHandler
+from utils.species_database import SpeciesDatabase
+
+
+def main():
+    """Write the species database and print its size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", nargs="?", default=Game.POKEMON_SOURCE_PATH,
+                        help=f"species JSON file (default: {Game.POKEMON_SOURCE_PATH})")
+    parser.add_argument("--output", default=Game.SPECIES_DATABASE_PATH,
+                        help=f"database file (default: {Game.SPECIES_DATABASE_PATH})")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        species = FileHandler().load_json(args.source)
+        SpeciesDatabase.write(args.output, species)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Could not build the species database: {e}")
+        return 1
+    print(f"Wrote {len(species)} species to {args.output} "
+          f"({os.path.getsize(args.output) / 1024:.0f} KiB, "
+          f"{time.perf_counter() - start:.2f} s).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""Bulk import command -- stream custom Pokemon from JSONL/CSV into a save slot.
+
+Usage (from the project root):
+    python3 -m tools.import_pokemon custom.csv
+    python3 -m tools.import_pokemon custom.jsonl --slot slot2 --rejects rejects.jsonl
+"""
+
+import argparse
+import os
+import sys
+
+from models.game import Game
+
+
+def main():
+    """Import the file into the chosen slot and save it."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="JSONL or CSV file to import")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default=None,
+                        help="file format (default: from the extension)")
+    parser.add_argument("--slot", default=None,
+                        help="save slot to import into (default: active slot)")
+    parser.add_argument("--rejects", default=None,
+                        help="write every rejected row to this JSONL file")
+    args = parser.parse_args()
+    path = os.path.abspath(args.path)
+    rejects = os.path.abspath(args.rejects) if args.rejects else None
+
+    # Same working directory as the game, so data/ and saves/ resolve
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    game = Game()
+    if args.slot is not None and args.slot != game.slot:
+        if game.slots.has_slot(args.slot):
+            game.load_slot(args.slot)
+        else:
+            game.new_game(slot=args.slot)
+
+    report = game.import_pokemon(path, args.format, rejects)
+    if report["accepted"]:
+        game.save_game(full=True)
+    game.close()
+
+    print(f"Read {report['read']} rows: {report['accepted']} imported, "
+          f"{report['rejected']} rejected (slot '{game.slot}').")
+    for line, reason in report["sample_rejects"]:
+        print(f"  line {line}: {reason}")
+    if report["rejected"] > len(report["sample_rejects"]):
+        print("  ...")
+    return 0 if report["read"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""Tournament command -- round robin of headless battles and an Elo ladder.
+
+Entries are every unlocked species of the active save (one Pokemon per
+entry), or user-defined teams from a JSON file {"Team name": [species...]}.
+Results are checkpointed to --results: run the same command again to
+resume an interrupted tournament.
+
+Usage (from the project root):
+    python3 -m tools.tournament --level 50 --games 10
+    python3 -m tools.tournament --teams teams.json --games 20 --matrix matrix.csv
+    python3 -m tools.tournament --workers 0 --top 10     (single process)
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+from models.game import Game
+from models.tournament import Tournament
+
+
+def load_entries(game, teams_path):
+    """Return the (name, team data) entries of the tournament.
+
+    Args:
+        game: Game instance (roster and species registry).
+        teams_path: Optional JSON file of user-defined teams.
+
+    Returns:
+        list[tuple]: (name, list of Pokemon data dicts).
+    """
+    if teams_path is None:
+        return [(p.name, [p.to_dict()]) for p in game.get_available_pokemon()]
+    entries = []
+    for name, members in game.file_handler.load_json(teams_path).items():
+        team = []
+        for member in members:
+            species = game.species.get(member)
+            if species is None:
+                raise ValueError(f"Team '{name}': unknown species '{member}'")
+            team.append(species)
+        entries.append((name, team))
+    return entries
+
+
+def main():
+    """Run (or resume) the tournament and print the ladder."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--teams", help="JSON file of teams (default: unlocked species)")
+    parser.add_argument("--level", type=int, default=50)
+    parser.add_argument("--games", type=int, default=10, help="games per pairing")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: CPU count, 0 = in-process)")
+    parser.add_argument("--results", default="tournament_results.jsonl",
+                        help="results / checkpoint file")
+    parser.add_argument("--matrix", help="also write the win matrix to this CSV file")
+    parser.add_argument("--top", type=int, default=0, help="ladder lines shown (0 = all)")
+    args = parser.parse_args()
+    paths = {}
+    for key in ("teams", "results", "matrix"):
+        value = getattr(args, key)
+        paths[key] = os.path.abspath(value) if value else None
+
+    # Same working directory as the game, so data/ and saves/ resolve
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    game = Game()
+    try:
+        entries = load_entries(game, paths["teams"])
+        tournament = Tournament(
+            entries, game.type_chart.chart, args.level, args.games, args.seed
+        )
+    except (OSError, ValueError) as e:
+        print(f"[WARN] {e}")
+        return 1
+    finally:
+        game.close()
+
+    total = tournament.chunk_count()
+    print(f"{len(entries)} entries, {tournament.pair_count()} pairings, "
+          f"{args.games} games each, level {args.level} ({total} chunks)")
+    start = time.perf_counter()
+
+    def progress(done, total):
+        print(f"\r  {done}/{total} chunks", end="", flush=True)
+
+    try:
+        tournament.run(paths["results"], args.workers, progress)
+    except ValueError as e:
+        print(f"[WARN] {e}")
+        return 1
+    except (BrokenProcessPool, KeyboardInterrupt) as e:
+        print(f"\n[WARN] Tournament interrupted ({e!r}); run again to resume")
+        return 1
+    print(f"\n  done in {time.perf_counter() - start:.1f} s")
+
+    ladder = tournament.ladder(paths["results"])
+    shown = ladder[:args.top] if args.top else ladder
+    print(f"{'#':>4} {'entry':<24} {'rating':>7} {'score':>6} {'games':>6}")
+    for rank, (name, rating, score, played) in enumerate(shown, 1):
+        print(f"{rank:>4} {name:<24} {rating:>7.0f} {score:>6.1%} {played:>6}")
+    if paths["matrix"]:
+        tournament.write_matrix(paths["results"], paths["matrix"])
+        print(f"Win matrix written to {paths['matrix']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,337 @@
+"""Battle server module -- headless team battles over a JSON-lines socket.
+
+Hosts many concurrent TeamBattle sessions on one asyncio event loop, for
+bots and load testing (no pygame involved).
+
+Usage (from the project root):
+    python3 -m utils.battle_server --port 8765
+    python3 -m utils.battle_server --unix /tmp/pokemon_battles.sock
+"""
+
+import argparse
+import asyncio
+import json
+import random
+
+from models.battle_event_bus import BattleEventBus
+from models.pokemon import Pokemon
+from models.species_registry import SpeciesRegistry
+from models.team_battle import TeamBattle
+from models.type_chart import TypeChart
+from utils.ring_buffer_sink import RingBufferSink
+
+
+class BattleServer:
+    """Asyncio server running headless team battles for many clients.
+
+    Protocol: one JSON object per line in each direction. Every request has
+    an "op" and may carry an "id", echoed in its response:
+
+        {"op": "create", "player": ["Pikachu", "Onix"], "opponent": null,
+         "level": 20, "seed": 7, "events": true}
+            -> {"id": .., "ok": true, "battle": 1, "state": {...}}
+        {"op": "attack", "battle": 1, "move": 0}
+        {"op": "switch", "battle": 1, "index": 2}
+        {"op": "forfeit", "battle": 1}
+            -> {"id": .., "ok": true, "messages": [...], "state": {...}}
+        {"op": "state", "battle": 1}
+        {"op": "close", "battle": 1}
+        {"op": "stats"}
+
+    "opponent" defaults to random species, "level" to each species' own
+    level. With "events" (the default), the battle events of an action are
+    streamed as {"battle": 1, "event": {...}} lines just before its
+    response. Errors are answered with {"ok": false, "error": "..."} and
+    leave the connection open.
+
+    Isolation: each battle owns copies of its Pokemon, its random.Random
+    and its BattleEventBus, and belongs to the connection that created it
+    (other connections cannot see it). A connection's battles are dropped
+    when it closes.
+
+    Backpressure: a connection's requests are handled one at a time, and
+    the next line is only read once the responses are flushed below the
+    transport's high-water mark (writer.drain()). A client that stops
+    reading stops being served -- and the kernel socket buffers push back
+    on its writes -- while the other connections carry on.
+    """
+
+    HOST = "127.0.0.1"
+    PORT = 8765
+    # Longest accepted request line, in bytes
+    MAX_LINE = 64 * 1024
+    MAX_BATTLES_PER_CONNECTION = 256
+    MAX_TEAM_SIZE = 6
+    # Unflushed output per connection before drain() waits
+    WRITE_HIGH_WATER = 64 * 1024
+    # Events buffered per battle and action (a turn emits far fewer)
+    EVENT_BUFFER = 256
+    # Shared encoder (json.dumps builds a new one per call with separators)
+    _encoder = json.JSONEncoder(separators=(",", ":"))
+
+    def __init__(self, species_path="data/pokemon.json",
+                 type_chart_path="data/type_chart.json", seed=None):
+        """Load the species and type chart shared (read-only) by all battles.
+
+        Args:
+            species_path: Species JSON file.
+            type_chart_path: Type chart JSON file.
+            seed: Optional seed for the per-battle seeds (reproducible runs).
+        """
+        self.type_chart = TypeChart()
+        self.type_chart.load_from_file(type_chart_path)
+        self.species = SpeciesRegistry()
+        self.species.load_from_file(species_path)
+        self.rng = random.Random(seed)
+        self._server = None
+        self._handlers = {}             # handler task -> its writer
+        self.connections = 0
+        self.battles_started = 0
+        self.battles_finished = 0
+        self.actions = 0
+
+    async def start(self, host=HOST, port=PORT, path=None):
+        """Start listening (TCP, or a Unix socket if `path` is given).
+
+        Args:
+            host: TCP host.
+            port: TCP port (0 picks a free one, see address()).
+            path: Unix socket path.
+
+        Returns:
+            asyncio.Server: The listening server.
+        """
+        if path is not None:
+            self._server = await asyncio.start_unix_server(
+                self._handle_connection, path=path, limit=self.MAX_LINE
+            )
+        else:
+            self._server = await asyncio.start_server(
+                self._handle_connection, host, port, limit=self.MAX_LINE
+            )
+        return self._server
+
+    def address(self):
+        """Return the listening address ((host, port) or the socket path)."""
+        return self._server.sockets[0].getsockname()
+
+    async def close(self):
+        """Stop listening, disconnect every client and wait for the handlers."""
+        if self._server is not None:
+            self._server.close()
+            for writer in self._handlers.values():
+                writer.close()
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle_connection(self, reader, writer):
+        """Serve one client until it disconnects."""
+        writer.transport.set_write_buffer_limits(high=self.WRITE_HIGH_WATER)
+        session = {"battles": {}, "next_id": 1}
+        task = asyncio.current_task()
+        self._handlers[task] = writer
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Line over MAX_LINE: the stream cannot be resynced
+                    writer.write(self._encode({"ok": False, "error": "Line too long"}))
+                    break
+                if not line:
+                    break
+                writer.writelines(self.handle_line(session, line))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            del self._handlers[task]
+            session["battles"].clear()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    def handle_line(self, session, line):
+        """Handle one request line of a connection.
+
+        Synchronous: battle logic never waits, so a request runs to
+        completion before the event loop switches to another connection.
+
+        Args:
+            session: The connection's state ({"battles", "next_id"}).
+            line: Raw request line (bytes).
+
+        Returns:
+            list[bytes]: Encoded lines to send (events, then the response).
+        """
+        out = []
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object")
+            request_id = request.get("id")
+            response = self._dispatch(session, request, out)
+            response["ok"] = True
+        except (ValueError, TypeError, KeyError, OverflowError) as e:
+            response = {"ok": False, "error": str(e)}
+        if request_id is not None:
+            response["id"] = request_id
+        out.append(self._encode(response))
+        return out
+
+    def _dispatch(self, session, request, out):
+        """Run one request and return its response dict."""
+        op = request.get("op")
+        if op == "create":
+            return self._create(session, request)
+        if op == "stats":
+            return self.stats()
+        battle_id = request.get("battle")
+        entry = session["battles"].get(battle_id)
+        if entry is None:
+            raise ValueError(f"Unknown battle {battle_id}")
+        battle, sink = entry
+        if op == "state":
+            return {"battle": battle_id, "state": battle.state()}
+        if op == "close":
+            del session["battles"][battle_id]
+            return {"battle": battle_id}
+
+        was_finished = battle.phase == TeamBattle.FINISHED
+        if op == "attack":
+            messages = battle.attack(self._integer(request.get("move", 0), "move"))
+        elif op == "switch":
+            messages = battle.switch(self._integer(request["index"], "index"))
+        elif op == "forfeit":
+            messages = battle.forfeit()
+        else:
+            raise ValueError(f"Unknown op {op!r}")
+        self.actions += 1
+        if battle.phase == TeamBattle.FINISHED and not was_finished:
+            self.battles_finished += 1
+        if sink is not None:
+            for event in sink.events():
+                out.append(self._encode({"battle": battle_id, "event": event}))
+            sink.clear()
+        return {"battle": battle_id, "messages": messages, "state": battle.state()}
+
+    def _create(self, session, request):
+        """Create a battle owned by the session."""
+        battles = session["battles"]
+        if len(battles) >= self.MAX_BATTLES_PER_CONNECTION:
+            raise ValueError("Too many battles on this connection")
+        seed = request.get("seed")
+        rng = random.Random(seed if seed is not None else self.rng.getrandbits(64))
+        player_names = request.get("player") or []
+        if not 1 <= len(player_names) <= self.MAX_TEAM_SIZE:
+            raise ValueError(f"A team has 1 to {self.MAX_TEAM_SIZE} Pokemon")
+        opponent_names = request.get("opponent")
+        if not opponent_names:
+            species = self.species.get_all()
+            count = min(len(player_names), len(species))
+            opponent_names = [s["name"] for s in rng.sample(species, count)]
+        elif len(opponent_names) > self.MAX_TEAM_SIZE:
+            raise ValueError(f"A team has 1 to {self.MAX_TEAM_SIZE} Pokemon")
+        level = request.get("level")
+        if level is not None:
+            level = max(1, self._integer(level, "level"))
+        player_team = self._build_team(player_names, level)
+        opponent_team = self._build_team(opponent_names, level)
+
+        sink = None
+        bus = BattleEventBus()
+        if request.get("events", True):
+            sink = RingBufferSink(self.EVENT_BUFFER)
+            bus.add_sink(sink)
+        battle = TeamBattle(player_team, opponent_team, self.type_chart, bus, rng)
+        battle_id = session["next_id"]
+        session["next_id"] += 1
+        battles[battle_id] = (battle, sink)
+        self.battles_started += 1
+        return {"battle": battle_id, "state": battle.state()}
+
+    def _build_team(self, names, level):
+        """Return fresh Pokemon for species names, optionally at one level."""
+        team = []
+        for name in names:
+            species = self.species.get(str(name))
+            if species is None:
+                raise ValueError(f"Unknown species {name!r}")
+            pokemon = Pokemon(data=species)
+            # Evolutions read this server's species, not the global default
+            pokemon.species_registry = self.species
+            if level is not None:
+                pokemon.scale_to_level(level)
+            team.append(pokemon)
+        return team
+
+    @staticmethod
+    def _integer(value, field):
+        """Check that a request field is a JSON integer.
+
+        Floats are refused rather than truncated (1e999 would not even
+        convert).
+
+        Args:
+            value: Decoded JSON value.
+            field: Field name, for the error message.
+
+        Returns:
+            int: The value.
+
+        Raises:
+            ValueError: If the value is not an integer.
+        """
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise ValueError(f"{field!r} must be an integer, got {value!r}")
+        return value
+
+    def stats(self):
+        """Return server counters.
+
+        Returns:
+            dict: connections, battles_started, battles_finished, actions.
+        """
+        return {
+            "connections": self.connections,
+            "battles_started": self.battles_started,
+            "battles_finished": self.battles_finished,
+            "actions": self.actions,
+        }
+
+    @classmethod
+    def _encode(cls, message):
+        """Encode one protocol message as a JSON line."""
+        return cls._encoder.encode(message).encode("utf-8") + b"\n"
+
+
+def main():
+    """Run the server until interrupted."""
+    parser = argparse.ArgumentParser(description="Headless Pokemon battle server")
+    parser.add_argument("--host", default=BattleServer.HOST)
+    parser.add_argument("--port", type=int, default=BattleServer.PORT)
+    parser.add_argument("--unix", help="Listen on this Unix socket path instead")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    async def serve():
+        server = BattleServer(seed=args.seed)
+        listener = await server.start(args.host, args.port, args.unix)
+        print(f"Battle server listening on {server.address()}")
+        async with listener:
+            await listener.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print("Battle server stopped")
+
+
+if __name__ == "__main__":
+    main()
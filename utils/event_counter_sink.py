@@ -0,0 +1,65 @@
+"""Event counter sink module -- aggregate counters over battle events."""
+
+from models.battle_event_bus import BattleEventBus
+
+
+class EventCounterSink:
+    """Battle event sink keeping running totals instead of the events.
+
+    Counts events per kind, and sums the numeric outcomes: damage dealt per
+    side, super/not-very effective hits and XP awarded.
+
+    Example:
+        counters = EventCounterSink()
+        game.battle_events.add_sink(counters)
+        ...
+        print(counters.summary())
+    """
+
+    def __init__(self):
+        """Create zeroed counters."""
+        self.counts = {}
+        self.damage = {"player": 0, "opponent": 0}
+        self.effectiveness = {}
+        self.total_xp = 0
+
+    def handle(self, event):
+        """Fold an event into the counters (BattleEventBus sink interface).
+
+        Args:
+            event: Event dict.
+        """
+        kind = event["kind"]
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        if kind == BattleEventBus.HIT:
+            side = event.get("side", "player")
+            self.damage[side] = self.damage.get(side, 0) + event.get("damage", 0)
+        elif kind == BattleEventBus.EFFECTIVENESS:
+            label = event.get("effective")
+            self.effectiveness[label] = self.effectiveness.get(label, 0) + 1
+        elif kind == BattleEventBus.XP:
+            self.total_xp += event.get("amount", 0)
+
+    def accuracy(self):
+        """Return the share of attacks that hit.
+
+        Returns:
+            float: Hits / (hits + misses), 0.0 before any attack.
+        """
+        hits = self.counts.get(BattleEventBus.HIT, 0)
+        attacks = hits + self.counts.get(BattleEventBus.MISS, 0)
+        return hits / attacks if attacks else 0.0
+
+    def summary(self):
+        """Return a JSON-serializable copy of the counters.
+
+        Returns:
+            dict: counts, damage, effectiveness, total_xp and accuracy.
+        """
+        return {
+            "counts": dict(self.counts),
+            "damage": dict(self.damage),
+            "effectiveness": dict(self.effectiveness),
+            "total_xp": self.total_xp,
+            "accuracy": round(self.accuracy(), 3),
+        }
@@ -2,6 +2,7 @@
 
 import json
 import os
+import tempfile
 
 
 class FileHandler:
@@ -23,18 +24,149 @@ class FileHandler:
         with open(path, "r", encoding="utf-8") as file:
             return json.load(file)
 
+    def load_bytes(self, path):
+        """Read a binary file.
+
+        Args:
+            path: Path to the file.
+
+        Returns:
+            bytes: File content.
+        """
+        with open(path, "rb") as file:
+            return file.read()
+
     def save_json(self, path, data):
         """Save data to a JSON file, creating directories if needed.
 
+        The file is written atomically (see write_atomic), so a crash
+        mid-write leaves the previous version intact.
+
         Args:
             path: Path where the JSON file will be saved.
             data: Data to serialize (dict or list).
         """
+        text = json.dumps(data, indent=2, ensure_ascii=False)
+        self.write_atomic(path, text.encode("utf-8"))
+
+    def write_atomic(self, path, payload):
+        """Write bytes to a file through a temp file + fsync + rename.
+
+        The temp file lives in the same directory as the target so the
+        final os.replace() is an atomic rename on the same filesystem.
+
+        Args:
+            path: Destination path.
+            payload: Bytes to write.
+        """
         directory = os.path.dirname(path)
         if directory:
             os.makedirs(directory, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as file:
-            json.dump(data, file, indent=2, ensure_ascii=False)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=directory or ".", prefix=".tmp-", suffix=".part"
+        )
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(payload)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._fsync_directory(directory or ".")
+
+    def _fsync_directory(self, directory):
+        """Flush a directory entry so the rename itself survives a crash.
+
+        Not supported on every platform (e.g. Windows), so failures are ignored.
+
+        Args:
+            directory: Directory containing the renamed file.
+        """
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def append_jsonl(self, path, records):
+        """Append records to a JSON-lines file and fsync it.
+
+        If a previous append was torn by a crash, a newline is inserted first
+        so the torn fragment stays on its own (skipped) line.
+
+        Args:
+            path: Path of the .jsonl file (created if missing).
+            records: List of JSON-serializable records, one per line.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        lines = []
+        for record in records:
+            lines.append(json.dumps(record, separators=(",", ":"), ensure_ascii=False))
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+        with open(path, "ab+") as file:
+            if file.tell() > 0:
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) != b"\n":
+                    payload = b"\n" + payload
+            file.write(payload)
+            file.flush()
+            os.fsync(file.fileno())
+
+    def load_jsonl(self, path):
+        """Load all records from a JSON-lines file.
+
+        Torn lines (crash during append) are skipped.
+
+        Args:
+            path: Path of the .jsonl file.
+
+        Returns:
+            list: Parsed records, [] if the file does not exist.
+        """
+        return list(self.iter_jsonl(path))
+
+    def iter_jsonl(self, path):
+        """Yield the records of a JSON-lines file one at a time.
+
+        Same as load_jsonl() without holding the whole file in memory.
+
+        Args:
+            path: Path of the .jsonl file.
+
+        Yields:
+            Parsed records (none if the file does not exist).
+        """
+        if not os.path.isfile(path):
+            return
+        with open(path, "r", encoding="utf-8") as file:
+            for line in file:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                yield record
+
+    def remove_file(self, path):
+        """Delete a file if it exists.
+
+        Args:
+            path: Path of the file to delete.
+        """
+        if os.path.isfile(path):
+            os.remove(path)
 
     def file_exists(self, path):
         """Check if a file exists at the given path.
@@ -0,0 +1,60 @@
+"""JSONL event sink module -- writes battle events to a JSON-lines file."""
+
+from utils.save_worker import SaveWorker
+
+
+class JsonlEventSink:
+    """Battle event sink appending events to a JSONL file in batches.
+
+    Events are buffered and handed over in batches of batch_size events to
+    a SaveWorker, whose thread does the append (and its fsync): events are
+    emitted on the UI thread, which must not wait for the disk. The sink
+    has its own worker, so a failing event log never reports a game save
+    as failed. close() queues whatever is left and waits for the writes;
+    call it (or BattleEventBus.close()) before exit.
+
+    Example:
+        sink = JsonlEventSink("battle_events.jsonl")
+        game.battle_events.add_sink(sink)
+        ...
+        game.battle_events.close()
+    """
+
+    def __init__(self, path, batch_size=64, file_handler=None):
+        """Create a sink (the file is created on the first write).
+
+        Args:
+            path: Output .jsonl file, appended to.
+            batch_size: Number of buffered events that triggers a flush.
+            file_handler: FileHandler used for the appends.
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.worker = SaveWorker(file_handler)
+        self._buffer = []
+
+    def handle(self, event):
+        """Buffer an event, flushing when the batch is full.
+
+        Args:
+            event: Event dict.
+        """
+        self._buffer.append(event)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Queue the buffered events for writing (does not wait).
+
+        Write errors are reported by the worker thread.
+        """
+        if not self._buffer:
+            return
+        batch = self._buffer
+        self._buffer = []
+        self.worker.submit_append(self.path, batch)
+
+    def close(self):
+        """Write the remaining events and stop the worker thread."""
+        self.flush()
+        self.worker.close()
@@ -0,0 +1,174 @@
+"""Pokemon importer module -- streaming bulk import from JSONL or CSV."""
+
+import csv
+import json
+import os
+
+from models.pokemon import Pokemon
+
+
+class PokemonImporter:
+    """Reads custom Pokemon from a JSONL or CSV file, one row at a time.
+
+    Rows are never accumulated: read() is a generator yielding validated
+    rows, and rejected rows are streamed to an optional rejects file, with
+    only the first KEEP_REJECTS kept in memory for the report. Memory use
+    is therefore independent of the file size. Deduplication is left to the
+    caller (Game.import_pokemon checks its name index and calls reject()).
+
+    Formats:
+        JSONL: one object per line, same keys as the Add Pokemon form
+            (name, hp, attack, defense, types, optional level and moves).
+        CSV: header row with name,hp,attack,defense,types[,level][,moves].
+            Types are separated by "/" (e.g. "fire/flying"); moves by ";",
+            each as name:type:power[:accuracy].
+
+    Example:
+        importer = PokemonImporter("rejects.jsonl")
+        for line, data in importer.read("custom.csv"):
+            game.add_pokemon(data)
+        importer.close()
+        print(importer.report())
+    """
+
+    KEEP_REJECTS = 20
+
+    def __init__(self, rejects_path=None):
+        """Create an importer.
+
+        Args:
+            rejects_path: Optional JSONL file receiving every rejected row
+                as {"line": n, "reason": str}.
+        """
+        self.rejects_path = rejects_path
+        self._rejects_file = None
+        self.read_count = 0
+        self.rejected_count = 0
+        self.sample_rejects = []
+
+    def read(self, path, file_format=None):
+        """Yield (line number, validated data) for each valid row.
+
+        Invalid rows are reported through reject() and skipped.
+
+        Args:
+            path: File to read.
+            file_format: "jsonl" or "csv" (default: from the extension).
+
+        Yields:
+            tuple: (line number, dict accepted by Pokemon(data=...)).
+
+        Raises:
+            ValueError: If the format is unknown.
+        """
+        if file_format is None:
+            ext = os.path.splitext(path)[1].lower()
+            file_format = "csv" if ext == ".csv" else "jsonl"
+        if file_format == "jsonl":
+            rows = self._read_jsonl(path)
+        elif file_format == "csv":
+            rows = self._read_csv(path)
+        else:
+            raise ValueError(f"Unknown import format '{file_format}'")
+
+        for line, row in rows:
+            self.read_count += 1
+            if isinstance(row, str):
+                self.reject(line, row)
+                continue
+            try:
+                data = Pokemon.validate_data(row)
+            except ValueError as e:
+                self.reject(line, str(e))
+                continue
+            yield line, data
+
+    def _read_jsonl(self, path):
+        """Yield (line, dict or error message) from a JSONL file."""
+        with open(path, "r", encoding="utf-8") as file:
+            for line, text in enumerate(file, start=1):
+                text = text.strip()
+                if not text:
+                    continue
+                try:
+                    row = json.loads(text)
+                except json.JSONDecodeError as e:
+                    yield line, f"Invalid JSON: {e.msg}"
+                    continue
+                if not isinstance(row, dict):
+                    yield line, "Expected a JSON object"
+                    continue
+                yield line, row
+
+    def _read_csv(self, path):
+        """Yield (line, dict or error message) from a CSV file."""
+        with open(path, "r", encoding="utf-8", newline="") as file:
+            reader = csv.DictReader(file)
+            for row in reader:
+                line = reader.line_num
+                row["types"] = (row.get("types") or "").split("/")
+                if not row.get("level"):
+                    row.pop("level", None)
+                try:
+                    row["moves"] = self._parse_csv_moves(row.get("moves") or "")
+                except ValueError as e:
+                    yield line, str(e)
+                    continue
+                yield line, row
+
+    def _parse_csv_moves(self, text):
+        """Parse "name:type:power[:accuracy];..." into move dicts."""
+        moves = []
+        for chunk in text.split(";"):
+            if not chunk.strip():
+                continue
+            parts = chunk.split(":")
+            if len(parts) not in (3, 4):
+                raise ValueError(f"Invalid move: '{chunk}'")
+            try:
+                power = int(parts[2])
+                accuracy = int(parts[3]) if len(parts) == 4 else 100
+            except ValueError:
+                raise ValueError(f"Invalid move: '{chunk}'")
+            moves.append({
+                "name": parts[0].strip(),
+                "move_type": parts[1].strip().lower(),
+                "power": power,
+                "accuracy": accuracy,
+            })
+        return moves
+
+    def reject(self, line, reason):
+        """Record a rejected row.
+
+        Args:
+            line: Line number in the source file.
+            reason: Human-readable reason.
+        """
+        self.rejected_count += 1
+        if len(self.sample_rejects) < self.KEEP_REJECTS:
+            self.sample_rejects.append((line, reason))
+        if self.rejects_path is not None:
+            if self._rejects_file is None:
+                self._rejects_file = open(self.rejects_path, "w", encoding="utf-8")
+            self._rejects_file.write(json.dumps({"line": line, "reason": reason}) + "\n")
+
+    def close(self):
+        """Close the rejects file, if any."""
+        if self._rejects_file is not None:
+            self._rejects_file.close()
+            self._rejects_file = None
+
+    def report(self):
+        """Summarize the import.
+
+        Returns:
+            dict: read, accepted and rejected counts, plus up to
+                KEEP_REJECTS (line, reason) samples.
+        """
+        return {
+            "read": self.read_count,
+            "accepted": self.read_count - self.rejected_count,
+            "rejected": self.rejected_count,
+            "sample_rejects": list(self.sample_rejects),
+        }
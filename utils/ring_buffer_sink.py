@@ -0,0 +1,50 @@
+"""Ring buffer sink module -- keeps the most recent battle events in memory."""
+
+import collections
+
+
+class RingBufferSink:
+    """Battle event sink holding the last `capacity` events.
+
+    Older events are dropped as new ones arrive, so memory stays bounded
+    however long the session runs.
+
+    Example:
+        ring = RingBufferSink(200)
+        game.battle_events.add_sink(ring)
+        for event in ring.events(kind="ko"):
+            print(event["defender"])
+    """
+
+    def __init__(self, capacity=256):
+        """Create an empty buffer.
+
+        Args:
+            capacity: Maximum number of events kept.
+        """
+        self._events = collections.deque(maxlen=capacity)
+
+    def handle(self, event):
+        """Store an event (BattleEventBus sink interface).
+
+        Args:
+            event: Event dict.
+        """
+        self._events.append(event)
+
+    def events(self, kind=None):
+        """Return the buffered events, oldest first.
+
+        Args:
+            kind: Optional kind to filter on.
+
+        Returns:
+            list[dict]: Buffered events.
+        """
+        if kind is None:
+            return list(self._events)
+        return [event for event in self._events if event["kind"] == kind]
+
+    def clear(self):
+        """Drop every buffered event."""
+        self._events.clear()
@@ -0,0 +1,411 @@
+"""Save codec module -- compact binary encoding for save files."""
+
+import struct
+import sys
+import zlib
+from array import array
+
+
+class SaveCodec:
+    """Compact binary encoding of the save data produced by Game.
+
+    Instead of repeating every field of every Pokemon, the encoding keeps:
+
+    - a string table (names, types, sprite paths) so each string is stored
+      once and referenced by ID;
+    - a move table, so each distinct move is stored once;
+    - one integer column per Pokemon field (column-major, zlib-compressed);
+    - species references: types, moves and sprite_path equal to those of
+      the species with the same name in data/pokemon.json are not stored
+      at all, only a DERIVED marker.
+
+    Saves of a roster backed by a species database (see LazyRoster) only
+    hold the entries that differ from it; their species count and roster
+    indices follow the two meta values.
+
+    Layout (little-endian)::
+
+        header   "PKSV" | u16 version | u16 flags
+        payload  (zlib if FLAG_ZLIB) made of sections, each "u32 length + bytes":
+                 strings, moves, list pool, roster columns, pokedex columns, meta
+
+    decode() returns exactly the dictionary shape of the JSON save, so the
+    rest of the game does not care which format was used.
+
+    Example:
+        codec = SaveCodec(species_list)
+        blob = codec.encode(save_data)
+        save_data = codec.decode(blob)
+    """
+
+    MAGIC = b"PKSV"
+    # Version 2 adds the species database meta values; saves without
+    # them are still written as version 1
+    VERSION = 2
+    FLAG_ZLIB = 1
+    HEADER = struct.Struct("<4sHH")
+
+    # Column markers (stored in int64 columns)
+    NONE = -1              # None (string / list references)
+    DERIVED = -2           # value taken from the species of the same name
+    INT_NONE = -(2 ** 63)  # None in numeric columns
+
+    ROSTER_COLUMNS = (
+        "name", "hp", "level", "attack", "defense", "xp", "xp_to_next_level",
+        "evolution_level", "evolution_target", "sprite_path", "types",
+        "moves", "locked",
+    )
+    POKEDEX_COLUMNS = ("name", "hp", "attack", "defense", "types")
+
+    def __init__(self, species=None, species_lookup=None):
+        """Create a codec bound to a species table.
+
+        Args:
+            species: List of species dicts (data/pokemon.json). Pokemon whose
+                name matches a species only store their differences from it.
+            species_lookup: Optional callable(name) returning a species dict
+                or None, used instead of `species` when the table is too
+                large to copy (SpeciesRegistry.get over a species database).
+        """
+        self.species_by_name = {}
+        for s in species or []:
+            self.species_by_name.setdefault(s.get("name"), s)
+        self._species_lookup = species_lookup or self.species_by_name.get
+
+    @classmethod
+    def is_compact(cls, blob):
+        """Check whether bytes start with the compact save header.
+
+        Args:
+            blob: Raw file content.
+
+        Returns:
+            bool: True if the blob is a compact save.
+        """
+        return blob[:len(cls.MAGIC)] == cls.MAGIC
+
+    # ------------------------------------------------------------------
+    # Encoding
+    # ------------------------------------------------------------------
+
+    def encode(self, save_data, compress=True):
+        """Encode a save dictionary to bytes.
+
+        Args:
+            save_data: Dict with pokemon_list, evolution_count, pokedex and
+                optionally journal_seq (same shape as the JSON save).
+            compress: zlib-compress the payload.
+
+        Returns:
+            bytes: The encoded save.
+
+        Raises:
+            ValueError: If a numeric field is not an integer.
+        """
+        self._strings = []
+        self._string_ids = {}
+        self._moves = array("q")
+        self._move_ids = {}
+        self._pool = array("q")
+        self._pool_ids = {}
+
+        roster = save_data.get("pokemon_list", [])
+        columns = {}
+        for key in self.ROSTER_COLUMNS:
+            columns[key] = array("q")
+        for p in roster:
+            self._encode_pokemon(p, columns)
+
+        pokedex = save_data.get("pokedex", [])
+        dex_columns = {}
+        for key in self.POKEDEX_COLUMNS:
+            dex_columns[key] = array("q")
+        for entry in pokedex:
+            dex_columns["name"].append(self._sid(entry.get("name", "")))
+            for key in ("hp", "attack", "defense"):
+                value = entry.get(key)
+                dex_columns[key].append(
+                    self.INT_NONE if value is None else self._int(value)
+                )
+            dex_columns["types"].append(self._list_ref(
+                [self._sid(t) for t in entry.get("types", [])]
+            ))
+
+        meta = array("q", [
+            self._int(save_data.get("evolution_count", 0)),
+            self._int(save_data.get("journal_seq", 0)),
+        ])
+        if "species_roster" in save_data:
+            meta.append(self._int(save_data["species_roster"]))
+            meta.extend(self._int(i) for i in save_data["roster_indices"])
+
+        blob = "\0".join(self._strings).encode("utf-8")
+        sections = [
+            struct.pack("<I", len(self._strings)) + blob,
+            self._array_bytes(self._moves),
+            self._array_bytes(self._pool),
+            struct.pack("<I", len(roster)) + b"".join(
+                self._array_bytes(columns[key]) for key in self.ROSTER_COLUMNS
+            ),
+            struct.pack("<I", len(pokedex)) + b"".join(
+                self._array_bytes(dex_columns[key]) for key in self.POKEDEX_COLUMNS
+            ),
+            self._array_bytes(meta),
+        ]
+        payload = b"".join(struct.pack("<I", len(s)) + s for s in sections)
+
+        flags = 0
+        if compress:
+            payload = zlib.compress(payload, 6)
+            flags |= self.FLAG_ZLIB
+        version = self.VERSION if "species_roster" in save_data else 1
+        return self.HEADER.pack(self.MAGIC, version, flags) + payload
+
+    def _encode_pokemon(self, p, columns):
+        """Append one Pokemon dict to the roster columns.
+
+        Args:
+            p: Pokemon dict (Pokemon.to_dict() shape).
+            columns: Dict of column arrays.
+        """
+        name = p.get("name", "Unknown")
+        species = self._species_lookup(name)
+        columns["name"].append(self._sid(name))
+        for key in ("hp", "level", "attack", "defense", "xp", "xp_to_next_level"):
+            columns[key].append(self._int(p.get(key, 0)))
+        evo_level = p.get("evolution_level")
+        columns["evolution_level"].append(
+            self.INT_NONE if evo_level is None else self._int(evo_level)
+        )
+        evo_target = p.get("evolution_target")
+        columns["evolution_target"].append(
+            self.NONE if evo_target is None else self._sid(evo_target)
+        )
+
+        sprite = p.get("sprite_path", "")
+        if species is not None and sprite == species.get("sprite_path", ""):
+            columns["sprite_path"].append(self.DERIVED)
+        else:
+            columns["sprite_path"].append(self._sid(sprite))
+
+        types = p.get("types", ["normal"])
+        if species is not None and types == species.get("types", ["normal"]):
+            columns["types"].append(self.DERIVED)
+        else:
+            columns["types"].append(self._list_ref([self._sid(t) for t in types]))
+
+        moves = p.get("moves", [])
+        if species is not None and moves == species.get("moves", []):
+            columns["moves"].append(self.DERIVED)
+        else:
+            columns["moves"].append(self._list_ref([self._mid(m) for m in moves]))
+
+        columns["locked"].append(1 if p.get("locked", False) else 0)
+
+    def _sid(self, text):
+        """Return the string-table ID of text, interning it if needed."""
+        sid = self._string_ids.get(text)
+        if sid is None:
+            if "\0" in text:
+                raise ValueError("Strings cannot contain NUL characters")
+            sid = len(self._strings)
+            self._strings.append(text)
+            self._string_ids[text] = sid
+        return sid
+
+    def _mid(self, move):
+        """Return the move-table ID of a move dict, interning it if needed."""
+        key = (
+            move["name"], move["move_type"], move["power"],
+            move.get("accuracy", 100),
+        )
+        mid = self._move_ids.get(key)
+        if mid is None:
+            mid = len(self._move_ids)
+            self._moves.extend((
+                self._sid(key[0]), self._sid(key[1]),
+                self._int(key[2]), self._int(key[3]),
+            ))
+            self._move_ids[key] = mid
+        return mid
+
+    def _list_ref(self, items):
+        """Store an int list in the pool (deduplicated) and return its offset."""
+        key = tuple(items)
+        ref = self._pool_ids.get(key)
+        if ref is None:
+            ref = len(self._pool)
+            self._pool.append(len(items))
+            self._pool.extend(items)
+            self._pool_ids[key] = ref
+        return ref
+
+    def _int(self, value):
+        """Validate an integer field value (int64, INT_NONE excluded)."""
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise ValueError(f"Expected an integer, got {value!r}")
+        if not self.INT_NONE < value < 2 ** 63:
+            raise ValueError(f"Integer out of range for a compact save: {value}")
+        return value
+
+    def _array_bytes(self, values):
+        """Serialize an int64 array as little-endian bytes."""
+        if sys.byteorder == "big":
+            values = array("q", values)
+            values.byteswap()
+        return values.tobytes()
+
+    # ------------------------------------------------------------------
+    # Decoding
+    # ------------------------------------------------------------------
+
+    def decode(self, blob):
+        """Decode bytes produced by encode() back to a save dictionary.
+
+        Args:
+            blob: Encoded save.
+
+        Returns:
+            dict: Save data in the JSON save shape.
+
+        Raises:
+            ValueError: If the blob is not a supported compact save, or
+                references a species missing from the species table.
+        """
+        if len(blob) < self.HEADER.size or not self.is_compact(blob):
+            raise ValueError("Not a compact save file")
+        _magic, version, flags = self.HEADER.unpack_from(blob)
+        if version > self.VERSION:
+            raise ValueError(f"Unsupported save version {version}")
+        payload = blob[self.HEADER.size:]
+        try:
+            if flags & self.FLAG_ZLIB:
+                payload = zlib.decompress(payload)
+            sections = self._split_sections(payload)
+            return self._decode_sections(sections)
+        except (zlib.error, struct.error, IndexError, UnicodeDecodeError) as e:
+            raise ValueError(f"Corrupted compact save: {e}")
+
+    def _split_sections(self, payload):
+        """Cut the payload into its length-prefixed sections."""
+        sections = []
+        pos = 0
+        while pos < len(payload):
+            (length,) = struct.unpack_from("<I", payload, pos)
+            pos += 4
+            sections.append(payload[pos:pos + length])
+            pos += length
+        if len(sections) != 6:
+            raise ValueError("Unexpected number of sections")
+        return sections
+
+    def _decode_sections(self, sections):
+        """Rebuild the save dictionary from the decoded sections."""
+        (string_count,) = struct.unpack_from("<I", sections[0])
+        strings = sections[0][4:].decode("utf-8").split("\0")
+        if string_count == 0:
+            strings = []
+        moves_raw = self._read_array(sections[1])
+        pool = self._read_array(sections[2])
+
+        move_dicts = []
+        for i in range(0, len(moves_raw), 4):
+            move_dicts.append((
+                strings[moves_raw[i]], strings[moves_raw[i + 1]],
+                moves_raw[i + 2], moves_raw[i + 3],
+            ))
+
+        roster = self._read_columns(sections[3], self.ROSTER_COLUMNS)
+        pokemon_list = []
+        for row in zip(*(roster[key] for key in self.ROSTER_COLUMNS)):
+            (name_id, hp, level, attack, defense, xp, xp_next, evo_level,
+             evo_target, sprite, types, moves, locked) = row
+            name = strings[name_id]
+            species = None
+            if self.DERIVED in (sprite, types, moves):
+                species = self._species_lookup(name)
+                if species is None:
+                    raise ValueError(f"Unknown species '{name}' in save")
+
+            if sprite == self.DERIVED:
+                sprite_path = species.get("sprite_path", "")
+            else:
+                sprite_path = strings[sprite]
+            if types == self.DERIVED:
+                type_list = list(species.get("types", ["normal"]))
+            else:
+                type_list = [strings[t] for t in self._pool_list(pool, types)]
+            if moves == self.DERIVED:
+                move_list = [dict(m) for m in species.get("moves", [])]
+            else:
+                move_list = []
+                for mid in self._pool_list(pool, moves):
+                    m_name, m_type, power, accuracy = move_dicts[mid]
+                    move_list.append({
+                        "name": m_name, "move_type": m_type,
+                        "power": power, "accuracy": accuracy,
+                    })
+
+            pokemon_list.append({
+                "name": name,
+                "hp": hp,
+                "level": level,
+                "attack": attack,
+                "defense": defense,
+                "types": type_list,
+                "sprite_path": sprite_path,
+                "xp": xp,
+                "xp_to_next_level": xp_next,
+                "evolution_level": None if evo_level == self.INT_NONE else evo_level,
+                "evolution_target": None if evo_target == self.NONE else strings[evo_target],
+                "moves": move_list,
+                "locked": bool(locked),
+            })
+
+        dex = self._read_columns(sections[4], self.POKEDEX_COLUMNS)
+        pokedex = []
+        for name_id, hp, attack, defense, types in zip(
+                *(dex[key] for key in self.POKEDEX_COLUMNS)):
+            pokedex.append({
+                "name": strings[name_id],
+                "types": [strings[t] for t in self._pool_list(pool, types)],
+                "hp": None if hp == self.INT_NONE else hp,
+                "attack": None if attack == self.INT_NONE else attack,
+                "defense": None if defense == self.INT_NONE else defense,
+            })
+
+        meta = self._read_array(sections[5])
+        save_data = {
+            "pokemon_list": pokemon_list,
+            "evolution_count": meta[0],
+            "pokedex": pokedex,
+            "journal_seq": meta[1],
+        }
+        if len(meta) > 2:
+            save_data["species_roster"] = meta[2]
+            save_data["roster_indices"] = list(meta[3:])
+        return save_data
+
+    def _read_columns(self, section, names):
+        """Split a "u32 count + columns" section into named int64 arrays."""
+        (count,) = struct.unpack_from("<I", section)
+        columns = {}
+        width = count * 8
+        pos = 4
+        for key in names:
+            columns[key] = self._read_array(section[pos:pos + width])
+            pos += width
+        return columns
+
+    def _read_array(self, raw):
+        """Load little-endian int64 bytes into an array."""
+        values = array("q")
+        values.frombytes(raw)
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values
+
+    def _pool_list(self, pool, ref):
+        """Return the int list stored at offset ref in the pool."""
+        length = pool[ref]
+        return pool[ref + 1:ref + 1 + length]
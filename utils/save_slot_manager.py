@@ -0,0 +1,211 @@
+"""Save slot manager module -- named save slots with a metadata index."""
+
+import os
+
+
+class SaveSlotManager:
+    """Keeps track of the save slots through a small metadata index.
+
+    Each slot has its own files in the save directory (<slot>.json or
+    <slot>.bin, plus <slot>.journal). The index (index.json) holds only
+    what the menu needs -- slot name, timestamp, pokedex count, team levels
+    -- so slots can be listed without opening or parsing any save file.
+    The index is read once; afterwards it lives in memory and Game hands
+    updated copies to the save worker together with each save. A save's
+    metadata is staged (written with the index, not yet listed) and only
+    committed once the save has landed, so a failed save never shows up as
+    a slot. Commits run on the save worker thread: the slot tables are
+    replaced rather than modified, so the UI thread can read them safely.
+
+    Example:
+        slots = SaveSlotManager("saves")
+        for meta in slots.list_slots():
+            print(meta["name"], meta["pokedex_count"])
+    """
+
+    INDEX_FILE = "index.json"
+    DEFAULT_SLOT = "slot1"
+    # Pre-slot saves (saves/save.json, ...) become DEFAULT_SLOT
+    LEGACY_NAME = "save"
+    EXTENSIONS = (".json", ".bin", ".journal")
+
+    def __init__(self, save_dir, file_handler):
+        """Load the index, creating it from legacy saves if needed.
+
+        Args:
+            save_dir: Directory holding the slot files and the index.
+            file_handler: FileHandler used to read the index.
+        """
+        self.save_dir = save_dir
+        self.file_handler = file_handler
+        self.index_path = os.path.join(save_dir, self.INDEX_FILE)
+        self.active = self.DEFAULT_SLOT
+        self._slots = {}
+        # Metadata of saves not yet on disk, by slot name
+        self._staged = {}
+        if self.file_handler.file_exists(self.index_path):
+            self._load_index()
+        else:
+            self._adopt_legacy_save()
+
+    def _load_index(self):
+        """Read index.json into memory (ignored if unreadable)."""
+        try:
+            data = self.file_handler.load_json(self.index_path)
+            self.active = data.get("active", self.DEFAULT_SLOT)
+            for meta in data.get("slots", []):
+                self._slots[meta["name"]] = meta
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            print(f"[WARN] Save index unreadable, rebuilding: {e}")
+            self._slots = {}
+            self._adopt_legacy_save()
+
+    def _adopt_legacy_save(self):
+        """Register slot files that exist on disk but not in the index.
+
+        Legacy single-save files (save.json, save.bin, save.journal) are
+        renamed to the default slot first.
+        """
+        for ext in self.EXTENSIONS:
+            legacy = os.path.join(self.save_dir, self.LEGACY_NAME + ext)
+            target = self.get_paths(self.DEFAULT_SLOT)[ext]
+            if os.path.isfile(legacy) and not os.path.exists(target):
+                os.replace(legacy, target)
+        if not os.path.isdir(self.save_dir):
+            return
+        for filename in sorted(os.listdir(self.save_dir)):
+            name, ext = os.path.splitext(filename)
+            if ext in (".json", ".bin") and filename != self.INDEX_FILE:
+                if name not in self._slots:
+                    self._slots[name] = {
+                        "name": name,
+                        "timestamp": os.path.getmtime(
+                            os.path.join(self.save_dir, filename)
+                        ),
+                        "pokedex_count": None,
+                        "team_levels": [],
+                    }
+
+    def get_paths(self, slot):
+        """Return the file paths used by a slot.
+
+        Args:
+            slot: Slot name.
+
+        Returns:
+            dict: {".json": path, ".bin": path, ".journal": path}.
+        """
+        paths = {}
+        for ext in self.EXTENSIONS:
+            paths[ext] = os.path.join(self.save_dir, slot + ext)
+        return paths
+
+    def list_slots(self):
+        """Return the metadata of every slot, sorted by name.
+
+        Returns:
+            list[dict]: Slot metadata (name, timestamp, pokedex_count,
+                team_levels, ...).
+        """
+        slots = []
+        for name in sorted(self._slots):
+            slots.append(dict(self._slots[name]))
+        return slots
+
+    def get(self, slot):
+        """Return a slot's metadata.
+
+        Args:
+            slot: Slot name.
+
+        Returns:
+            dict or None: Metadata copy, None if the slot is empty.
+        """
+        meta = self._slots.get(slot)
+        return dict(meta) if meta is not None else None
+
+    def has_slot(self, slot):
+        """Check if a slot holds a save (in-memory, no filesystem access).
+
+        Args:
+            slot: Slot name.
+
+        Returns:
+            bool: True if the slot is in the index.
+        """
+        return slot in self._slots
+
+    def next_free_slot(self):
+        """Return the first unused "slotN" name.
+
+        Returns:
+            str: A slot name not present in the index.
+        """
+        n = 1
+        while f"slot{n}" in self._slots:
+            n += 1
+        return f"slot{n}"
+
+    def stage(self, meta):
+        """Prepare the index write of a save without recording the slot yet.
+
+        Call commit() (or discard()) with the same dict once the save has
+        landed (or failed).
+
+        Args:
+            meta: Dict with at least "name".
+
+        Returns:
+            dict: A detached copy of the whole index, including the staged
+                metadata and with that slot active, ready to be written.
+        """
+        staged = dict(self._staged)
+        staged[meta["name"]] = meta
+        self._staged = staged
+        return self.snapshot(active=meta["name"])
+
+    def commit(self, meta):
+        """Record staged metadata once its save is on disk.
+
+        Args:
+            meta: Dict passed to stage(); it becomes the active slot.
+        """
+        slots = dict(self._slots)
+        slots[meta["name"]] = dict(meta)
+        self._slots = slots
+        self.active = meta["name"]
+        self.discard(meta)
+
+    def discard(self, meta):
+        """Forget staged metadata whose save failed.
+
+        Args:
+            meta: Dict passed to stage(). A newer staging of the same slot
+                is kept.
+        """
+        if self._staged.get(meta["name"]) is meta:
+            staged = dict(self._staged)
+            del staged[meta["name"]]
+            self._staged = staged
+
+    def snapshot(self, active=None):
+        """Return a detached copy of the index for writing.
+
+        Staged metadata (saves still being written) is included.
+
+        Args:
+            active: Slot to mark active (default: the active slot).
+
+        Returns:
+            dict: {"active": name, "slots": [metadata, ...]}.
+        """
+        entries = dict(self._slots)
+        entries.update(self._staged)
+        slots = []
+        for name in sorted(entries):
+            meta = dict(entries[name])
+            meta["team_levels"] = list(meta.get("team_levels", []))
+            if "team" in meta:
+                meta["team"] = list(meta["team"])
+            slots.append(meta)
+        return {"active": active or self.active, "slots": slots}
@@ -0,0 +1,210 @@
+"""Save worker module -- writes save snapshots on a background thread."""
+
+import threading
+
+from utils.file_handler import FileHandler
+
+
+class SaveWorker:
+    """Serializes and writes save snapshots off the UI thread.
+
+    Callers hand over an immutable snapshot ({path: data}); the worker
+    serializes it and writes each file atomically through FileHandler.
+    If several saves are submitted before the worker picks them up, they
+    are coalesced: only the newest data per path is written, and every
+    callback is fired once that write lands. Files are written in the
+    order of their latest submission, and a failed write stops the batch:
+    the files after it (such as an index listing the failed save) are
+    not written, and every callback gets success=False.
+
+    Small journal records can be queued with submit_append(). A snapshot
+    submitted with ``truncate=[journal]`` supersedes the records still
+    pending for that journal (the snapshot already contains them), and the
+    journal is cleared once the snapshot is on disk.
+
+    Any error raised by a payload (a serializer, a file write) or by a
+    callback is reported and counted as a failed save; it never stops the
+    thread, so later saves are still written.
+
+    Usage::
+
+        worker = SaveWorker()
+        worker.submit({"saves/save.json": data}, on_complete=callback)
+        ...
+        worker.close()   # flush pending writes before exit
+    """
+
+    def __init__(self, file_handler=None):
+        """Create an idle worker. The thread starts on the first submit().
+
+        Args:
+            file_handler: FileHandler used for the atomic writes.
+        """
+        self.file_handler = file_handler or FileHandler()
+        self._cond = threading.Condition()
+        self._pending_writes = {}
+        self._pending_truncates = set()
+        self._pending_appends = {}
+        self._pending_callbacks = []
+        self._busy = False
+        self._closed = False
+        self._thread = None
+
+    def submit(self, writes, on_complete=None, truncate=()):
+        """Queue a snapshot for writing.
+
+        Args:
+            writes: Dict {path: data}. The data must not be mutated by the
+                caller afterwards (pass copies, not live game objects).
+                Data is written as JSON, except bytes (written as-is) and
+                callables (called on the worker thread to produce the data).
+            on_complete: Optional callable(success) invoked from the worker
+                thread once the snapshot (or a newer one) has been written.
+            truncate: Journal paths made obsolete by this snapshot. Their
+                pending records are dropped and the files are deleted
+                after the snapshot is written.
+        """
+        with self._cond:
+            self._check_open()
+            for path, data in writes.items():
+                # Re-queue at the end: files go out in submission order
+                self._pending_writes.pop(path, None)
+                self._pending_writes[path] = data
+            for path in truncate:
+                self._pending_appends.pop(path, None)
+                self._pending_truncates.add(path)
+            self._queue_callback(on_complete)
+
+    def submit_append(self, path, records, on_complete=None):
+        """Queue records to append to a JSON-lines journal.
+
+        Args:
+            path: Journal path.
+            records: List of JSON-serializable records (not mutated later).
+            on_complete: Optional callable(success) invoked once written.
+        """
+        with self._cond:
+            self._check_open()
+            if records:
+                self._pending_appends.setdefault(path, []).extend(records)
+            self._queue_callback(on_complete)
+
+    def _check_open(self):
+        """Raise if close() was called. Caller holds the lock."""
+        if self._closed:
+            raise RuntimeError("SaveWorker is closed")
+
+    def _queue_callback(self, on_complete):
+        """Register a callback and wake (or start) the thread. Caller holds the lock.
+
+        Args:
+            on_complete: Optional callable(success).
+        """
+        if on_complete is not None:
+            self._pending_callbacks.append(on_complete)
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="save-worker", daemon=True
+            )
+            self._thread.start()
+        self._cond.notify()
+
+    def flush(self, timeout=None):
+        """Block until every submitted snapshot has been written.
+
+        Args:
+            timeout: Maximum seconds to wait (None = wait forever).
+
+        Returns:
+            bool: True if the queue is empty, False on timeout.
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._has_pending() and not self._busy, timeout
+            )
+
+    def close(self, timeout=None):
+        """Flush pending writes and stop the worker thread.
+
+        Args:
+            timeout: Maximum seconds to wait for the flush.
+
+        Returns:
+            bool: True if every pending write was handled, False on timeout.
+        """
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return flushed
+
+    def _has_pending(self):
+        """Return True if any work is queued. Caller holds the lock."""
+        return bool(
+            self._pending_writes or self._pending_truncates
+            or self._pending_appends or self._pending_callbacks
+        )
+
+    def _run(self):
+        """Worker loop: take the pending batch, write it, fire callbacks.
+
+        Within one batch, snapshots are written first, then obsolete
+        journals are cleared, then new journal records are appended.
+        """
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._has_pending() or self._closed)
+                if not self._has_pending():
+                    return
+                writes = self._pending_writes
+                truncates = self._pending_truncates
+                appends = self._pending_appends
+                callbacks = self._pending_callbacks
+                self._pending_writes = {}
+                self._pending_truncates = set()
+                self._pending_appends = {}
+                self._pending_callbacks = []
+                self._busy = True
+
+            try:
+                success = True
+                for path, data in writes.items():
+                    try:
+                        if callable(data):
+                            data = data()
+                        if isinstance(data, bytes):
+                            self.file_handler.write_atomic(path, data)
+                        else:
+                            self.file_handler.save_json(path, data)
+                    except Exception as e:
+                        # Any payload error (OverflowError, KeyError...) is a
+                        # failed save, not the end of the worker thread
+                        print(f"[WARN] Save failed for {path}: {e!r}")
+                        success = False
+                        # Later files may describe this one (slot index)
+                        break
+                for path in truncates:
+                    # Keep the journal if its snapshot failed: replay still needs it
+                    if not success:
+                        break
+                    try:
+                        self.file_handler.remove_file(path)
+                    except OSError as e:
+                        print(f"[WARN] Could not clear journal {path}: {e}")
+                for path, records in appends.items():
+                    try:
+                        self.file_handler.append_jsonl(path, records)
+                    except Exception as e:
+                        print(f"[WARN] Journal append failed for {path}: {e!r}")
+                        success = False
+                for callback in callbacks:
+                    try:
+                        callback(success)
+                    except Exception as e:
+                        print(f"[WARN] Save callback failed: {e!r}")
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
@@ -0,0 +1,254 @@
+"""Shared roster module -- roster stats as flat arrays in shared memory."""
+
+from array import array
+from multiprocessing import shared_memory
+
+from models.move_registry import MoveRegistry
+from models.pokemon import Pokemon
+from models.type_chart import TypeChart
+
+
+class SharedRoster:
+    """Roster stats and the type chart in one multiprocessing shared memory block.
+
+    The owner exports Pokemon once with create(); worker processes attach by
+    name and read the arrays in place (memoryview casts over the block, no
+    copy and no unpickling), so attaching costs the same whatever the
+    roster size. Layout, all 4-byte values:
+
+        header   int32[8]: magic, version, count, type count, moves per
+                 record, record length, string count, string bytes
+        chart    float32[types * types]: multiplier of attack type a
+                 against defend type d at a * types + d
+        records  int32[count * record length], per Pokemon:
+                 level, max HP, attack, defense, type 1, type 2 (-1 if
+                 none), name string number, move count, then (type,
+                 power, accuracy) per move
+        strings  int32[strings + 1] offsets, then UTF-8 bytes: type
+                 names, then each Pokemon's name followed by its move names
+
+    Types are stored as IDs (index in the type names, TypeChart.TYPES
+    first). Workers should be started by multiprocessing (they then share
+    the owner's resource tracker); the owner calls unlink() when done.
+
+    Example:
+        shared = SharedRoster.create(game.get_all_pokemon(), game.type_chart)
+        ...                                  # pass shared.name to workers
+        roster = SharedRoster.attach(name)   # in a worker
+        level, hp, attack, defense, types, moves = roster.stats(3)
+        pokemon = roster.make_pokemon(3)
+        roster.close()
+        ...
+        shared.close()
+        shared.unlink()
+    """
+
+    MAGIC = 0x504B5244
+    VERSION = 1
+    HEADER_FIELDS = 8
+    # Fixed fields of a record, before the moves
+    RECORD_FIELDS = 8
+
+    def __init__(self, shm):
+        """Wrap a shared memory block (use create() or attach()).
+
+        Args:
+            shm: multiprocessing.shared_memory.SharedMemory.
+        """
+        self._shm = shm
+        buf = shm.buf
+        header = buf[:4 * self.HEADER_FIELDS].cast("i")
+        if header[0] != self.MAGIC or header[1] != self.VERSION:
+            header.release()
+            raise ValueError(f"{shm.name} is not a shared roster")
+        (_, _, self.count, self.type_count, self.max_moves,
+         self.record_length, string_count, string_bytes) = header
+        header.release()
+        self.name = shm.name
+
+        offset = 4 * self.HEADER_FIELDS
+        size = self.type_count * self.type_count
+        self._chart = buf[offset:offset + 4 * size].cast("f")
+        offset += 4 * size
+        size = self.count * self.record_length
+        self._records = buf[offset:offset + 4 * size].cast("i")
+        offset += 4 * size
+        self._string_offsets = buf[offset:offset + 4 * (string_count + 1)].cast("i")
+        offset += 4 * (string_count + 1)
+        self._strings = buf[offset:offset + string_bytes]
+        self.type_names = [self._string(t) for t in range(self.type_count)]
+
+    @classmethod
+    def create(cls, pokemon_list, type_chart):
+        """Export Pokemon and the type chart to a new shared memory block.
+
+        Args:
+            pokemon_list: List of Pokemon.
+            type_chart: Loaded TypeChart.
+
+        Returns:
+            SharedRoster: The owner's view (call unlink() when done).
+        """
+        type_names = list(TypeChart.TYPES)
+        type_ids = {name: i for i, name in enumerate(type_names)}
+
+        def type_id(name):
+            name = name.lower()
+            if name not in type_ids:
+                type_ids[name] = len(type_names)
+                type_names.append(name)
+            return type_ids[name]
+
+        for attack_type, row in type_chart.chart.items():
+            type_id(attack_type)
+            for defend_type in row:
+                type_id(defend_type)
+        max_moves = max([len(p.moves) for p in pokemon_list] or [0])
+        record_length = cls.RECORD_FIELDS + 3 * max_moves
+
+        records = []
+        strings = []
+        for p in pokemon_list:
+            types = [type_id(t) for t in p.types[:2]] + [-1, -1]
+            record = [p.level, p.max_hp, p.attack, p.defense,
+                      types[0], types[1], len(strings), len(p.moves)]
+            strings.append(p.name)
+            for m in p.moves:
+                record += [type_id(m.move_type), m.power, m.accuracy]
+                strings.append(m.name)
+            record += [0] * (record_length - len(record))
+            records.extend(record)
+        # Type names come first: shift the name string numbers
+        for base in range(0, len(records), record_length):
+            records[base + 6] += len(type_names)
+        strings = type_names + strings
+
+        encoded = [s.encode("utf-8") for s in strings]
+        string_offsets = [0]
+        for data in encoded:
+            string_offsets.append(string_offsets[-1] + len(data))
+        blob = b"".join(encoded)
+
+        type_count = len(type_names)
+        chart = [1.0] * (type_count * type_count)
+        for attack_type, row in type_chart.chart.items():
+            for defend_type, multiplier in row.items():
+                chart[type_id(attack_type) * type_count + type_id(defend_type)] = multiplier
+
+        header = [cls.MAGIC, cls.VERSION, len(pokemon_list), type_count, max_moves,
+                  record_length, len(strings), len(blob)]
+        size = 4 * (len(header) + len(chart) + len(records) + len(string_offsets)) + len(blob)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, size))
+        offset = 0
+        for code, values in (("i", header), ("f", chart), ("i", records),
+                             ("i", string_offsets)):
+            view = shm.buf[offset:offset + 4 * len(values)].cast(code)
+            view[:] = array(code, values)
+            view.release()
+            offset += 4 * len(values)
+        shm.buf[offset:offset + len(blob)] = blob
+        return cls(shm)
+
+    @classmethod
+    def attach(cls, name):
+        """Attach to a block created by create() (in a worker process).
+
+        Args:
+            name: The owner's SharedRoster.name.
+
+        Returns:
+            SharedRoster: A read-only view of the block.
+        """
+        return cls(shared_memory.SharedMemory(name=name))
+
+    def _string(self, index):
+        """Decode string number `index` of the string table."""
+        start = self._string_offsets[index]
+        end = self._string_offsets[index + 1]
+        return bytes(self._strings[start:end]).decode("utf-8")
+
+    def stats(self, i):
+        """Return the battle stats of Pokemon i, read in place.
+
+        Args:
+            i: Roster index.
+
+        Returns:
+            tuple: (level, max_hp, attack, defense, type IDs tuple, moves
+                tuple of (type ID, power, accuracy)).
+        """
+        base = i * self.record_length
+        r = self._records
+        types = tuple(t for t in (r[base + 4], r[base + 5]) if t >= 0)
+        moves = []
+        for k in range(r[base + 7]):
+            at = base + self.RECORD_FIELDS + 3 * k
+            moves.append((r[at], r[at + 1], r[at + 2]))
+        return r[base], r[base + 1], r[base + 2], r[base + 3], types, tuple(moves)
+
+    def multiplier(self, move_type, defend_types):
+        """Return the combined multiplier of a move type against type IDs.
+
+        Args:
+            move_type: Attacking type ID.
+            defend_types: Defending type IDs.
+
+        Returns:
+            float: Combined multiplier.
+        """
+        result = 1.0
+        row = move_type * self.type_count
+        for defend_type in defend_types:
+            result *= self._chart[row + defend_type]
+        return result
+
+    def pokemon_name(self, i):
+        """Return the name of Pokemon i."""
+        return self._string(self._records[i * self.record_length + 6])
+
+    def make_pokemon(self, i):
+        """Build a Pokemon object from record i (full HP).
+
+        Args:
+            i: Roster index.
+
+        Returns:
+            Pokemon: A new Pokemon with the stored stats and moves.
+        """
+        level, hp, attack, defense, types, moves = self.stats(i)
+        index = self._records[i * self.record_length + 6]
+        pokemon = Pokemon(
+            self._string(index), hp, level, attack, defense,
+            [self.type_names[t] for t in types],
+        )
+        pokemon.moves = [
+            MoveRegistry.get(self._string(index + 1 + k), self.type_names[move_type],
+                             power, accuracy)
+            for k, (move_type, power, accuracy) in enumerate(moves)
+        ]
+        return pokemon
+
+    def type_chart(self):
+        """Return a TypeChart rebuilt from the shared chart.
+
+        Returns:
+            TypeChart: Chart with the same multipliers (types x types).
+        """
+        chart = TypeChart()
+        n = self.type_count
+        for a, attack_type in enumerate(self.type_names):
+            chart.chart[attack_type] = {
+                defend_type: self._chart[a * n + d]
+                for d, defend_type in enumerate(self.type_names)
+            }
+        return chart
+
+    def close(self):
+        """Release the views and detach from the block."""
+        for view in (self._chart, self._records, self._string_offsets, self._strings):
+            view.release()
+        self._shm.close()
+
+    def unlink(self):
+        """Destroy the block (owner only, after every worker closed it)."""
+        self._shm.unlink()
@@ -0,0 +1,337 @@
+"""Species database module -- fixed-record binary species file read through mmap."""
+
+import collections
+import mmap
+import struct
+import sys
+from array import array
+
+from models.pokemon import Pokemon
+from utils.file_handler import FileHandler
+
+
+class SpeciesDatabase:
+    """Species table stored as fixed-size records and memory-mapped.
+
+    data/pokemon.json is parsed into one dict per species up front; for
+    rosters of hundreds of thousands of custom species that dominates
+    memory and startup. This file holds the same data as fixed-size int32
+    records: opening it maps the file (the OS pages in what is read), and
+    a species is decoded only when asked for, by ID (its position) in O(1)
+    or by name in O(log n) through a name-sorted ID table. Layout, all
+    little-endian int32:
+
+        header   magic, version, count, moves per record, record length,
+                 string count, string bytes, reserved
+        records  count * record length, per species: name, hp, level,
+                 attack, defense, xp, xp_to_next_level, evolution level
+                 (INT_NONE if none), evolution target, sprite path, type 1,
+                 type 2, locked, move count, then (name, type, power,
+                 accuracy) per move
+        names    species IDs sorted by lowercase name
+        strings  offsets[string count + 1], then UTF-8 bytes
+
+    Strings are stored once and referenced by number (-1 for none).
+
+    Build the file with write() (python3 -m tools.build_species_db); the
+    Game then uses it instead of the JSON source (see
+    SpeciesRegistry.load_from_file).
+
+    Example:
+        SpeciesDatabase.write("data/pokemon.bin", species_list)
+        database = SpeciesDatabase.open("data/pokemon.bin")
+        database.record(0)["name"]       # "Bulbasaur"
+        database.find("pikachu")         # 24
+        database.close()
+    """
+
+    MAGIC = 0x504B5350
+    VERSION = 1
+    HEADER = struct.Struct("<8i")
+    # Fixed fields of a record, before the moves
+    RECORD_FIELDS = 14
+    INT_NONE = -(2 ** 31)
+    # Light view of a species for roster indexes and matchup tables (no
+    # dict, no Move objects); moves are (move_type, power, accuracy)
+    # tuples, or None unless asked for
+    Summary = collections.namedtuple(
+        "Summary", "name level max_hp attack defense types locked moves"
+    )
+
+    def __init__(self, file, buffer):
+        """Wrap a mapped database file (use open()).
+
+        Args:
+            file: The open file object.
+            buffer: mmap.mmap of the whole file.
+        """
+        self._file = file
+        self._buffer = buffer
+        if len(buffer) < self.HEADER.size:
+            raise ValueError("Species database too short")
+        (magic, version, self.count, self.max_moves, self.record_length,
+         string_count, string_bytes, _reserved) = self.HEADER.unpack_from(buffer)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError("Not a species database (or unsupported version)")
+        self._record = struct.Struct(f"<{self.record_length}i")
+        self._int = struct.Struct("<i")
+        self._records_offset = self.HEADER.size
+        self._names_offset = self._records_offset + self._record.size * self.count
+        self._offsets_offset = self._names_offset + 4 * self.count
+        self._strings_offset = self._offsets_offset + 4 * (string_count + 1)
+        if len(buffer) < self._strings_offset + string_bytes:
+            raise ValueError("Species database truncated")
+
+    @classmethod
+    def open(cls, path):
+        """Map a database file.
+
+        Args:
+            path: File written by write().
+
+        Returns:
+            SpeciesDatabase: The open database (close() it when done).
+
+        Raises:
+            ValueError: If the file is not a valid species database.
+        """
+        file = open(path, "rb")
+        try:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            file.close()
+            raise ValueError(f"Empty species database: {path}")
+        try:
+            return cls(file, buffer)
+        except ValueError:
+            buffer.close()
+            file.close()
+            raise
+
+    @classmethod
+    def write(cls, path, species):
+        """Write a species list (data/pokemon.json format) as a database.
+
+        Args:
+            path: Output file (written atomically).
+            species: List of species dicts.
+
+        Raises:
+            ValueError: If a numeric field is not an integer.
+        """
+        strings = []
+        string_ids = {}
+
+        def sid(text):
+            if text is None:
+                return -1
+            if text not in string_ids:
+                string_ids[text] = len(strings)
+                strings.append(text)
+            return string_ids[text]
+
+        def number(value):
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise ValueError(f"Expected an integer, got {value!r}")
+            return value
+
+        max_moves = max([len(s.get("moves", [])) for s in species] or [0])
+        record_length = cls.RECORD_FIELDS + 4 * max_moves
+        records = array("i")
+        for s in species:
+            name = s.get("name", "Unknown")
+            types = list(s.get("types", ["normal"]))[:2]
+            moves = s.get("moves", [])
+            evolution_level = s.get("evolution_level")
+            level = s.get("level", 5)
+            record = [
+                sid(name), number(s.get("hp", 20)), number(level),
+                number(s.get("attack", 10)), number(s.get("defense", 10)),
+                number(s.get("xp", 0)),
+                number(s.get("xp_to_next_level", Pokemon.xp_needed(level))),
+                cls.INT_NONE if evolution_level is None else number(evolution_level),
+                sid(s.get("evolution_target")), sid(s.get("sprite_path", "")),
+                sid(types[0]) if types else -1,
+                sid(types[1]) if len(types) > 1 else -1,
+                1 if s.get("locked", False) else 0, len(moves),
+            ]
+            for m in moves:
+                record.extend([
+                    sid(m["name"]), sid(m["move_type"]),
+                    number(m["power"]), number(m["accuracy"]),
+                ])
+            record.extend([0] * (record_length - len(record)))
+            records.extend(record)
+
+        order = sorted(range(len(species)),
+                       key=lambda i: (species[i].get("name", "Unknown").lower(), i))
+        names = array("i", order)
+        blobs = [text.encode("utf-8") for text in strings]
+        offsets = array("i", [0])
+        for blob in blobs:
+            offsets.append(offsets[-1] + len(blob))
+
+        header = cls.HEADER.pack(
+            cls.MAGIC, cls.VERSION, len(species), max_moves, record_length,
+            len(strings), offsets[-1], 0,
+        )
+        FileHandler().write_atomic(path, header + b"".join(
+            cls._little_endian(values) for values in (records, names, offsets)
+        ) + b"".join(blobs))
+
+    @staticmethod
+    def _little_endian(values):
+        """Serialize an int32 array as little-endian bytes."""
+        if sys.byteorder == "big":
+            values = array("i", values)
+            values.byteswap()
+        return values.tobytes()
+
+    def close(self):
+        """Unmap the file."""
+        self._buffer.close()
+        self._file.close()
+
+    def __len__(self):
+        """Return the number of species."""
+        return self.count
+
+    def _fields(self, species_id):
+        """Return the int32 fields of a record."""
+        if not 0 <= species_id < self.count:
+            raise IndexError(f"Species ID {species_id} out of range")
+        return self._record.unpack_from(
+            self._buffer, self._records_offset + self._record.size * species_id
+        )
+
+    def _string(self, number):
+        """Decode string `number` of the string table (None for -1)."""
+        if number < 0:
+            return None
+        start, end = struct.unpack_from("<2i", self._buffer, self._offsets_offset + 4 * number)
+        base = self._strings_offset
+        return self._buffer[base + start:base + end].decode("utf-8")
+
+    def name(self, species_id):
+        """Return the name of a species without decoding the rest.
+
+        Args:
+            species_id: Position of the species.
+        """
+        return self._string(self._int.unpack_from(
+            self._buffer, self._records_offset + self._record.size * species_id
+        )[0])
+
+    def record(self, species_id):
+        """Decode a species.
+
+        Args:
+            species_id: Position of the species (0 <= ID < len()).
+
+        Returns:
+            dict: Fresh species dict (data/pokemon.json format).
+
+        Raises:
+            IndexError: If the ID is out of range.
+        """
+        fields = self._fields(species_id)
+        (name, hp, level, attack, defense, xp, xp_next, evolution_level,
+         evolution_target, sprite, type1, type2, locked, move_count) = fields[:self.RECORD_FIELDS]
+        types = [self._string(t) for t in (type1, type2) if t >= 0]
+        moves = []
+        for k in range(move_count):
+            base = self.RECORD_FIELDS + 4 * k
+            moves.append({
+                "name": self._string(fields[base]),
+                "move_type": self._string(fields[base + 1]),
+                "power": fields[base + 2],
+                "accuracy": fields[base + 3],
+            })
+        return {
+            "name": self._string(name),
+            "hp": hp,
+            "level": level,
+            "attack": attack,
+            "defense": defense,
+            "types": types,
+            "sprite_path": self._string(sprite),
+            "xp": xp,
+            "xp_to_next_level": xp_next,
+            "evolution_level": None if evolution_level == self.INT_NONE else evolution_level,
+            "evolution_target": self._string(evolution_target),
+            "moves": moves,
+            "locked": bool(locked),
+        }
+
+    def summary(self, species_id, moves=False):
+        """Decode the fields roster indexes need (see Summary).
+
+        Args:
+            species_id: Position of the species.
+            moves: Also decode the moves' type, power and accuracy (their
+                names are skipped).
+
+        Returns:
+            SpeciesDatabase.Summary: Name, level, stats, types, locked and
+                optionally moves.
+        """
+        fields = self._fields(species_id)
+        move_stats = None
+        if moves:
+            move_stats = []
+            for k in range(fields[13]):
+                base = self.RECORD_FIELDS + 4 * k
+                move_stats.append(
+                    (self._string(fields[base + 1]), fields[base + 2], fields[base + 3])
+                )
+        return self.Summary(
+            self._string(fields[0]), fields[2], fields[1], fields[3], fields[4],
+            [self._string(t) for t in fields[10:12] if t >= 0], bool(fields[12]),
+            move_stats,
+        )
+
+    def evolutions(self):
+        """Yield (name, evolution level, target name) of evolving species."""
+        for species_id in range(self.count):
+            fields = self._fields(species_id)
+            if fields[8] >= 0 and fields[7] != self.INT_NONE:
+                yield self._string(fields[0]), fields[7], self._string(fields[8])
+
+    def find(self, name):
+        """Return the ID of a species by name (case-insensitive).
+
+        Binary search over the name-sorted ID table: only about log2(n)
+        names are decoded.
+
+        Args:
+            name: Species name.
+
+        Returns:
+            int or None: The lowest ID with that name, None if unknown.
+        """
+        wanted = name.lower()
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            species_id = self._int.unpack_from(self._buffer, self._names_offset + 4 * middle)[0]
+            if self.name(species_id).lower() < wanted:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.count:
+            species_id = self._int.unpack_from(self._buffer, self._names_offset + 4 * low)[0]
+            if self.name(species_id).lower() == wanted:
+                return species_id
+        return None
+
+    def get(self, name):
+        """Return a species by name (case-insensitive).
+
+        Args:
+            name: Species name.
+
+        Returns:
+            dict or None: Fresh species dict, None if unknown.
+        """
+        species_id = self.find(name)
+        return None if species_id is None else self.record(species_id)